@@ -1 +1,52 @@
-"""Alembic environment placeholder."""
+"""Alembic environment: migrates the database at ``DATABASE_URL``."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from project_name.core.config import get_settings
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+
+def sqlalchemy_url() -> str:
+    """The application's ``DATABASE_URL`` with the async driver SQLAlchemy needs."""
+    url = get_settings().database_url
+    if not url:
+        msg = "DATABASE_URL is not set; the in-memory database needs no migrations"
+        raise SystemExit(msg)
+    scheme, _, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    if backend == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if backend in {"postgresql", "postgres"}:
+        return f"postgresql+asyncpg://{rest}"
+    msg = f"Unsupported database URL: {scheme}://"
+    raise SystemExit(msg)
+
+
+def run_migrations(connection: Connection) -> None:
+    context.configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    engine = create_async_engine(sqlalchemy_url())
+    async with engine.connect() as connection:
+        await connection.run_sync(run_migrations)
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    context.configure(url=sqlalchemy_url(), literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+else:
+    asyncio.run(run_migrations_online())
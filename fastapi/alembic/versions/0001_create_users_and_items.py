@@ -0,0 +1,54 @@
+"""Create the users and items tables.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+ID_COLUMNS = {
+    "sqlite": "INTEGER PRIMARY KEY AUTOINCREMENT",
+    "postgresql": "BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY",
+}
+
+
+def upgrade() -> None:
+    id_column = ID_COLUMNS[op.get_bind().dialect.name]
+    # IF NOT EXISTS adopts databases whose tables the app created at startup
+    # before it shipped migrations.
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS users (
+            id {id_column},
+            email VARCHAR(320) NOT NULL UNIQUE,
+            name VARCHAR(100) NOT NULL,
+            is_active BOOLEAN NOT NULL DEFAULT TRUE,
+            hashed_password VARCHAR(255),
+            created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS items (
+            id {id_column},
+            name VARCHAR(100) NOT NULL,
+            description TEXT
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE items")
+    op.execute("DROP TABLE users")
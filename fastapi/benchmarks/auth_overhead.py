@@ -0,0 +1,102 @@
+"""Measure bearer-token verification cost with the token cache on and off.
+
+Times ``TokenService.verify`` on its own, then ``GET /api/v1/users/me`` driven
+straight through the ASGI app with ``TOKEN_CACHE_SIZE`` at 0 and at its
+default::
+
+    uv run python benchmarks/auth_overhead.py --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from starlette.types import Message
+
+
+async def call(app: FastAPI, path: str, token: str) -> int:
+    status = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"host", b"bench"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(*, cache_size: int, requests: int) -> tuple[float, float]:
+    settings = Settings(
+        token_cache_size=cache_size,
+        password_hash_iterations=1_000,
+        response_cache_enabled=False,
+        metrics_enabled=False,
+    )
+    app = create_app(settings)
+    async with app.router.lifespan_context(app):
+        user = await app.state.container.users.repository.create(
+            email="bench@example.com", name="Bench", is_active=True
+        )
+        tokens = app.state.tokens
+        token = tokens.issue(str(user["id"]), email=user["email"])
+
+        start = time.perf_counter()
+        for _ in range(requests):
+            tokens.verify(token)
+        verify = (time.perf_counter() - start) / requests * 1e6
+
+        assert await call(app, "/api/v1/users/me", token) == HTTPStatus.OK
+        start = time.perf_counter()
+        for _ in range(requests):
+            await call(app, "/api/v1/users/me", token)
+        request = (time.perf_counter() - start) / requests * 1e6
+    return verify, request
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'token cache':<12} {'verify µs':>10} {'/users/me µs':>13}")
+    for cache_size in (0, Settings().token_cache_size):
+        verify, request = asyncio.run(
+            measure(cache_size=cache_size, requests=args.requests)
+        )
+        label = "off" if cache_size == 0 else f"{cache_size} entries"
+        print(f"{label:<12} {verify:>10.1f} {request:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
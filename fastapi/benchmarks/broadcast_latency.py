@@ -0,0 +1,125 @@
+"""Measure change-feed broadcast latency and idle subscriber cost.
+
+Opens N change-feed streams on one ``ChangeHub``, each read by its own task as
+the SSE endpoint would, publishes events one at a time and records the delay
+from ``publish`` to each subscriber receiving the frame. Then measures the
+memory held by N idle streams::
+
+    uv run python benchmarks/broadcast_latency.py --subscribers 100 1000 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import collections
+import gc
+import statistics
+import time
+import tracemalloc
+from contextlib import aclosing
+from dataclasses import dataclass, field
+
+from project_name.core.changefeed import ChangeHub
+
+
+PAYLOAD = b'{"id":1,"name":"Widget","description":null}'
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return statistics.quantiles(values, n=100)[round(fraction * 100) - 1]
+
+
+@dataclass
+class Probe:
+    subscribers: int
+    sent: dict[int, float] = field(default_factory=dict)
+    received: collections.Counter[int] = field(default_factory=collections.Counter)
+    latencies: list[float] = field(default_factory=list)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def record(self, frame: bytes) -> None:
+        event_id = int(frame[4 : frame.index(b"\n")])
+        self.latencies.append(time.perf_counter() - self.sent[event_id])
+        self.received[event_id] += 1
+        if self.received[event_id] == self.subscribers:
+            self.done.set()
+
+
+async def consume(hub: ChangeHub, probe: Probe) -> None:
+    async with aclosing(hub.stream(hub.subscribe("items"))) as stream:
+        async for frame in stream:
+            if frame.startswith(b"id: "):
+                probe.record(frame)
+
+
+async def measure_latency(
+    subscribers: int, events: int
+) -> tuple[list[float], list[float]]:
+    hub = ChangeHub(max_subscribers=subscribers, heartbeat=3600)
+    probe = Probe(subscribers)
+    publish_times: list[float] = []
+    readers = [asyncio.create_task(consume(hub, probe)) for _ in range(subscribers)]
+    while hub.subscribers < subscribers:
+        await asyncio.sleep(0)
+    for event_id in range(1, events + 1):
+        probe.done.clear()
+        probe.sent[event_id] = start = time.perf_counter()
+        hub.publish("items", "updated", 1, PAYLOAD)
+        publish_times.append(time.perf_counter() - start)
+        await probe.done.wait()
+    hub.close()
+    await asyncio.gather(*readers)
+    return probe.latencies, publish_times
+
+
+async def measure_idle_memory(subscribers: int) -> float:
+    hub = ChangeHub(max_subscribers=subscribers, heartbeat=3600)
+
+    async def idle() -> None:
+        async with aclosing(hub.stream(hub.subscribe("items"))) as stream:
+            async for _ in stream:
+                pass
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    readers = [asyncio.create_task(idle()) for _ in range(subscribers)]
+    while hub.subscribers < subscribers:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    hub.close()
+    await asyncio.gather(*readers)
+    return held / subscribers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--events", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'subscribers':>11} {'publish µs':>11} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'idle KiB':>9}"
+    )
+    for subscribers in args.subscribers:
+        latencies, publish_times = asyncio.run(
+            measure_latency(subscribers, args.events)
+        )
+        per_subscriber = asyncio.run(measure_idle_memory(subscribers))
+        print(
+            f"{subscribers:>11} "
+            f"{statistics.median(publish_times) * 1e6:>11.1f} "
+            f"{percentile(latencies, 0.50) * 1e3:>8.2f} "
+            f"{percentile(latencies, 0.95) * 1e3:>8.2f} "
+            f"{percentile(latencies, 0.99) * 1e3:>8.2f} "
+            f"{max(latencies) * 1e3:>8.2f} "
+            f"{per_subscriber / 1024:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
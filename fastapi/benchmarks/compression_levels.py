@@ -0,0 +1,84 @@
+"""Compare bytes saved against CPU spent per compression level.
+
+Renders a ``GET /api/v1/users/`` page as the API would, then times gzip and
+(when the ``compression`` extra is installed) brotli at several levels::
+
+    uv run python benchmarks/compression_levels.py --rows 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import time
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING
+
+from fastapi.responses import JSONResponse
+
+from project_name.core.compression import load_brotli
+from project_name.schemas.user import UserRead
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 6, 11)
+
+
+def render_page(rows: int) -> bytes:
+    now = datetime.now(UTC)
+    users = [
+        UserRead(
+            id=index,
+            email=f"user{index}@example.com",
+            name=f"User {index}",
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        ).model_dump(mode="json")
+        for index in range(rows)
+    ]
+    return bytes(JSONResponse(users).body)
+
+
+def measure(
+    compress: Callable[[bytes], bytes], body: bytes, repeat: int
+) -> tuple[int, float]:
+    compressed = compress(body)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        compress(body)
+    return len(compressed), (time.perf_counter() - start) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = render_page(args.rows)
+    print(f"payload: {len(body)} bytes ({args.rows} users)")
+    print(f"{'encoding':<12} {'bytes':>9} {'saved':>7} {'ms':>8} {'MB/s':>8}")
+    codecs: list[tuple[str, Callable[[bytes], bytes]]] = [
+        (f"gzip-{level}", partial(gzip.compress, compresslevel=level, mtime=0))
+        for level in GZIP_LEVELS
+    ]
+    brotli = load_brotli()
+    if brotli is not None:
+        codecs += [
+            (f"br-{quality}", partial(brotli.compress, quality=quality))
+            for quality in BROTLI_QUALITIES
+        ]
+    for name, compress in codecs:
+        size, millis = measure(compress, body, args.repeat)
+        saved = 1 - size / len(body)
+        throughput = len(body) / millis / 1e3
+        print(f"{name:<12} {size:>9} {saved:>7.1%} {millis:>8.2f} {throughput:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Measure per-request service dependency overhead.
+
+Compares building the service graph on every request (the old
+``get_user_service``) with resolving it from the lifespan-managed
+``ServiceContainer``::
+
+    uv run python benchmarks/dependency_overhead.py --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import timeit
+from functools import partial
+from typing import TYPE_CHECKING, Annotated
+
+import httpx
+from fastapi import Depends, FastAPI, Request
+
+from project_name.container import ServiceContainer
+from project_name.core.cache import LRUCacheBackend, ResponseCache
+from project_name.core.database import Database, create_pool
+from project_name.repositories.user_repository import UserRepository
+from project_name.routers.users import get_user_service
+from project_name.services.user_service import UserService
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def build_user_service(request: Request) -> UserService:
+    """The previous dependency: a fresh service graph per request."""
+    container: ServiceContainer = request.app.state.container
+    return UserService(UserRepository(container.database), container.response_cache)
+
+
+def build_app(factory: Callable[[Request], UserService]) -> FastAPI:
+    app = FastAPI()
+    app.state.container = ServiceContainer(
+        Database(create_pool("sqlite:///:memory:")),
+        ResponseCache(LRUCacheBackend()),
+    )
+
+    @app.get("/")
+    async def endpoint(
+        service: Annotated[UserService, Depends(factory)],
+    ) -> dict[str, bool]:
+        return {"ok": service is not None}
+
+    return app
+
+
+async def time_requests(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        for _ in range(min(requests, 100)):
+            await client.get("/")
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/")
+        return (time.perf_counter() - start) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    variants = {"per-request": build_user_service, "container": get_user_service}
+    best: dict[str, tuple[float, float]] = {}
+    # Interleave the variants and keep the best round to damp warm-up noise.
+    for _ in range(args.rounds):
+        for name, factory in variants.items():
+            app = build_app(factory)
+            request = Request({"type": "http", "app": app})
+            per_call = (
+                timeit.timeit(partial(factory, request), number=args.calls) / args.calls
+            )
+            per_request = asyncio.run(time_requests(app, args.requests))
+            previous = best.get(name, (per_call, per_request))
+            best[name] = (min(previous[0], per_call), min(previous[1], per_request))
+
+    print(f"{'variant':<12} {'factory ns/call':>16} {'request us/req':>15}")
+    for name, (per_call, per_request) in best.items():
+        print(f"{name:<12} {per_call * 1e9:>16.1f} {per_request * 1e6:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
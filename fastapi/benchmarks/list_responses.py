@@ -0,0 +1,94 @@
+"""Compare the default and orjson list response paths.
+
+Seeds an in-memory database, then drives ``GET /api/v1/{users,items}/`` through
+the ASGI app with ``FAST_JSON_RESPONSES`` off and on::
+
+    uv run python benchmarks/list_responses.py --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
+ROWS = 1000
+PAGE_SIZES = (100, 1000)
+
+
+async def seed(app: FastAPI) -> None:
+    container = app.state.container
+    await container.users.repository.create_many(
+        [
+            (f"user{index}@example.com", f"User {index}", True, None)
+            for index in range(ROWS)
+        ]
+    )
+    await container.items.repository.create_many(
+        [(f"Item {index}", f"Description {index}") for index in range(ROWS)]
+    )
+
+
+async def measure(
+    client: httpx.AsyncClient, path: str, limit: int, requests: int
+) -> tuple[float, float, float]:
+    for _ in range(min(requests, 20)):
+        await client.get(path, params={"limit": limit})
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        response = await client.get(path, params={"limit": limit})
+        latencies.append(time.perf_counter() - request_start)
+        response.raise_for_status()
+    elapsed = time.perf_counter() - start
+    quantiles = statistics.quantiles(latencies, n=100)
+    return requests / elapsed, quantiles[49] * 1e3, quantiles[98] * 1e3
+
+
+async def run_variant(*, fast: bool, requests: int) -> None:
+    app = create_app(Settings(fast_json_responses=fast, response_cache_enabled=False))
+    async with app.router.lifespan_context(app):
+        await seed(app)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            for resource in ("users", "items"):
+                for limit in PAGE_SIZES:
+                    rps, p50, p99 = await measure(
+                        client, f"/api/v1/{resource}/", limit, requests
+                    )
+                    variant = "orjson" if fast else "default"
+                    print(
+                        f"{variant:<8} {resource:<6} {limit:>5} "
+                        f"{rps:>9.1f} {p50:>8.2f} {p99:>8.2f}"
+                    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'variant':<8} {'path':<6} {'rows':>5} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}"
+    )
+    for fast in (False, True):
+        asyncio.run(run_variant(fast=fast, requests=args.requests))
+
+
+if __name__ == "__main__":
+    main()
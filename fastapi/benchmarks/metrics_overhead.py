@@ -0,0 +1,88 @@
+"""Measure the per-request cost of the metrics middleware.
+
+Drives ``GET /health`` and ``GET /api/v1/users/{user_id}`` straight through the
+ASGI app, with ``METRICS_ENABLED`` off and on, and reports the best of several
+alternating rounds::
+
+    uv run python benchmarks/metrics_overhead.py --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from starlette.types import Message
+
+
+async def call(app: FastAPI, path: str) -> None:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+
+
+async def measure(*, enabled: bool, requests: int) -> dict[str, float]:
+    app = create_app(Settings(metrics_enabled=enabled, response_cache_enabled=False))
+    results = {}
+    async with app.router.lifespan_context(app):
+        user = await app.state.container.users.repository.create(
+            email="bench@example.com", name="Bench", is_active=True
+        )
+        for path in ("/health", f"/api/v1/users/{user['id']}"):
+            for _ in range(min(requests, 200)):
+                await call(app, path)
+            start = time.perf_counter()
+            for _ in range(requests):
+                await call(app, path)
+            results[path] = (time.perf_counter() - start) / requests * 1e6
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    best: dict[bool, dict[str, float]] = {False: {}, True: {}}
+    for _ in range(args.rounds):
+        for enabled in (False, True):
+            timings = asyncio.run(measure(enabled=enabled, requests=args.requests))
+            for path, micros in timings.items():
+                best[enabled][path] = min(best[enabled].get(path, micros), micros)
+    baseline, with_metrics = best[False], best[True]
+    print(f"{'path':<24} {'off µs':>8} {'on µs':>8} {'overhead':>9}")
+    for path, off in baseline.items():
+        on = with_metrics[path]
+        label = "/api/v1/users/{user_id}" if path.startswith("/api") else path
+        print(f"{label:<24} {off:>8.1f} {on:>8.1f} {on - off:>8.1f}µ")
+
+
+if __name__ == "__main__":
+    main()
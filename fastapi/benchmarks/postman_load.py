@@ -0,0 +1,308 @@
+"""Replay the Postman collection as a weighted, concurrent load test.
+
+Every request in ``postman/collection.json`` becomes a scenario, picked at
+random by the weights in ``postman/load-profile.json`` (requests missing from
+the profile weigh 1; weight 0 excludes one, e.g. the ``DELETE``). Before the
+load starts each weighted request runs once, in collection order, so the
+records the collection refers to (``/users/1``) exist. Against a running
+server::
+
+    uv run python benchmarks/postman_load.py --users 50 --ramp-up 10 --duration 60
+
+Postman variables resolve from ``postman/environment.json``, the collection,
+``--var key=value`` and the ``{{$guid}}``, ``{{$timestamp}}``, ``{{$randomInt}}``
+and ``{{$randomEmail}}`` dynamic variables. A response counts as an error when
+it differs from the status the request's ``pm.response.to.have.status(...)``
+test expects, or is 4xx/5xx when the request has no such test.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import statistics
+import sys
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+
+POSTMAN_DIR = Path(__file__).resolve().parent.parent / "postman"
+VARIABLE = re.compile(r"\{\{\s*(\$?[\w.-]+)\s*\}\}")
+EXPECTED_STATUS = re.compile(r"to\.have\.status\((\d{3})\)")
+DYNAMIC_VARIABLES = {
+    "$guid": lambda: str(uuid.uuid4()),
+    "$timestamp": lambda: str(int(time.time())),
+    "$randomInt": lambda: str(random.randint(0, 1000)),
+    "$randomEmail": lambda: f"load-{uuid.uuid4().hex}@example.com",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PostmanRequest:
+    name: str
+    method: str
+    url: str
+    headers: dict[str, str]
+    body: str | None
+    expected_status: int | None
+
+
+def iter_requests(items: list[dict[str, Any]]) -> list[PostmanRequest]:
+    """Flatten the collection's folders into requests, in collection order."""
+    requests = []
+    for item in items:
+        if "item" in item:
+            requests += iter_requests(item["item"])
+            continue
+        request = item["request"]
+        url = (
+            request["url"] if isinstance(request["url"], str) else request["url"]["raw"]
+        )
+        body = request.get("body") or {}
+        script = "\n".join(
+            line
+            for event in item.get("event", [])
+            if event.get("listen") == "test"
+            for line in event["script"].get("exec", [])
+        )
+        expected = EXPECTED_STATUS.search(script)
+        requests.append(
+            PostmanRequest(
+                name=item["name"],
+                method=request["method"],
+                url=url,
+                headers={
+                    header["key"]: header["value"]
+                    for header in request.get("header", [])
+                    if not header.get("disabled")
+                },
+                body=body.get("raw") if body.get("mode") == "raw" else None,
+                expected_status=int(expected.group(1)) if expected else None,
+            )
+        )
+    return requests
+
+
+def load_variables(
+    collection: dict[str, Any], environment: dict[str, Any], overrides: list[str]
+) -> dict[str, str]:
+    variables = {
+        variable["key"]: str(variable["value"])
+        for variable in collection.get("variable", [])
+    }
+    variables |= {
+        value["key"]: str(value["value"])
+        for value in environment.get("values", [])
+        if value.get("enabled", True)
+    }
+    for override in overrides:
+        key, _, value = override.partition("=")
+        variables[key] = value
+    return variables
+
+
+def render(template: str, variables: dict[str, str]) -> str:
+    def substitute(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name in DYNAMIC_VARIABLES:
+            return DYNAMIC_VARIABLES[name]()
+        return variables.get(name, match.group(0))
+
+    return VARIABLE.sub(substitute, template)
+
+
+@dataclass(slots=True)
+class Stats:
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter[str] = field(default_factory=Counter)
+    errors: int = 0
+
+
+class LoadRunner:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        requests: list[PostmanRequest],
+        weights: list[float],
+        variables: dict[str, str],
+    ) -> None:
+        self.client = client
+        self.requests = requests
+        self.weights = weights
+        self.variables = variables
+        self.stats = {request.name: Stats() for request in requests}
+
+    async def send(self, request: PostmanRequest, *, record: bool = True) -> None:
+        stats = self.stats[request.name]
+        body = render(request.body, self.variables) if request.body else None
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(
+                request.method,
+                render(request.url, self.variables),
+                headers={
+                    key: render(value, self.variables)
+                    for key, value in request.headers.items()
+                },
+                content=body,
+            )
+        except httpx.HTTPError as exc:
+            status, failed = type(exc).__name__, True
+        else:
+            status = str(response.status_code)
+            failed = (
+                response.status_code != request.expected_status
+                if request.expected_status is not None
+                else response.is_error
+            )
+        if record:
+            stats.latencies.append(time.perf_counter() - start)
+            stats.statuses[status] += 1
+            stats.errors += failed
+
+    async def setup(self) -> None:
+        for request, weight in zip(self.requests, self.weights, strict=True):
+            if weight > 0:
+                await self.send(request, record=False)
+
+    async def virtual_user(self, start_at: float, stop_at: float, think: float) -> None:
+        await asyncio.sleep(max(0.0, start_at - time.monotonic()))
+        while time.monotonic() < stop_at:
+            (request,) = random.choices(self.requests, self.weights)
+            await self.send(request)
+            if think:
+                await asyncio.sleep(random.uniform(think / 2, think * 1.5))
+
+    async def run(
+        self, users: int, ramp_up: float, duration: float, think: float
+    ) -> float:
+        begin = time.monotonic()
+        stop_at = begin + ramp_up + duration
+        await asyncio.gather(
+            *(
+                self.virtual_user(begin + ramp_up * index / users, stop_at, think)
+                for index in range(users)
+            )
+        )
+        return time.monotonic() - begin
+
+
+def report(runner: LoadRunner, elapsed: float) -> dict[str, Any]:
+    rows = {}
+    for name, stats in runner.stats.items():
+        if not stats.latencies:
+            continue
+        latencies = sorted(stats.latencies)
+        # "inclusive" keeps percentiles within the observed range.
+        cuts = (
+            statistics.quantiles(latencies, n=100, method="inclusive")
+            if len(latencies) > 1
+            else latencies * 99
+        )
+        rows[name] = {
+            "requests": len(latencies),
+            "errors": stats.errors,
+            "rps": len(latencies) / elapsed,
+            "p50_ms": cuts[49] * 1e3,
+            "p95_ms": cuts[94] * 1e3,
+            "p99_ms": cuts[98] * 1e3,
+            "max_ms": latencies[-1] * 1e3,
+            "statuses": dict(stats.statuses),
+        }
+    return rows
+
+
+def print_report(rows: dict[str, Any], elapsed: float) -> None:
+    name_width = max((len(name) for name in rows), default=8) + 2
+    print(
+        f"{'request':<{name_width}} {'count':>7} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}  statuses"
+    )
+    for name, row in rows.items():
+        statuses = " ".join(
+            f"{code}:{count}" for code, count in row["statuses"].items()
+        )
+        print(
+            f"{name:<{name_width}} {row['requests']:>7} {row['errors']:>7} "
+            f"{row['rps']:>8.1f} {row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} "
+            f"{row['p99_ms']:>8.2f} {row['max_ms']:>8.2f}  {statuses}"
+        )
+    total = sum(row["requests"] for row in rows.values())
+    errors = sum(row["errors"] for row in rows.values())
+    print(f"total: {total} requests, {errors} errors in {elapsed:.1f}s")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--collection", type=Path, default=POSTMAN_DIR / "collection.json"
+    )
+    parser.add_argument(
+        "--environment", type=Path, default=POSTMAN_DIR / "environment.json"
+    )
+    parser.add_argument(
+        "--profile", type=Path, default=POSTMAN_DIR / "load-profile.json"
+    )
+    parser.add_argument("--users", type=int, help="virtual users")
+    parser.add_argument("--ramp-up", type=float, help="seconds to start all users")
+    parser.add_argument("--duration", type=float, help="seconds at full load")
+    parser.add_argument("--think-time", type=float, help="mean pause per user")
+    parser.add_argument("--var", action="append", default=[], help="key=value")
+    parser.add_argument("--json", type=Path, help="also write the report here")
+    parser.add_argument("--seed", type=int, help="seed the scenario picker")
+    args = parser.parse_args()
+
+    collection = json.loads(args.collection.read_text())
+    environment = (
+        json.loads(args.environment.read_text()) if args.environment.exists() else {}
+    )
+    profile = json.loads(args.profile.read_text()) if args.profile.exists() else {}
+    requests = iter_requests(collection["item"])
+    weights = [float(profile.get("weights", {}).get(r.name, 1)) for r in requests]
+    users = args.users or profile.get("virtualUsers", 10)
+    ramp_up = args.ramp_up if args.ramp_up is not None else profile.get("rampUp", 0)
+    duration = args.duration or profile.get("duration", 30)
+    think = (
+        args.think_time if args.think_time is not None else profile.get("thinkTime", 0)
+    )
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    async def run() -> tuple[LoadRunner, float]:
+        limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+        async with httpx.AsyncClient(
+            limits=limits, timeout=30, follow_redirects=True
+        ) as client:
+            runner = LoadRunner(
+                client,
+                requests,
+                weights,
+                load_variables(collection, environment, args.var),
+            )
+            await runner.setup()
+            elapsed = await runner.run(users, ramp_up, duration, think)
+            return runner, elapsed
+
+    print(
+        f"{users} virtual users, {ramp_up:g}s ramp-up, {duration:g}s duration, "
+        f"{think:g}s think time"
+    )
+    runner, elapsed = asyncio.run(run())
+    rows = report(runner, elapsed)
+    print_report(rows, elapsed)
+    if args.json:
+        args.json.write_text(json.dumps(rows, indent=2) + "\n")
+    return 1 if any(row["errors"] for row in rows.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+"""End-to-end benchmark suite with JSON baselines and a regression gate.
+
+Drives health, list, get, create and patch for users and items through
+``httpx.AsyncClient`` at several concurrency levels, either in-process over an
+ASGI transport (default) or against a local ``uvicorn`` subprocess::
+
+    uv run python benchmarks/suite.py                        # report only
+    uv run python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    uv run python benchmarks/suite.py --baseline benchmarks/baseline.json
+    uv run python benchmarks/suite.py --target uvicorn --concurrency 1 16 64
+
+With ``--baseline`` the exit status is 1 when any scenario's throughput drops,
+or its p95 latency grows, by more than ``--threshold`` (default 20%).
+
+Password hashing is turned down to 1000 iterations unless
+``PASSWORD_HASH_ITERATIONS`` is set, so ``users.create`` measures the request
+path rather than the key-derivation function.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+
+
+SEED_ROWS = 200
+CONCURRENCY_LEVELS = (1, 8, 32)
+REQUESTS_PER_LEVEL = 400
+REGRESSION_THRESHOLD = 0.2
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    name: str
+    method: str
+    path: Callable[[int], str]
+    body: Callable[[int], dict[str, Any]] | None = None
+
+
+def seeded_id(index: int) -> int:
+    return index % SEED_ROWS + 1
+
+
+UNIQUE = itertools.count()
+
+SCENARIOS = (
+    Scenario("health", "GET", lambda _: "/health"),
+    Scenario("users.list", "GET", lambda _: "/api/v1/users/?limit=50"),
+    Scenario("users.get", "GET", lambda i: f"/api/v1/users/{seeded_id(i)}"),
+    Scenario(
+        "users.create",
+        "POST",
+        lambda _: "/api/v1/users/",
+        lambda _: {
+            "email": f"bench{next(UNIQUE)}@example.com",
+            "name": "Bench",
+            "password": "password123",
+        },
+    ),
+    Scenario(
+        "users.patch",
+        "PATCH",
+        lambda i: f"/api/v1/users/{seeded_id(i)}",
+        lambda i: {"name": f"User {i}"},
+    ),
+    Scenario("items.list", "GET", lambda _: "/api/v1/items/?limit=50"),
+    Scenario("items.get", "GET", lambda i: f"/api/v1/items/{seeded_id(i)}"),
+    Scenario(
+        "items.create",
+        "POST",
+        lambda _: "/api/v1/items/",
+        lambda i: {"name": f"Item {i}", "description": "Benchmark item"},
+    ),
+    Scenario(
+        "items.patch",
+        "PATCH",
+        lambda i: f"/api/v1/items/{seeded_id(i)}",
+        lambda i: {"name": f"Item {i}"},
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    scenario: str
+    concurrency: int
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}@{self.concurrency}"
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, concurrency: int, requests: int
+) -> Result:
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while (index := next(counter)) < requests:
+            body = scenario.body(index) if scenario.body else None
+            start = time.perf_counter()
+            response = await client.request(
+                scenario.method, scenario.path(index), json=body
+            )
+            latencies.append(time.perf_counter() - start)
+            if response.is_error:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    cuts = statistics.quantiles(latencies, n=100)
+    return Result(
+        scenario=scenario.name,
+        concurrency=concurrency,
+        requests=requests,
+        errors=errors,
+        rps=requests / elapsed,
+        p50_ms=cuts[49] * 1e3,
+        p95_ms=cuts[94] * 1e3,
+        p99_ms=cuts[98] * 1e3,
+    )
+
+
+SEED_RECORDS: dict[str, Callable[[int], dict[str, Any]]] = {
+    "users": lambda i: {
+        "email": f"user{i}@example.com",
+        "name": f"User {i}",
+        "password": "password123",
+    },
+    "items": lambda i: {"name": f"Item {i}", "description": "Seeded"},
+}
+
+
+async def seed(client: httpx.AsyncClient) -> None:
+    for resource, record in SEED_RECORDS.items():
+        lines = (json.dumps(record(i)) for i in range(SEED_ROWS))
+        response = await client.post(
+            f"/api/v1/{resource}/bulk",
+            content="\n".join(lines),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        response.raise_for_status()
+
+
+@asynccontextmanager
+async def asgi_client() -> AsyncIterator[httpx.AsyncClient]:
+    # Built here so the settings see main()'s PASSWORD_HASH_ITERATIONS default.
+    app = create_app(Settings())
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            yield client
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+@asynccontextmanager
+async def uvicorn_client() -> AsyncIterator[httpx.AsyncClient]:
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "project_name.main:app",
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+        "--no-access-log",
+    ]
+    server = subprocess.Popen(command, env=os.environ.copy())
+    limits = httpx.Limits(max_connections=max(CONCURRENCY_LEVELS) * 2)
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{port}", limits=limits
+        ) as client:
+            for _ in range(100):
+                try:
+                    if (await client.get("/ready")).is_success:
+                        break
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.1)
+            else:
+                msg = "uvicorn did not become ready"
+                raise RuntimeError(msg)
+            yield client
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+async def run_suite(
+    target: str, levels: list[int], requests: int, only: list[str] | None
+) -> list[Result]:
+    client_factory = uvicorn_client if target == "uvicorn" else asgi_client
+    results = []
+    async with client_factory() as client:
+        await seed(client)
+        for scenario in SCENARIOS:
+            if only and not any(scenario.name.startswith(name) for name in only):
+                continue
+            # Warm up routes, caches and pooled connections before timing.
+            await run_scenario(client, scenario, 1, min(requests, 20))
+            for level in levels:
+                result = await run_scenario(client, scenario, level, requests)
+                results.append(result)
+                print(
+                    f"{result.scenario:<14} {level:>5} {result.rps:>9.1f} "
+                    f"{result.p50_ms:>8.2f} {result.p95_ms:>8.2f} "
+                    f"{result.p99_ms:>8.2f} {result.errors:>6}",
+                    flush=True,
+                )
+    return results
+
+
+def compare(
+    results: list[Result], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Describe every result that regressed past ``threshold`` against ``baseline``."""
+    reference = {f"{r['scenario']}@{r['concurrency']}": r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        base = reference.get(result.key)
+        if base is None:
+            continue
+        if result.rps < base["rps"] * (1 - threshold):
+            regressions.append(
+                f"{result.key}: {result.rps:.1f} req/s vs {base['rps']:.1f} baseline"
+            )
+        if result.p95_ms > base["p95_ms"] * (1 + threshold):
+            regressions.append(
+                f"{result.key}: p95 {result.p95_ms:.2f} ms "
+                f"vs {base['p95_ms']:.2f} ms baseline"
+            )
+        if result.errors > base["errors"]:
+            regressions.append(f"{result.key}: {result.errors} errors")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=("asgi", "uvicorn"), default="asgi")
+    parser.add_argument(
+        "--concurrency", type=int, nargs="+", default=list(CONCURRENCY_LEVELS)
+    )
+    parser.add_argument("--requests", type=int, default=REQUESTS_PER_LEVEL)
+    parser.add_argument("--only", nargs="+", help="scenario name prefixes to run")
+    parser.add_argument("--baseline", type=Path, help="compare against this file")
+    parser.add_argument("--save-baseline", type=Path, help="write results here")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args()
+
+    os.environ.setdefault("PASSWORD_HASH_ITERATIONS", "1000")
+    print(
+        f"{'scenario':<14} {'conc':>5} {'req/s':>9} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>6}"
+    )
+    results = asyncio.run(
+        run_suite(args.target, args.concurrency, args.requests, args.only)
+    )
+
+    if args.save_baseline:
+        document = {
+            "target": args.target,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": [asdict(result) for result in results],
+        }
+        args.save_baseline.write_text(json.dumps(document, indent=2) + "\n")
+        print(f"Baseline written to {args.save_baseline}")
+
+    if args.baseline:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline}; run with --save-baseline first.")
+            return 0
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.threshold
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,14 +2,179 @@
 
 from __future__ import annotations
 
+import argparse
+import importlib.util
+import math
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import uvicorn
 
+from project_name.core.config import get_settings
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from project_name.core.config import Settings
+
+
+APP = "project_name.main:app"
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
 
 def dev() -> None:
     """Run development server."""
     uvicorn.run(
-        "project_name.main:app",
+        APP,
         host="0.0.0.0",
         port=8000,
         reload=True,
     )
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> int | None:
+    """Return the container CPU quota rounded up, or ``None`` when unlimited."""
+    try:
+        quota, period = (root / "cpu.max").read_text().split()[:2]  # cgroup v2
+    except (OSError, ValueError):
+        try:
+            quota = (root / "cpu" / "cpu.cfs_quota_us").read_text().strip()
+            period = (root / "cpu" / "cpu.cfs_period_us").read_text().strip()
+        except OSError:
+            return None
+    if quota in {"max", "-1"}:
+        return None
+    return max(math.ceil(int(quota) / int(period)), 1)
+
+
+def available_cpus() -> int:
+    """CPUs this process may actually use: affinity mask capped by cgroup quota."""
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:  # pragma: no cover - macOS / Windows
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
+
+
+def has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def per_process_state(settings: Settings) -> list[str]:
+    """Describe the state each worker process would keep to itself."""
+    problems = []
+    if not settings.database_url:
+        problems.append("DATABASE_URL is unset, so each worker has its own database")
+    if settings.response_cache_enabled and not settings.response_cache_url:
+        problems.append(
+            "the response cache is per process, so writes only invalidate the "
+            "worker that handled them (set RESPONSE_CACHE_URL)"
+        )
+    return problems
+
+
+def server_options(settings: Settings, args: argparse.Namespace) -> dict[str, Any]:
+    """Build ``uvicorn.run`` keyword arguments; CLI flags override settings.
+
+    Without an explicit worker count there is one worker per available CPU,
+    but only once the database and response cache are shared between
+    processes; until then a single worker is started, and asking for more
+    exits with the reason.
+
+    Recycling workers after ``max_requests`` needs the multi-process
+    supervisor to start replacements, so it is refused with a single worker.
+    Each worker's limit is raised by a random amount up to the jitter
+    (default a tenth of ``max_requests``) so they do not all restart at once.
+    """
+
+    def pick(name: str) -> Any:
+        value = getattr(args, name, None)
+        return value if value is not None else getattr(settings, f"server_{name}")
+
+    workers = pick("workers")
+    problems = per_process_state(settings)
+    if workers is None:
+        workers = 1 if problems else available_cpus()
+    elif workers > 1 and problems:
+        raise SystemExit(
+            f"serve: refusing to start {workers} workers: {'; '.join(problems)}"
+        )
+    max_requests = pick("max_requests")
+    if max_requests is not None and workers == 1:
+        raise SystemExit(
+            "serve: --max-requests needs at least 2 workers; a single worker "
+            "is not restarted once it has served them"
+        )
+    jitter = pick("max_requests_jitter")
+    if jitter is None:
+        jitter = max_requests // 10 if max_requests else 0
+
+    return {
+        "host": pick("host"),
+        "port": pick("port"),
+        "workers": workers,
+        "loop": "uvloop" if has_module("uvloop") else "asyncio",
+        "http": "httptools" if has_module("httptools") else "h11",
+        "backlog": pick("backlog"),
+        "timeout_keep_alive": pick("keep_alive"),
+        "limit_concurrency": pick("limit_concurrency"),
+        "limit_max_requests": max_requests,
+        "limit_max_requests_jitter": jitter,
+        "timeout_graceful_shutdown": pick("graceful_timeout"),
+        "proxy_headers": True,
+        "access_log": pick("access_log"),
+    }
+
+
+def parse_serve_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="serve",
+        description="Run the production server. Unset options come from SERVER_* settings.",
+    )
+    parser.add_argument("--host")
+    parser.add_argument("--port", type=int)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes (default: available CPUs with a shared database "
+        "and cache, else 1)",
+    )
+    parser.add_argument("--backlog", type=int, help="Listen socket backlog")
+    parser.add_argument(
+        "--keep-alive", type=int, help="Seconds to keep idle connections open"
+    )
+    parser.add_argument(
+        "--limit-concurrency",
+        type=int,
+        help="Connections/tasks per worker before responding 503",
+    )
+    parser.add_argument(
+        "--max-requests",
+        type=int,
+        help="Recycle a worker after serving this many requests (needs 2+ workers)",
+    )
+    parser.add_argument(
+        "--max-requests-jitter",
+        type=int,
+        help="Add up to this many requests to each worker's limit "
+        "(default: a tenth of --max-requests)",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        help="Seconds to wait for in-flight requests on shutdown",
+    )
+    parser.add_argument(
+        "--access-log",
+        action=argparse.BooleanOptionalAction,
+        help="Log every request (default: on)",
+    )
+    return parser.parse_args(argv)
+
+
+def serve(argv: Sequence[str] | None = None) -> None:
+    """Run production server."""
+    uvicorn.run(APP, **server_options(get_settings(), parse_serve_args(argv)))
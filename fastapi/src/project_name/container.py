@@ -0,0 +1,120 @@
+"""Application service container."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from project_name.core.cache import ResponseCache
+from project_name.core.changefeed import ChangeHub
+from project_name.core.database import Database
+from project_name.core.jobs import JobQueue
+from project_name.core.replicas import use_primary, use_replica
+from project_name.core.security import PasswordHasher, PasswordHashingPool
+from project_name.core.singleflight import SingleFlight
+from project_name.repositories.item_repository import ItemRepository
+from project_name.repositories.user_repository import UserRepository
+from project_name.services.item_service import ItemService
+from project_name.services.user_service import UserService
+
+
+if TYPE_CHECKING:
+    from project_name.core.config import Settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceContainer:
+    """Long-lived services shared by every request.
+
+    Built once by the application lifespan: ``startup`` opens and warms the
+    connection pool and starts the job workers before the app reports ready;
+    ``shutdown`` ends the change-feed streams and drains the job queue, then
+    releases the pool.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        response_cache: ResponseCache | None = None,
+        passwords: PasswordHashingPool | None = None,
+        flights: SingleFlight | None = None,
+        jobs: JobQueue | None = None,
+        *,
+        changes: ChangeHub | None = None,
+    ) -> None:
+        self.database = database
+        self.response_cache = response_cache
+        self.passwords = passwords or PasswordHashingPool(PasswordHasher())
+        self.flights = flights
+        self.jobs = jobs or JobQueue()
+        self.changes = changes or ChangeHub()
+        self.users = UserService(
+            UserRepository(database),
+            response_cache,
+            self.passwords,
+            flights,
+            self.jobs,
+            changes=self.changes,
+        )
+        self.items = ItemService(
+            ItemRepository(database), response_cache, flights, changes=self.changes
+        )
+        self.ready = False
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ServiceContainer:
+        return cls(
+            Database.from_settings(settings),
+            ResponseCache.from_settings(settings)
+            if settings.response_cache_enabled
+            else None,
+            PasswordHashingPool(
+                PasswordHasher(settings.password_hash_iterations),
+                max_workers=settings.password_hash_workers,
+            ),
+            SingleFlight() if settings.single_flight_enabled else None,
+            JobQueue.from_settings(settings),
+            changes=ChangeHub.from_settings(settings),
+        )
+
+    async def startup(self) -> None:
+        await self.database.connect()
+        if self.database.pool.ephemeral:
+            # Nothing can have migrated a database that starts out empty.
+            await self.database.create_schema()
+        self.jobs.start()
+        await self.warm_up()
+        self.ready = True
+
+    async def warm_up(self) -> None:
+        # Run the hot read paths once so pooled connections and their
+        # prepared-statement caches are populated before traffic arrives.
+        with use_primary():
+            await self._warm_reads()
+        replicas = self.database.replicas
+        if replicas is None:
+            return
+        for index, pool in enumerate(replicas.pools):
+            # A replica that can't serve them yet (still empty, say) mustn't
+            # stop startup; the health probes deal with unreachable ones.
+            try:
+                with use_replica(pool):
+                    await self._warm_reads()
+            except Exception:  # any failure leaves this replica cold
+                logger.warning(
+                    "Warm-up failed on read replica %d", index, exc_info=True
+                )
+
+    async def _warm_reads(self) -> None:
+        await self.users.get_users(limit=1)
+        await self.items.list_items(limit=1)
+
+    async def shutdown(self) -> None:
+        self.ready = False
+        self.changes.close()
+        # Queued side effects may still need the database.
+        await self.jobs.drain()
+        await self.database.disconnect()
+        self.passwords.shutdown()
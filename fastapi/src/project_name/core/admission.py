@@ -0,0 +1,166 @@
+"""Admission control: concurrency limits, bounded queueing and rate limiting.
+
+State is kept per process, like the metrics and the in-memory response cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from starlette.responses import JSONResponse
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class OverloadedError(Exception):
+    """No slot became available: the queue is full or the wait timed out."""
+
+
+class ConcurrencyLimiter:
+    """Cap in-flight work at ``limit`` with at most ``queue_size`` waiters."""
+
+    def __init__(self, limit: int, *, queue_size: int, queue_timeout: float) -> None:
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(limit)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if self._semaphore.locked():
+            if self.waiting >= self.queue_size:
+                msg = "Wait queue is full"
+                raise OverloadedError(msg)
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError as exc:
+                msg = "Timed out waiting for a slot"
+                raise OverloadedError(msg) from exc
+            finally:
+                self.waiting -= 1
+        else:
+            await self._semaphore.acquire()
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+
+class TokenBucketLimiter:
+    """Per-client token buckets refilled at ``rate`` tokens per second.
+
+    At most ``max_clients`` buckets are kept; the least recently seen client is
+    forgotten first, which only ever gives it a fresh, full bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        *,
+        max_clients: int = 10_000,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_clients = max_clients
+        self._clock = clock
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, client: str) -> float:
+        """Take a token for ``client``; return 0, or the seconds until one is free."""
+        now = self._clock()
+        tokens, updated = self._buckets.pop(client, (float(self.burst), now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / self.rate
+        self._buckets[client] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class AdmissionMiddleware:
+    """Shed load before it reaches the application.
+
+    Requests take a slot from their route group's limiter (matched by path
+    prefix), then from the global one; both queue briefly before answering 503.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        limiter: ConcurrencyLimiter | None = None,
+        groups: dict[str, ConcurrencyLimiter] | None = None,
+        rate_limiter: TokenBucketLimiter | None = None,
+        exempt_paths: Iterable[str] = (),
+        retry_after: int = 1,
+    ) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.groups = sorted((groups or {}).items(), key=lambda item: -len(item[0]))
+        self.rate_limiter = rate_limiter
+        self.exempt_paths = tuple(exempt_paths)
+        self.retry_after = retry_after
+
+    def is_exempt(self, path: str) -> bool:
+        return any(
+            path == exempt or path.startswith(exempt + "/")
+            for exempt in self.exempt_paths
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.is_exempt(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        if self.rate_limiter is not None:
+            client = scope.get("client")
+            wait = self.rate_limiter.acquire(client[0] if client else "unknown")
+            if wait:
+                response = _reject(429, "Rate limit exceeded", math.ceil(wait))
+                await response(scope, receive, send)
+                return
+
+        limiters = [
+            limiter
+            for prefix, limiter in self.groups
+            if scope["path"] == prefix or scope["path"].startswith(prefix + "/")
+        ][:1]
+        if self.limiter is not None:
+            limiters.append(self.limiter)
+        async with AsyncExitStack() as stack:
+            try:
+                for limiter in limiters:
+                    await stack.enter_async_context(limiter.slot())
+            except OverloadedError as exc:
+                response = _reject(503, str(exc), self.retry_after)
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+
+
+def _reject(status_code: int, detail: str, retry_after: int) -> JSONResponse:
+    return JSONResponse(
+        {"detail": detail},
+        status_code=status_code,
+        headers={"Retry-After": str(max(retry_after, 1))},
+    )
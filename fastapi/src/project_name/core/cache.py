@@ -0,0 +1,296 @@
+"""Response cache with ETag / conditional GET support."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar
+
+from fastapi import Request, Response, status
+from fastapi.routing import APIRoute
+
+from project_name.core.replicas import primary_pinned
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+    from project_name.core.config import Settings
+
+
+EndpointT = TypeVar("EndpointT", bound="Callable[..., Any]")
+
+# Response headers that are replayed from the cache besides the body.
+CACHED_HEADERS = ("content-type", "x-next-cursor")
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int: ...
+
+    @abstractmethod
+    async def counter(self, key: str) -> int: ...
+
+
+class LRUCacheBackend(CacheBackend):
+    """Bounded in-process backend. Entries expire after their TTL."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._counters: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def incr(self, key: str) -> int:
+        # Counters hold namespace versions and are never evicted.
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+
+class CacheClient(Protocol):
+    """The subset of the ``redis.asyncio.Redis`` API used by the shared backend."""
+
+    async def get(self, name: str) -> bytes | None: ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> Any: ...
+
+    async def incr(self, name: str) -> int: ...
+
+
+class SharedCacheBackend(CacheBackend):
+    """Backend shared between workers, e.g. Redis."""
+
+    def __init__(self, client: CacheClient, prefix: str = "project_name:") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, ex=max(math.ceil(ttl), 1))
+
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(self.prefix + key))
+
+    async def counter(self, key: str) -> int:
+        value = await self.client.get(self.prefix + key)
+        return int(value) if value else 0
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: dict[str, str]
+
+    def encode(self) -> bytes:
+        meta = json.dumps({"etag": self.etag, "headers": self.headers})
+        return meta.encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, value: bytes) -> CachedResponse:
+        meta, _, body = value.partition(b"\n")
+        data = json.loads(meta)
+        return cls(body=body, etag=data["etag"], headers=data["headers"])
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+class ResponseCache:
+    """Caches serialized GET responses per namespace.
+
+    Writes invalidate a whole namespace by bumping its version, so every key
+    built from the old version simply stops being read and ages out.
+
+    With read replicas, an unpinned read right after a write may still see the
+    old rows and would be cached under the new version. Such entries live at
+    most ``replica_ttl`` seconds (the read-your-writes window), so stale data
+    is not served for longer than a replica may lag; ``0`` skips caching them.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, *, replica_ttl: float | None = None
+    ) -> None:
+        self.backend = backend
+        self.replica_ttl = replica_ttl
+        self.stats = CacheStats()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ResponseCache:
+        url = settings.response_cache_url
+        replica_ttl = (
+            settings.database_read_your_writes_window
+            if settings.database_read_urls
+            else None
+        )
+        if url:
+            # redis is only required for a shared cache ("redis" extra).
+            redis = importlib.import_module("redis.asyncio")
+            backend: CacheBackend = SharedCacheBackend(redis.from_url(url))
+        else:
+            backend = LRUCacheBackend(settings.response_cache_max_entries)
+        return cls(backend, replica_ttl=replica_ttl)
+
+    async def key(self, namespace: str, request: Request) -> str:
+        query = "&".join(sorted(request.url.query.split("&")))
+        version = await self.backend.counter(f"{namespace}:version")
+        # Reads pinned to the primary after a write must not be answered with
+        # what another client read from a lagging replica, so they get their own.
+        source = "primary" if primary_pinned() else "any"
+        return f"{namespace}:v{version}:{source}:{request.url.path}?{query}"
+
+    def ttl(self, ttl: float) -> float:
+        """Lifetime of an entry read now; see the class docstring."""
+        if self.replica_ttl is None or primary_pinned():
+            return ttl
+        return min(ttl, self.replica_ttl)
+
+    async def get(self, key: str) -> CachedResponse | None:
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return CachedResponse.decode(value)
+
+    async def set(self, key: str, entry: CachedResponse, ttl: float) -> None:
+        await self.backend.set(key, entry.encode(), ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        await self.backend.incr(f"{namespace}:version")
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    namespace: str
+    ttl: float
+
+
+def cache_response(
+    namespace: str, ttl: float = 60.0
+) -> Callable[[EndpointT], EndpointT]:
+    """Mark a GET endpoint as cacheable; the router must use ``CachedRoute``."""
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        endpoint.cache_policy = CachePolicy(namespace, ttl)  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorator
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+class CachedRoute(APIRoute):
+    """Route that serves ``cache_response`` endpoints from ``app.state.response_cache``."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        policy: CachePolicy | None = getattr(self.endpoint, "cache_policy", None)
+        if policy is None:
+            return handler
+
+        async def cached_handler(request: Request) -> Response:
+            cache: ResponseCache | None = getattr(
+                request.app.state, "response_cache", None
+            )
+            if cache is None or request.method != "GET":
+                return await handler(request)
+
+            if_none_match = request.headers.get("if-none-match")
+            key = await cache.key(policy.namespace, request)
+            entry = await cache.get(key)
+            if entry is None:
+                response = await handler(request)
+                if response.status_code != status.HTTP_200_OK or not hasattr(
+                    response, "body"
+                ):
+                    return response
+                body = bytes(response.body)
+                entry = CachedResponse(
+                    body=body,
+                    etag=make_etag(body),
+                    headers={
+                        name: response.headers[name]
+                        for name in CACHED_HEADERS
+                        if name in response.headers
+                    },
+                )
+                ttl = cache.ttl(policy.ttl)
+                if ttl > 0:
+                    await cache.set(key, entry, ttl)
+                response.headers["ETag"] = entry.etag
+                if not etag_matches(if_none_match, entry.etag):
+                    return response
+
+            if etag_matches(if_none_match, entry.etag):
+                cache.stats.not_modified += 1
+                return not_modified(entry.etag)
+            return Response(entry.body, headers={**entry.headers, "ETag": entry.etag})
+
+        return cached_handler
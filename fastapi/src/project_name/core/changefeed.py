@@ -0,0 +1,259 @@
+"""In-process fan-out of create / update / delete events as Server-Sent Events.
+
+Events are published by the services after a write and pushed to every
+subscriber of the topic (``"users"`` or ``"items"``) in this worker. Each event
+is encoded once, however many subscribers receive it, and an idle subscriber
+costs one small buffer plus the coroutine serving its response.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Hashable, Iterable
+
+    from project_name.core.config import Settings
+
+
+ChangeAction = Literal["created", "updated", "deleted"]
+OverflowPolicy = Literal["coalesce", "drop"]
+
+SSE_MEDIA_TYPE = "text/event-stream"
+HEARTBEAT_FRAME = b": keepalive\n\n"
+# Sent first; EventSource clients reconnect this many ms after a stream ends.
+RETRY_FRAME = b"retry: 1000\n\n"
+# Sent to a reconnecting client whose missed events are no longer in history:
+# it should refetch what it shows, then apply the events that follow.
+RESET_FRAME = b"id: %d\nevent: reset\ndata: {}\n\n"
+
+
+class HubFullError(Exception):
+    """The worker already serves ``max_subscribers`` change feeds."""
+
+
+def encode_event(event_id: int, action: ChangeAction, data: bytes) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, action.encode(), data)
+
+
+@dataclass(frozen=True, slots=True)
+class ChangeEvent:
+    id: int
+    topic: str
+    key: int
+    action: ChangeAction
+    data: bytes
+    frame: bytes
+
+
+class Subscription:
+    """A subscriber's bounded buffer of events not yet written to its stream.
+
+    A subscriber that falls ``buffer_size`` events behind is closed; its client
+    reconnects with ``Last-Event-ID`` and catches up from the hub's history.
+    With the ``coalesce`` policy a lagging subscriber first has pending events
+    for the same record merged into one, so bursts of writes to a few hot
+    records don't overflow it: the newest event wins, except that a pending
+    ``created`` stays ``created`` (with the newest data) and disappears along
+    with a following ``deleted``. Events replayed on reconnect go to
+    ``backlog``, which is written first and doesn't count against the buffer.
+    """
+
+    __slots__ = (
+        "_wakeup",
+        "backlog",
+        "buffer_size",
+        "closed",
+        "overflow",
+        "pending",
+        "topic",
+    )
+
+    def __init__(self, topic: str, buffer_size: int, overflow: OverflowPolicy) -> None:
+        self.topic = topic
+        self.buffer_size = buffer_size
+        self.overflow = overflow
+        self.closed = False
+        self.backlog: collections.deque[bytes] = collections.deque()
+        self.pending: collections.OrderedDict[Hashable, ChangeEvent] = (
+            collections.OrderedDict()
+        )
+        self._wakeup = asyncio.Event()
+
+    def push(self, event: ChangeEvent) -> Literal["queued", "coalesced", "overflow"]:
+        if self.overflow == "coalesce" and event.key in self.pending:
+            previous = self.pending.pop(event.key)
+            if previous.action == "created":
+                if event.action == "deleted":
+                    # The client never saw the record: tell it nothing.
+                    return "coalesced"
+                event = ChangeEvent(
+                    event.id,
+                    event.topic,
+                    event.key,
+                    "created",
+                    event.data,
+                    encode_event(event.id, "created", event.data),
+                )
+            self.pending[event.key] = event
+            return "coalesced"
+        if len(self.pending) >= self.buffer_size:
+            self.close()
+            return "overflow"
+        self.pending[event.key if self.overflow == "coalesce" else event.id] = event
+        self._wakeup.set()
+        return "queued"
+
+    def close(self) -> None:
+        self.closed = True
+        self.pending.clear()
+        self._wakeup.set()
+
+    async def frames(self, heartbeat: float) -> AsyncGenerator[bytes, None]:
+        """Yield the backlog, then pending frames as they arrive (a comment when idle)."""
+        while self.backlog:
+            yield self.backlog.popleft()
+        while True:
+            while self.pending:
+                _, event = self.pending.popitem(last=False)
+                yield event.frame
+            if self.closed:
+                return
+            self._wakeup.clear()
+            try:
+                async with asyncio.timeout(heartbeat):
+                    await self._wakeup.wait()
+            except TimeoutError:
+                # Keeps proxies from timing the stream out, and surfaces a
+                # disconnected client on servers that only notice on send.
+                yield HEARTBEAT_FRAME
+
+
+class ChangeHub:
+    """Broadcast change events to the subscribers of a topic."""
+
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 64,
+        overflow: OverflowPolicy = "coalesce",
+        history_size: int = 1000,
+        max_subscribers: int = 10_000,
+        heartbeat: float = 15.0,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.overflow: OverflowPolicy = overflow
+        self.max_subscribers = max_subscribers
+        self.heartbeat = heartbeat
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.replayed = 0
+        self.resets = 0
+        self._last_id = 0
+        # Newest event id pushed out of the history ring.
+        self._evicted_through = 0
+        self._history: collections.deque[ChangeEvent] = collections.deque(
+            maxlen=history_size
+        )
+        self._topics: dict[str, set[Subscription]] = collections.defaultdict(set)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ChangeHub:
+        return cls(
+            buffer_size=settings.change_feed_buffer_size,
+            overflow=settings.change_feed_overflow,
+            history_size=settings.change_feed_history_size,
+            max_subscribers=settings.change_feed_max_subscribers,
+            heartbeat=settings.change_feed_heartbeat,
+        )
+
+    @property
+    def subscribers(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._topics.values())
+
+    def publish(self, topic: str, action: ChangeAction, key: int, data: bytes) -> None:
+        """Queue ``data`` (a JSON document) for every subscriber of ``topic``."""
+        self._last_id = event_id = self._last_id + 1
+        frame = encode_event(event_id, action, data)
+        event = ChangeEvent(event_id, topic, key, action, data, frame)
+        if len(self._history) == self._history.maxlen:
+            self._evicted_through = self._history[0].id if self._history else event_id
+        self._history.append(event)
+        self.published += 1
+        subscriptions = self._topics.get(topic)
+        if subscriptions:
+            self._deliver(subscriptions, event)
+
+    def subscribe(self, topic: str, last_event_id: int | None = None) -> Subscription:
+        if self.subscribers >= self.max_subscribers:
+            raise HubFullError(topic)
+        subscription = Subscription(topic, self.buffer_size, self.overflow)
+        if last_event_id is not None:
+            subscription.backlog.extend(self._missed(topic, last_event_id))
+        self._topics[topic].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._topics[subscription.topic].discard(subscription)
+
+    async def stream(self, subscription: Subscription) -> AsyncGenerator[bytes, None]:
+        try:
+            yield RETRY_FRAME
+            async for frame in subscription.frames(self.heartbeat):
+                yield frame
+        finally:
+            self.unsubscribe(subscription)
+
+    def close(self) -> None:
+        """End every stream, e.g. on shutdown."""
+        for subscriptions in self._topics.values():
+            for subscription in subscriptions:
+                subscription.close()
+            subscriptions.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "subscribers": self.subscribers,
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+            "replayed": self.replayed,
+            "resets": self.resets,
+        }
+
+    def _missed(self, topic: str, last_event_id: int) -> list[bytes]:
+        if last_event_id < self._evicted_through or last_event_id > self._last_id:
+            # Some missed events have left the history, or the id came from an
+            # earlier process: the client must resync rather than replay.
+            self.resets += 1
+            return [RESET_FRAME % self._last_id]
+        missed = [
+            event.frame
+            for event in self._history
+            if event.id > last_event_id and event.topic == topic
+        ]
+        self.replayed += len(missed)
+        return missed
+
+    def _deliver(
+        self, subscriptions: Iterable[Subscription], event: ChangeEvent
+    ) -> None:
+        overflowed: list[Subscription] = []
+        for subscription in subscriptions:
+            outcome = subscription.push(event)
+            if outcome == "queued":
+                self.delivered += 1
+            elif outcome == "coalesced":
+                self.coalesced += 1
+            else:
+                self.dropped += 1
+                overflowed.append(subscription)
+        for subscription in overflowed:
+            self.unsubscribe(subscription)
@@ -0,0 +1,178 @@
+"""Negotiated gzip / brotli response compression."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import importlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from starlette.datastructures import Headers, MutableHeaders
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import ModuleType
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Media types that are already compressed; recompressing them only costs CPU.
+INCOMPRESSIBLE_PREFIXES = ("image/", "video/", "audio/", "font/woff")
+INCOMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/gzip",
+        "application/zip",
+        "application/x-gzip",
+        "application/octet-stream",
+        "text/event-stream",
+    }
+)
+COMPRESSIBLE_IMAGES = frozenset({"image/svg+xml"})
+
+
+def load_brotli() -> ModuleType | None:
+    # brotli is optional ("compression" extra); without it only gzip is offered.
+    try:
+        return importlib.import_module("brotli")
+    except ModuleNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=128)
+def negotiate(accept_encoding: str, *, brotli: bool) -> str | None:
+    """Pick ``br`` or ``gzip`` from an ``Accept-Encoding`` header, if acceptable."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip()] = weight
+    wildcard = weights.get("*", 0.0)
+    offered = ("br", "gzip") if brotli else ("gzip",)
+    ranked = [
+        (weights.get(coding, wildcard), -position, coding)
+        for position, coding in enumerate(offered)
+    ]
+    weight, _, coding = max(ranked)
+    return coding if weight > 0 else None
+
+
+def compressible(media_type: str) -> bool:
+    media_type = media_type.split(";", 1)[0].strip().lower()
+    if media_type in COMPRESSIBLE_IMAGES:
+        return True
+    return not (
+        media_type in INCOMPRESSIBLE_TYPES
+        or media_type.startswith(INCOMPRESSIBLE_PREFIXES)
+    )
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least ``minimum_size`` bytes.
+
+    Streaming responses (more than one body message), responses that already
+    carry a ``Content-Encoding`` and incompressible media types pass through
+    untouched. Bodies of ``cache_paths`` and of responses with an ``ETag`` are
+    stable, so their compressed form is kept in a small LRU keyed by the
+    body's digest and reused instead of being compressed again.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache_paths: Iterable[str] = (),
+        cache_entries: int = 256,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_paths = frozenset(cache_paths)
+        self.cache_entries = cache_entries
+        self.brotli = load_brotli()
+        self._cache: OrderedDict[tuple[str, bytes], bytes] = OrderedDict()
+
+    def compress(self, body: bytes, coding: str) -> bytes:
+        if coding == "br" and self.brotli is not None:
+            compressed: bytes = self.brotli.compress(body, quality=self.brotli_quality)
+            return compressed
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def compress_cached(self, body: bytes, coding: str) -> bytes:
+        key = (coding, hashlib.blake2b(body, digest_size=16).digest())
+        compressed = self._cache.get(key)
+        if compressed is not None:
+            self._cache.move_to_end(key)
+            return compressed
+        compressed = self.compress(body, coding)
+        self._cache[key] = compressed
+        if len(self._cache) > self.cache_entries:
+            self._cache.popitem(last=False)
+        return compressed
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = Headers(scope=scope).get("accept-encoding", "")
+        coding = negotiate(accept, brotli=self.brotli is not None) if accept else None
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is None:
+                # Later chunks of a streaming response, which passes through.
+                await send(message)
+                return
+            start_message, start = start, None
+            await self.send_response(scope, send, start_message, message, coding)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def send_response(
+        self, scope: Scope, send: Send, start: Message, body: Message, coding: str
+    ) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        content = body.get("body", b"")
+        if (
+            body.get("more_body", False)
+            or "content-encoding" in headers
+            or len(content) < self.minimum_size
+            or not compressible(headers.get("content-type", ""))
+        ):
+            await send(start)
+            await send(body)
+            return
+
+        if scope["path"] in self.cache_paths or "etag" in headers:
+            content = self.compress_cached(content, coding)
+        else:
+            content = self.compress(content, coding)
+        headers["Content-Encoding"] = coding
+        headers["Content-Length"] = str(len(content))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # The encoded body differs byte-for-byte, so the tag becomes weak.
+            headers["ETag"] = f"W/{etag}"
+        await send(start)
+        await send({"type": "http.response.body", "body": content})
@@ -28,8 +28,71 @@ class Settings(BaseSettings):
     secret_key: str = "change-me-change-me-change-me-change"
     access_token_expire_minutes: int = 30
     algorithm: str = "HS256"
+    token_cache_size: int = Field(default=1024, ge=0)
+    password_hash_iterations: int = Field(default=600_000, ge=1)
+    password_hash_workers: int = Field(default=2, ge=1)
+    job_workers: int = Field(default=2, ge=1)
+    job_queue_size: int = Field(default=1000, ge=1)
+    job_max_attempts: int = Field(default=3, ge=1)
+    job_retry_backoff: float = Field(default=0.5, ge=0)
+    job_drain_timeout: float = Field(default=10.0, ge=0)
+
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    server_workers: int | None = Field(default=None, ge=1)
+    server_backlog: int = Field(default=2048, ge=1)
+    server_keep_alive: int = Field(default=5, ge=1)
+    server_limit_concurrency: int | None = Field(default=None, ge=1)
+    server_max_requests: int | None = Field(default=None, ge=1)
+    server_max_requests_jitter: int | None = Field(default=None, ge=0)
+    server_graceful_timeout: int = Field(default=30, ge=0)
+    server_access_log: bool = True
 
     database_url: str | None = None
+    database_pool_min_size: int = Field(default=1, ge=0)
+    database_pool_max_size: int = Field(default=10, ge=1)
+    database_pool_acquire_timeout: float = Field(default=5.0, gt=0)
+    database_statement_cache_size: int = Field(default=100, ge=0)
+    database_read_urls: list[str] = Field(default_factory=list)
+    database_replica_probe_interval: float = Field(default=5.0, gt=0)
+    database_replica_failure_threshold: int = Field(default=2, ge=1)
+    database_read_your_writes_window: float = Field(default=5.0, ge=0)
+    fast_json_responses: bool = False
+    bulk_chunk_size: int = Field(default=500, ge=1, le=5000)
+    export_batch_size: int = Field(default=1000, ge=1, le=50_000)
+    response_cache_enabled: bool = True
+    response_cache_max_entries: int = Field(default=1024, ge=1)
+    response_cache_url: str | None = None
+    single_flight_enabled: bool = True
+    change_feed_buffer_size: int = Field(default=64, ge=1)
+    change_feed_overflow: Literal["coalesce", "drop"] = "coalesce"
+    change_feed_history_size: int = Field(default=1000, ge=0)
+    change_feed_max_subscribers: int = Field(default=10_000, ge=1)
+    change_feed_heartbeat: float = Field(default=15.0, gt=0)
+    metrics_enabled: bool = True
+    compression_enabled: bool = True
+    compression_minimum_size: int = Field(default=1024, ge=0)
+    compression_gzip_level: int = Field(default=6, ge=1, le=9)
+    compression_brotli_quality: int = Field(default=4, ge=0, le=11)
+    compression_cache_paths: list[str] = Field(
+        default_factory=lambda: ["/openapi.json"]
+    )
+    admission_max_concurrency: int | None = Field(default=None, ge=1)
+    admission_group_concurrency: dict[str, int] = Field(default_factory=dict)
+    admission_queue_size: int = Field(default=100, ge=0)
+    admission_queue_timeout: float = Field(default=1.0, gt=0)
+    admission_retry_after: int = Field(default=1, ge=1)
+    admission_exempt_paths: list[str] = Field(
+        default_factory=lambda: [
+            "/health",
+            "/ready",
+            "/metrics",
+            "/api/v1/users/stream",
+            "/api/v1/items/stream",
+        ]
+    )
+    rate_limit_per_second: float | None = Field(default=None, gt=0)
+    rate_limit_burst: int = Field(default=20, ge=1)
     cors_origins: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
 
 
@@ -1 +1,476 @@
 """Database helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import re
+import sqlite3
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+import aiosqlite
+
+from project_name.core.replicas import ReplicaSet, pinned_replica, primary_pinned
+from project_name.models.schema import schema_statements
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterator, Iterable, Sequence
+
+    from project_name.core.config import Settings
+
+
+Row = dict[str, Any]
+
+DEFAULT_DATABASE_URL = "sqlite:///:memory:"
+
+
+class DatabaseError(Exception):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class PoolTimeoutError(DatabaseError, TimeoutError):
+    pass
+
+
+class Connection(ABC):
+    """A pooled connection. SQL uses ``?`` placeholders for every backend."""
+
+    @abstractmethod
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> list[Row]: ...
+
+    @abstractmethod
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Row | None: ...
+
+    @abstractmethod
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int: ...
+
+    @abstractmethod
+    async def execute_many(self, sql: str, params: Iterable[Sequence[Any]]) -> None: ...
+
+    @abstractmethod
+    def stream(
+        self, sql: str, params: Sequence[Any] = (), *, batch_size: int = 1000
+    ) -> AsyncGenerator[list[Row], None]:
+        """Yield the result in ``batch_size`` chunks from a server-side cursor."""
+
+    @abstractmethod
+    def transaction(self) -> Any: ...
+
+
+class ConnectionPool(ABC):
+    dialect: str
+
+    @abstractmethod
+    async def open(self) -> None: ...
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+    @abstractmethod
+    def acquire(self) -> Any: ...
+
+    @property
+    @abstractmethod
+    def size(self) -> int: ...
+
+    @property
+    @abstractmethod
+    def in_use(self) -> int: ...
+
+    @property
+    def ephemeral(self) -> bool:
+        """Whether the database only lives as long as the pool (in-memory SQLite)."""
+        return False
+
+
+class SQLiteConnection(Connection):
+    def __init__(self, connection: aiosqlite.Connection) -> None:
+        self._connection = connection
+
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> list[Row]:
+        async with self._connection.execute(sql, params) as cursor:
+            return [dict(row) for row in await cursor.fetchall()]
+
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Row | None:
+        try:
+            async with self._connection.execute(sql, params) as cursor:
+                row = await cursor.fetchone()
+                # Drain the statement so RETURNING writes are fully applied.
+                await cursor.fetchall()
+        except sqlite3.IntegrityError as exc:
+            raise IntegrityError(str(exc)) from exc
+        return dict(row) if row is not None else None
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        try:
+            async with self._connection.execute(sql, params) as cursor:
+                return cursor.rowcount
+        except sqlite3.IntegrityError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    async def execute_many(self, sql: str, params: Iterable[Sequence[Any]]) -> None:
+        try:
+            await self._connection.executemany(sql, params)
+        except sqlite3.IntegrityError as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    async def stream(
+        self, sql: str, params: Sequence[Any] = (), *, batch_size: int = 1000
+    ) -> AsyncGenerator[list[Row], None]:
+        async with self._connection.execute(sql, params) as cursor:
+            while rows := await cursor.fetchmany(batch_size):
+                yield [dict(row) for row in rows]
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        await self._connection.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            await self._connection.rollback()
+            raise
+        await self._connection.commit()
+
+
+class SQLitePool(ConnectionPool):
+    """Connection pool for SQLite files.
+
+    ``:memory:`` databases are shared through a single connection, since every
+    new connection would otherwise open an empty database.
+    """
+
+    dialect = "sqlite"
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 5.0,
+        statement_cache_size: int = 100,
+    ) -> None:
+        self._memory = path == ":memory:"
+        self._path = (
+            f"file:memdb-{uuid.uuid4().hex}?mode=memory&cache=shared"
+            if self._memory
+            else path
+        )
+        self._max_size = 1 if self._memory else max(max_size, 1)
+        self._min_size = min(max(min_size, 1 if self._memory else 0), self._max_size)
+        self._acquire_timeout = acquire_timeout
+        self._statement_cache_size = statement_cache_size
+        self._idle: asyncio.LifoQueue[aiosqlite.Connection] = asyncio.LifoQueue()
+        self._slots = asyncio.Semaphore(self._max_size)
+        self._connections: list[aiosqlite.Connection] = []
+        self._in_use = 0
+
+    async def _connect(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            self._path,
+            uri=self._memory,
+            isolation_level=None,
+            cached_statements=self._statement_cache_size,
+        )
+        connection.row_factory = sqlite3.Row
+        if not self._memory:
+            await connection.execute("PRAGMA journal_mode=WAL")
+            await connection.execute(
+                f"PRAGMA busy_timeout={int(self._acquire_timeout * 1000)}"
+            )
+        await connection.execute("PRAGMA foreign_keys=ON")
+        self._connections.append(connection)
+        return connection
+
+    async def open(self) -> None:
+        for _ in range(self._min_size - len(self._connections)):
+            self._idle.put_nowait(await self._connect())
+
+    async def close(self) -> None:
+        for connection in self._connections:
+            await connection.close()
+        self._connections.clear()
+        self._idle = asyncio.LifoQueue()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Connection]:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self._acquire_timeout)
+        except TimeoutError as exc:
+            raise PoolTimeoutError(
+                "Timed out waiting for a database connection"
+            ) from exc
+        try:
+            connection = (
+                self._idle.get_nowait()
+                if not self._idle.empty()
+                else await self._connect()
+            )
+            self._in_use += 1
+            try:
+                yield SQLiteConnection(connection)
+            finally:
+                self._in_use -= 1
+                if connection.in_transaction:
+                    await connection.rollback()
+                self._idle.put_nowait(connection)
+        finally:
+            self._slots.release()
+
+    @property
+    def size(self) -> int:
+        return len(self._connections)
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def ephemeral(self) -> bool:
+        return self._memory
+
+
+@lru_cache(maxsize=512)
+def to_numbered_placeholders(sql: str) -> str:
+    """Rewrite ``?`` placeholders to asyncpg's ``$1, $2, ...`` style."""
+    counter = iter(range(1, sql.count("?") + 1))
+    return re.sub(r"\?", lambda _: f"${next(counter)}", sql)
+
+
+class PostgresConnection(Connection):  # pragma: no cover - requires a PostgreSQL server
+    def __init__(self, connection: Any, integrity_error: type[Exception]) -> None:
+        self._connection = connection
+        self._integrity_error = integrity_error
+
+    async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> list[Row]:
+        rows = await self._connection.fetch(to_numbered_placeholders(sql), *params)
+        return [dict(row) for row in rows]
+
+    async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> Row | None:
+        try:
+            row = await self._connection.fetchrow(
+                to_numbered_placeholders(sql), *params
+            )
+        except self._integrity_error as exc:
+            raise IntegrityError(str(exc)) from exc
+        return dict(row) if row is not None else None
+
+    async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        try:
+            status = await self._connection.execute(
+                to_numbered_placeholders(sql), *params
+            )
+        except self._integrity_error as exc:
+            raise IntegrityError(str(exc)) from exc
+        count = status.rsplit(" ", 1)[-1]
+        return int(count) if count.isdigit() else 0
+
+    async def execute_many(self, sql: str, params: Iterable[Sequence[Any]]) -> None:
+        try:
+            await self._connection.executemany(to_numbered_placeholders(sql), params)
+        except self._integrity_error as exc:
+            raise IntegrityError(str(exc)) from exc
+
+    async def stream(
+        self, sql: str, params: Sequence[Any] = (), *, batch_size: int = 1000
+    ) -> AsyncGenerator[list[Row], None]:
+        # asyncpg cursors only exist inside a transaction.
+        async with self._connection.transaction():
+            cursor = await self._connection.cursor(
+                to_numbered_placeholders(sql), *params
+            )
+            while rows := await cursor.fetch(batch_size):
+                yield [dict(row) for row in rows]
+
+    def transaction(self) -> Any:
+        return self._connection.transaction()
+
+
+class PostgresPool(ConnectionPool):  # pragma: no cover - requires a PostgreSQL server
+    dialect = "postgresql"
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        min_size: int = 1,
+        max_size: int = 10,
+        acquire_timeout: float = 5.0,
+        statement_cache_size: int = 100,
+    ) -> None:
+        self._dsn = dsn
+        self._min_size = min_size
+        self._max_size = max_size
+        self._acquire_timeout = acquire_timeout
+        self._statement_cache_size = statement_cache_size
+        self._pool: Any = None
+        self._asyncpg: Any = None
+
+    async def open(self) -> None:
+        # asyncpg is only required for PostgreSQL ("postgres" extra).
+        self._asyncpg = importlib.import_module("asyncpg")
+        self._pool = await self._asyncpg.create_pool(
+            self._dsn,
+            min_size=self._min_size,
+            max_size=self._max_size,
+            statement_cache_size=self._statement_cache_size,
+        )
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Connection]:
+        try:
+            connection = await self._pool.acquire(timeout=self._acquire_timeout)
+        except TimeoutError as exc:
+            raise PoolTimeoutError(
+                "Timed out waiting for a database connection"
+            ) from exc
+        try:
+            yield PostgresConnection(
+                connection, self._asyncpg.IntegrityConstraintViolationError
+            )
+        finally:
+            await self._pool.release(connection)
+
+    @property
+    def size(self) -> int:
+        return int(self._pool.get_size()) if self._pool is not None else 0
+
+    @property
+    def in_use(self) -> int:
+        if self._pool is None:
+            return 0
+        return int(self._pool.get_size() - self._pool.get_idle_size())
+
+
+def create_pool(
+    url: str,
+    *,
+    min_size: int = 1,
+    max_size: int = 10,
+    acquire_timeout: float = 5.0,
+    statement_cache_size: int = 100,
+) -> ConnectionPool:
+    scheme, _, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    pool_class: type[SQLitePool | PostgresPool]
+    if backend == "sqlite":
+        pool_class, target = SQLitePool, rest.removeprefix("/") or ":memory:"
+    elif backend in {"postgresql", "postgres"}:
+        pool_class, target = PostgresPool, f"postgresql://{rest}"
+    else:
+        msg = f"Unsupported database URL: {scheme}://"
+        raise ValueError(msg)
+    return pool_class(
+        target,
+        min_size=min_size,
+        max_size=max_size,
+        acquire_timeout=acquire_timeout,
+        statement_cache_size=statement_cache_size,
+    )
+
+
+class Database:
+    """Owns the application's shared connection pool and optional read replicas.
+
+    Writes and transactions always use the primary ``pool``. ``read_connection``
+    goes to the least busy healthy replica unless the current context is pinned
+    to the primary (see ``use_primary``) or no replica is available. Only a
+    failure to get a replica connection falls back to the primary: a query
+    that fails on a replica raises, and is not retried on the primary.
+    """
+
+    def __init__(
+        self, pool: ConnectionPool, replicas: ReplicaSet | None = None
+    ) -> None:
+        self.pool = pool
+        self.replicas = replicas
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Database:
+        def pool(url: str) -> ConnectionPool:
+            return create_pool(
+                url,
+                min_size=settings.database_pool_min_size,
+                max_size=settings.database_pool_max_size,
+                acquire_timeout=settings.database_pool_acquire_timeout,
+                statement_cache_size=settings.database_statement_cache_size,
+            )
+
+        replicas = (
+            ReplicaSet(
+                [pool(url) for url in settings.database_read_urls],
+                failure_threshold=settings.database_replica_failure_threshold,
+                probe_interval=settings.database_replica_probe_interval,
+            )
+            if settings.database_read_urls
+            else None
+        )
+        return cls(pool(settings.database_url or DEFAULT_DATABASE_URL), replicas)
+
+    @property
+    def dialect(self) -> str:
+        return self.pool.dialect
+
+    async def connect(self) -> None:
+        await self.pool.open()
+        if self.replicas is not None:
+            await self.replicas.open()
+
+    async def disconnect(self) -> None:
+        if self.replicas is not None:
+            await self.replicas.close()
+        await self.pool.close()
+
+    async def create_schema(self) -> None:
+        """Create the tables directly, for in-memory databases and tests.
+
+        Databases that outlive the process are migrated with Alembic
+        (``make migrate``) instead.
+        """
+        async with self.pool.acquire() as connection:
+            for statement in schema_statements(self.dialect):
+                await connection.execute(statement)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[Connection]:
+        async with self.pool.acquire() as connection:
+            yield connection
+
+    @asynccontextmanager
+    async def read_connection(self) -> AsyncIterator[Connection]:
+        pinned = pinned_replica()
+        if pinned is not None:
+            async with pinned.acquire() as connection:
+                yield connection
+            return
+        replicas = None if primary_pinned() else self.replicas
+        replica = replicas.choose() if replicas is not None else None
+        async with AsyncExitStack() as stack:
+            if replicas is not None and replica is not None:
+                try:
+                    connection = await stack.enter_async_context(replica.acquire())
+                except Exception:  # fall back to the primary; probes decide the rest
+                    replicas.record_failure(replica)
+                    replica = None
+            if replica is None:
+                connection = await stack.enter_async_context(self.pool.acquire())
+            yield connection
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[Connection]:
+        async with self.pool.acquire() as connection, connection.transaction():
+            yield connection
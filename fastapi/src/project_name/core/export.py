@@ -0,0 +1,156 @@
+"""Streaming encoders for the bulk export endpoints.
+
+Rows arrive in fixed-size batches, one keyset query each, and each batch is
+encoded and sent before the next one is fetched, so memory is bounded by the
+batch size rather than by the table size.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import io
+import types
+from contextlib import aclosing
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal, Union, get_args, get_origin
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+    from types import ModuleType
+
+    from pydantic import BaseModel
+
+
+ExportFormat = Literal["csv", "ndjson", "parquet"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class ExportUnavailableError(Exception):
+    """The requested format needs an optional dependency that is not installed."""
+
+
+def load_pyarrow() -> ModuleType | None:
+    # pyarrow is optional ("parquet" extra); without it Parquet is unavailable.
+    try:
+        importlib.import_module("pyarrow.parquet")
+        return importlib.import_module("pyarrow")
+    except ModuleNotFoundError:
+        return None
+
+
+def encode(
+    batches: AsyncGenerator[Sequence[BaseModel], None],
+    model: type[BaseModel],
+    export_format: ExportFormat,
+) -> AsyncGenerator[bytes, None]:
+    if export_format == "csv":
+        return encode_csv(batches, model)
+    if export_format == "ndjson":
+        return encode_ndjson(batches)
+    pyarrow = load_pyarrow()
+    if pyarrow is None:
+        msg = "Parquet export requires the 'parquet' extra (pyarrow)"
+        raise ExportUnavailableError(msg)
+    return encode_parquet(batches, model, pyarrow)
+
+
+async def encode_csv(
+    batches: AsyncGenerator[Sequence[BaseModel], None], model: type[BaseModel]
+) -> AsyncGenerator[bytes, None]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(model.model_fields)
+    # The header goes out before the first query, so clients see bytes at once.
+    yield buffer.getvalue().encode()
+    async with aclosing(batches):
+        async for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            for record in batch:
+                writer.writerow(record.model_dump(mode="json").values())
+            yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(
+    batches: AsyncGenerator[Sequence[BaseModel], None],
+) -> AsyncGenerator[bytes, None]:
+    async with aclosing(batches):
+        async for batch in batches:
+            yield b"".join(
+                record.model_dump_json().encode() + b"\n" for record in batch
+            )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file collecting what the Parquet writer emits between batches."""
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.chunks.append(bytes(data))
+        return len(self.chunks[-1])
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+ARROW_TYPES: dict[Any, str] = {
+    bool: "bool_",
+    int: "int64",
+    float: "float64",
+    str: "string",
+}
+
+
+def arrow_schema(model: type[BaseModel], pyarrow: ModuleType) -> Any:
+    """Build the Arrow schema of ``model``'s fields (``X | None`` is nullable)."""
+    fields = []
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        nullable = False
+        if get_origin(annotation) in {Union, types.UnionType}:
+            args = [arg for arg in get_args(annotation) if arg is not type(None)]
+            nullable = len(args) < len(get_args(annotation))
+            (annotation,) = args
+        if annotation is datetime:
+            arrow_type = pyarrow.timestamp("us")
+        else:
+            arrow_type = getattr(pyarrow, ARROW_TYPES.get(annotation, "string"))()
+        fields.append(pyarrow.field(name, arrow_type, nullable=nullable))
+    return pyarrow.schema(fields)
+
+
+async def encode_parquet(
+    batches: AsyncGenerator[Sequence[BaseModel], None],
+    model: type[BaseModel],
+    pyarrow: ModuleType,
+) -> AsyncGenerator[bytes, None]:
+    schema = arrow_schema(model, pyarrow)
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(pyarrow.PythonFile(sink, mode="w"), schema)
+    try:
+        # Each batch becomes one row group, flushed as soon as it is written.
+        async with aclosing(batches):
+            async for batch in batches:
+                rows = [record.model_dump() for record in batch]
+                writer.write_batch(
+                    pyarrow.RecordBatch.from_pylist(rows, schema=schema),
+                    row_group_size=len(rows),
+                )
+                yield sink.take()
+    finally:
+        writer.close()
+    yield sink.take()
@@ -0,0 +1,173 @@
+"""Incremental parsing of bulk request bodies.
+
+Bodies are consumed chunk by chunk, so memory is bounded by the largest single
+record rather than by the payload size.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+
+T = TypeVar("T")
+
+NDJSON_MEDIA_TYPES = frozenset(
+    {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+)
+MAX_RECORD_BYTES = 1024 * 1024
+WHITESPACE = " \t\r\n"
+
+
+class InvalidPayloadError(ValueError):
+    """The body cannot be parsed any further."""
+
+
+@dataclass(frozen=True, slots=True)
+class InvalidRecord:
+    """A single NDJSON line that is not valid JSON; later lines are still read."""
+
+    message: str
+
+
+def is_ndjson(content_type: str) -> bool:
+    return content_type.split(";", 1)[0].strip().lower() in NDJSON_MEDIA_TYPES
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        if len(pending) > MAX_RECORD_BYTES:
+            msg = f"Record exceeds {MAX_RECORD_BYTES} bytes"
+            raise InvalidPayloadError(msg)
+        for line in lines:
+            if line.strip():
+                yield _parse_line(line)
+    if pending.strip():
+        yield _parse_line(pending)
+
+
+def _parse_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as exc:
+        return InvalidRecord(f"Invalid JSON: {exc}")
+
+
+class JSONArrayScanner:
+    """Feed-based scanner yielding the elements of a top-level JSON array."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+
+    def feed(self, data: bytes, *, final: bool = False) -> list[Any]:
+        try:
+            buffer = self._buffer + self._text.decode(data, final=final)
+        except UnicodeDecodeError as exc:
+            raise InvalidPayloadError(str(exc)) from exc
+        values: list[Any] = []
+        pos: int | None = 0
+        while pos is not None:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            consumed = pos
+            pos = self._step(buffer, pos, values, final=final)
+        self._buffer = buffer[consumed if pos is None else pos :]
+        if len(self._buffer) > MAX_RECORD_BYTES:
+            msg = f"Record exceeds {MAX_RECORD_BYTES} bytes"
+            raise InvalidPayloadError(msg)
+        if final and self._state != "end":
+            msg = "Unexpected end of JSON array"
+            raise InvalidPayloadError(msg)
+        return values
+
+    def _step(
+        self, buffer: str, pos: int, values: list[Any], *, final: bool
+    ) -> int | None:
+        """Consume one token at ``pos``; ``None`` means more data is needed."""
+        char = buffer[pos]
+        if self._state == "start":
+            if char != "[":
+                msg = "Expected a JSON array or NDJSON body"
+                raise InvalidPayloadError(msg)
+            self._state = "first"
+            return pos + 1
+        if self._state == "separator":
+            if char not in ",]":
+                msg = f"Expected ',' or ']' at offset {pos}"
+                raise InvalidPayloadError(msg)
+            self._state = "value" if char == "," else "end"
+            return pos + 1
+        if self._state == "first" and char == "]":
+            self._state = "end"
+            return pos + 1
+        if self._state == "end":
+            msg = "Unexpected data after the closing ']'"
+            raise InvalidPayloadError(msg)
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as exc:
+            if final:
+                raise InvalidPayloadError(str(exc)) from exc
+            return None
+        # A scalar is only complete once a delimiter follows it ("4." may
+        # still become "4.5"); objects, arrays and strings end unambiguously.
+        if (
+            char not in '{["'
+            and not final
+            and (end == len(buffer) or buffer[end] not in ",]" + WHITESPACE)
+        ):
+            return None
+        values.append(value)
+        self._state = "separator"
+        return end
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    scanner = JSONArrayScanner()
+    async for chunk in chunks:
+        for value in scanner.feed(chunk):
+            yield value
+    for value in scanner.feed(b"", final=True):
+        yield value
+
+
+def iter_records(chunks: AsyncIterable[bytes], content_type: str) -> AsyncIterator[Any]:
+    if is_ndjson(content_type):
+        return iter_ndjson(chunks)
+    return iter_json_array(chunks)
+
+
+async def chunked(items: AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    """Group ``items`` into lists of ``size``.
+
+    If the body turns out to be malformed, the records read before the error are
+    still yielded, so they are handled like any other chunk, and the error is
+    raised afterwards.
+    """
+    chunk: list[T] = []
+    try:
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    except InvalidPayloadError:
+        if chunk:
+            yield chunk
+        raise
+    if chunk:
+        yield chunk
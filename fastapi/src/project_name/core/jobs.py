@@ -0,0 +1,181 @@
+"""In-process background job queue for post-write side effects."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from project_name.core.config import Settings
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, eq=False)
+class Job:
+    func: Callable[..., Awaitable[Any]]
+    args: tuple[Any, ...]
+    attempts: int = 0
+    name: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.name = getattr(self.func, "__qualname__", repr(self.func))
+
+
+class JobQueue:
+    """Run coroutine functions on a fixed set of worker tasks.
+
+    ``enqueue`` never waits: it returns ``False`` and counts the job as dropped
+    when the queue already holds ``max_size`` jobs. A failing job is retried up
+    to ``max_attempts`` times in total, ``backoff * 2**(n - 1)`` seconds after
+    its n-th failure (at most ``max_backoff``). ``drain`` stops intake, runs
+    what is queued, including pending retries, for up to ``drain_timeout``
+    seconds, then stops the workers.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 2,
+        max_size: int = 1000,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        drain_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.drain_timeout = drain_timeout
+        self.processed = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.active = 0
+        self.closed = False
+        self._clock = clock
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(max_size)
+        # Enqueue times in queue order, so the oldest waiting job is at [0].
+        self._enqueued_at: collections.deque[float] = collections.deque()
+        self._retries: dict[Job, asyncio.TimerHandle] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> JobQueue:
+        return cls(
+            workers=settings.job_workers,
+            max_size=settings.job_queue_size,
+            max_attempts=settings.job_max_attempts,
+            backoff=settings.job_retry_backoff,
+            drain_timeout=settings.job_drain_timeout,
+        )
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def lag(self) -> float:
+        """Seconds the oldest queued job has been waiting for a worker."""
+        return self._clock() - self._enqueued_at[0] if self._enqueued_at else 0.0
+
+    def enqueue(self, func: Callable[..., Awaitable[Any]], *args: Any) -> bool:
+        job = Job(func, args)
+        if self.closed:
+            self.dropped += 1
+            logger.warning("Job queue is draining; dropped %s", job.name)
+            return False
+        return self._put(job)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "depth": self.depth,
+            "lag": self.lag,
+            "active": self.active,
+            "processed": self.processed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+        }
+
+    def start(self) -> None:
+        self.closed = False
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{index}")
+            for index in range(self.workers)
+        ]
+
+    async def drain(self) -> None:
+        self.closed = True
+        # Jobs waiting out a backoff run now rather than being lost.
+        for job, handle in self._retries.items():
+            handle.cancel()
+            self._put(job)
+        self._retries.clear()
+        try:
+            await asyncio.wait_for(self._queue.join(), self.drain_timeout)
+        except TimeoutError:
+            logger.warning(
+                "Job queue drain timed out; abandoning %d job(s)",
+                self.depth + self.active,
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def _put(self, job: Job) -> bool:
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("Job queue is full; dropped %s", job.name)
+            return False
+        self._enqueued_at.append(self._clock())
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._enqueued_at.popleft()
+            self.active += 1
+            try:
+                job.attempts += 1
+                await job.func(*job.args)
+            except Exception:
+                self._failed(job)
+            else:
+                self.processed += 1
+            finally:
+                self.active -= 1
+                self._queue.task_done()
+
+    def _failed(self, job: Job) -> None:
+        if job.attempts >= self.max_attempts:
+            self.failed += 1
+            logger.exception(
+                "Job %s failed after %d attempt(s)", job.name, job.attempts
+            )
+            return
+        self.retried += 1
+        if self.closed:
+            # Draining: retry straight away, before this attempt is marked done.
+            self._put(job)
+            return
+        delay = min(self.backoff * 2 ** (job.attempts - 1), self.max_backoff)
+        loop = asyncio.get_running_loop()
+        self._retries[job] = loop.call_later(delay, self._retry, job)
+
+    def _retry(self, job: Job) -> None:
+        del self._retries[job]
+        self._put(job)
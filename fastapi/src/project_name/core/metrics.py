@@ -0,0 +1,214 @@
+"""Request metrics in Prometheus text format.
+
+Metrics are kept per process: with several ``serve`` workers each one exposes
+its own numbers, so scrape every worker or run a single worker per pod.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+QUANTILES = (0.5, 0.95, 0.99)
+UNMATCHED_ROUTE = "<unmatched>"
+# Anything else a client sends would add a label value, so it shares "other".
+KNOWN_METHODS = frozenset(
+    {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "CONNECT", "TRACE"}
+)
+OTHER_METHOD = "other"
+
+
+@dataclass(slots=True)
+class Histogram:
+    buckets: tuple[float, ...] = LATENCY_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        # One slot per bucket plus the implicit +Inf bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> Iterator[tuple[float, int]]:
+        running = 0
+        for bound, count in zip(
+            (*self.buckets, float("inf")), self.counts, strict=True
+        ):
+            running += count
+            yield bound, running
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        previous = 0
+        for bound, running in self.cumulative():
+            if running >= rank:
+                if bound == float("inf"):
+                    return lower
+                in_bucket = running - previous
+                return lower + (bound - lower) * (rank - previous) / in_bucket
+            lower, previous = bound, running
+        return lower  # pragma: no cover - the +Inf bucket always matches
+
+
+@dataclass(slots=True)
+class RouteMetrics:
+    statuses: dict[str, int] = field(default_factory=dict)
+    latency: Histogram = field(default_factory=Histogram)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.routes: dict[tuple[str, str], RouteMetrics] = {}
+        self.in_flight = 0
+        self.gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+        self.counters: dict[str, tuple[str, Callable[[], float]]] = {}
+
+    def register_gauge(
+        self, name: str, description: str, read: Callable[[], float]
+    ) -> None:
+        """Export ``read()`` as a gauge, sampled on every scrape."""
+        self.gauges[name] = (description, read)
+
+    def register_counter(
+        self, name: str, description: str, read: Callable[[], float]
+    ) -> None:
+        """Export ``read()``, a monotonically increasing total, as a counter."""
+        self.counters[name] = (description, read)
+
+    def observe(self, method: str, route: str, status: int, duration: float) -> None:
+        metrics = self.routes.get((method, route))
+        if metrics is None:
+            metrics = self.routes[method, route] = RouteMetrics()
+        status_class = f"{status // 100}xx"
+        metrics.statuses[status_class] = metrics.statuses.get(status_class, 0) + 1
+        metrics.latency.observe(duration)
+
+    def render(self) -> str:
+        lines = [
+            "# HELP http_requests_in_flight Requests currently being served.",
+            "# TYPE http_requests_in_flight gauge",
+            f"http_requests_in_flight {self.in_flight}",
+        ]
+        for name, (description, read) in sorted(self.gauges.items()):
+            lines += [
+                f"# HELP {name} {description}",
+                f"# TYPE {name} gauge",
+                f"{name} {read()}",
+            ]
+        for name, (description, read) in sorted(self.counters.items()):
+            lines += [
+                f"# HELP {name} {description}",
+                f"# TYPE {name} counter",
+                f"{name} {read()}",
+            ]
+        lines += [
+            "# HELP http_requests_total Requests by route and status class.",
+            "# TYPE http_requests_total counter",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            for status_class, count in sorted(metrics.statuses.items()):
+                labels = _labels(method=method, route=route, status=status_class)
+                lines.append(f"http_requests_total{{{labels}}} {count}")
+        lines += [
+            "# HELP http_request_duration_seconds Request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        histogram_name = "http_request_duration_seconds"
+        for (method, route), metrics in routes:
+            labels = _labels(method=method, route=route)
+            histogram = metrics.latency
+            for bound, running in histogram.cumulative():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{histogram_name}_bucket{{{labels},le="{le}"}} {running}')
+            lines.append(f"{histogram_name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{histogram_name}_count{{{labels}}} {histogram.count}")
+        lines += [
+            "# HELP http_request_duration_quantile_seconds Latency quantiles "
+            "estimated from the histogram buckets.",
+            "# TYPE http_request_duration_quantile_seconds gauge",
+        ]
+        quantile_name = "http_request_duration_quantile_seconds"
+        for (method, route), metrics in routes:
+            for q in QUANTILES:
+                labels = _labels(method=method, route=route, quantile=str(q))
+                value = metrics.latency.quantile(q)
+                lines.append(f"{quantile_name}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware; labels requests with the matched route template."""
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        registry = self.registry
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry.in_flight += 1
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            registry.in_flight -= 1
+            # The router stores the matched route in the (shared) scope.
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            if method not in KNOWN_METHODS:
+                method = OTHER_METHOD
+            registry.observe(method, template, status, perf_counter() - start)
@@ -0,0 +1,63 @@
+"""Keyset pagination helpers."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from project_name.core.database import Row
+
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 1000
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last seen primary key as an opaque, URL-safe cursor."""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        last_id = json.loads(base64.urlsafe_b64decode(padded))["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as exc:
+        raise InvalidCursorError(cursor) from exc
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError(cursor)
+    return last_id
+
+
+@dataclass(slots=True)
+class Page(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def build_page(rows: list[Row], limit: int, factory: Callable[[Row], T]) -> Page[T]:
+    """Build a page from ``limit + 1`` rows; the extra row only signals more data."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]["id"]) if has_more and rows else None
+    return Page([factory(row) for row in rows], next_cursor)
+
+
+def page_key(
+    skip: int = 0, limit: int = 100, after: int | None = None
+) -> tuple[int, int, int | None]:
+    """Single-flight key for page reads, however their arguments were passed."""
+    return (skip, limit, after)
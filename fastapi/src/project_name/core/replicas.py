@@ -0,0 +1,207 @@
+"""Read replica routing with read-your-writes pinning."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import math
+import time
+from contextvars import ContextVar
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from typing import TYPE_CHECKING
+
+from starlette.datastructures import MutableHeaders
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+    from project_name.core.database import ConnectionPool
+
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_COOKIE = "db_primary_until"
+
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+_pinned_replica: ContextVar[ConnectionPool | None] = ContextVar(
+    "pinned_replica", default=None
+)
+
+
+def primary_pinned() -> bool:
+    return _primary_pinned.get()
+
+
+@contextlib.contextmanager
+def use_primary() -> Iterator[None]:
+    """Route every read in this context to the primary."""
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def pinned_replica() -> ConnectionPool | None:
+    return _pinned_replica.get()
+
+
+@contextlib.contextmanager
+def use_replica(pool: ConnectionPool) -> Iterator[None]:
+    """Route every read in this context to ``pool``, healthy or not."""
+    token = _pinned_replica.set(pool)
+    try:
+        yield
+    finally:
+        _pinned_replica.reset(token)
+
+
+class ReplicaSet:
+    """Least-busy routing over read replicas, ejecting those failing probes.
+
+    ``choose`` returns the healthy replica with the fewest connections in use,
+    rotating round-robin between equally busy ones. A replica is ejected after
+    ``failure_threshold`` consecutive failed probes (or failed connection
+    attempts) and readmitted by the first probe that succeeds.
+    """
+
+    def __init__(
+        self,
+        pools: Sequence[ConnectionPool],
+        *,
+        failure_threshold: int = 2,
+        probe_interval: float = 5.0,
+        probe_timeout: float = 1.0,
+    ) -> None:
+        self.pools = list(pools)
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.failures = [0] * len(self.pools)
+        self.healthy = [True] * len(self.pools)
+        self._next = 0
+        self._probes: asyncio.Task[None] | None = None
+
+    @property
+    def healthy_count(self) -> int:
+        return sum(self.healthy)
+
+    def choose(self) -> ConnectionPool | None:
+        best: int | None = None
+        for offset in range(len(self.pools)):
+            index = (self._next + offset) % len(self.pools)
+            if not self.healthy[index]:
+                continue
+            if best is None or self.pools[index].in_use < self.pools[best].in_use:
+                best = index
+        if best is None:
+            return None
+        self._next = (best + 1) % len(self.pools)
+        return self.pools[best]
+
+    def record_failure(self, pool: ConnectionPool) -> None:
+        index = self.pools.index(pool)
+        self.failures[index] += 1
+        if self.failures[index] >= self.failure_threshold:
+            self.healthy[index] = False
+
+    def record_success(self, pool: ConnectionPool) -> None:
+        index = self.pools.index(pool)
+        self.failures[index] = 0
+        self.healthy[index] = True
+
+    async def probe(self) -> None:
+        for pool in self.pools:
+            try:
+                async with asyncio.timeout(self.probe_timeout), pool.acquire() as conn:
+                    await conn.fetch_one("SELECT 1")
+            except Exception:  # any failure counts against the replica
+                self.record_failure(pool)
+            else:
+                self.record_success(pool)
+
+    async def _probe_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            await self.probe()
+
+    async def open(self) -> None:
+        # An unreachable replica must not stop the app from starting; it is
+        # ejected straight away and readmitted once a probe gets through.
+        for index, pool in enumerate(self.pools):
+            try:
+                await pool.open()
+            except Exception:  # any failure counts against the replica
+                self.failures[index] = self.failure_threshold
+                self.healthy[index] = False
+        self._probes = asyncio.create_task(self._probe_forever())
+
+    async def close(self) -> None:
+        if self._probes is not None:
+            self._probes.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probes
+            self._probes = None
+        for pool in self.pools:
+            await pool.close()
+
+
+class ReadYourWritesMiddleware:
+    """Pin unsafe requests, and a client's reads right after them, to the primary.
+
+    Non-``GET``/``HEAD``/``OPTIONS`` requests run with ``use_primary``, and a
+    successful one sets a cookie that keeps the same client's reads on the
+    primary for ``window`` seconds, long enough for replicas to catch up.
+    """
+
+    def __init__(
+        self, app: ASGIApp, *, window: float = 5.0, cookie_name: str = PRIMARY_COOKIE
+    ) -> None:
+        self.app = app
+        self.window = window
+        self.cookie_name = cookie_name
+
+    def recently_wrote(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name != b"cookie":
+                continue
+            cookie = SimpleCookie(value.decode("latin-1")).get(self.cookie_name)
+            if cookie is None:
+                continue
+            try:
+                return float(cookie.value) > time.time()
+            except ValueError:
+                return False
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] in SAFE_METHODS:
+            if self.recently_wrote(scope):
+                with use_primary():
+                    await self.app(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < HTTPStatus.BAD_REQUEST
+                and self.window > 0
+            ):
+                until = time.time() + self.window
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{self.cookie_name}={until:.3f}; Max-Age={math.ceil(self.window)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        with use_primary():
+            await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,89 @@
+"""Response classes: fast JSON and disconnect-safe streaming."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+from project_name.core.pagination import NEXT_CURSOR_HEADER
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from fastapi import Request, Response
+    from starlette.types import Receive, Scope, Send
+
+    from project_name.core.pagination import Page
+
+
+T = TypeVar("T")
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError
+
+
+@lru_cache(maxsize=64)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson.
+
+    Pydantic models are dumped as-is, without the ``response_model``
+    validation pass FastAPI applies to plain return values.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, list) and content and isinstance(content[0], BaseModel):
+            # Dump a whole page in one pydantic-core call instead of per item.
+            content = _list_adapter(type(content[0])).dump_python(content)
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+def fast_json_enabled(request: Request) -> bool:
+    return bool(getattr(request.app.state, "fast_json_responses", False))
+
+
+def page_response(
+    request: Request, response: Response, page: Page[T]
+) -> list[T] | Response:
+    """Return a list page, via ``FastJSONResponse`` when the app opted in.
+
+    Returning a response object bypasses ``response_model`` processing, while
+    the declared ``response_model`` still drives the OpenAPI schema.
+    """
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else {}
+    if fast_json_enabled(request):
+        return FastJSONResponse(page.items, headers=headers)
+    response.headers.update(headers)
+    return page.items
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """``StreamingResponse`` that closes its body however the stream ends.
+
+    When the client disconnects, Starlette abandons the body generator mid-way;
+    closing it here runs its cleanup (releasing a database cursor, leaving a
+    change feed) right away instead of whenever it is garbage collected.
+    """
+
+    def __init__(self, content: AsyncGenerator[bytes, None], **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.content = content
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self.content.aclose()
@@ -1 +1,197 @@
-"""Security helpers."""
+"""Password hashing and JWT access tokens."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import jwt
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from project_name.core.config import Settings
+
+
+T = TypeVar("T")
+
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha256"
+PASSWORD_HASH_ITERATIONS = 600_000
+
+
+class PasswordHasher:
+    """PBKDF2-SHA256 hashes stored as ``pbkdf2_sha256$<iterations>$<salt>$<hash>``.
+
+    The iteration count is read back from each hash, so raising it only affects
+    passwords set afterwards.
+    """
+
+    def __init__(self, iterations: int = PASSWORD_HASH_ITERATIONS) -> None:
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(16)
+        digest = self._derive(password, salt, self.iterations)
+        return "$".join(
+            (PASSWORD_HASH_ALGORITHM, str(self.iterations), _b64(salt), _b64(digest))
+        )
+
+    def verify(self, password: str, hashed: str) -> bool:
+        try:
+            algorithm, iterations, salt, digest = hashed.split("$")
+            if algorithm != PASSWORD_HASH_ALGORITHM:
+                return False
+            expected = _unb64(digest)
+            actual = self._derive(password, _unb64(salt), int(iterations))
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    @staticmethod
+    def _derive(password: str, salt: bytes, iterations: int) -> bytes:
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, iterations)
+
+
+class PasswordHashingPool:
+    """Run a ``PasswordHasher`` on a bounded thread pool.
+
+    A single hash takes hundreds of milliseconds by design; inline it would stall
+    every request on the event loop. ``hashlib.pbkdf2_hmac`` releases the GIL,
+    so ``max_workers`` threads hash in parallel. Further calls wait in the
+    executor queue, whose depth is reported by ``queued``.
+    """
+
+    def __init__(self, hasher: PasswordHasher, max_workers: int = 2) -> None:
+        self.hasher = hasher
+        self.max_workers = max_workers
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hash"
+        )
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.hasher.hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._run(self.hasher.verify, password, hashed)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.max_workers,
+            "queued": self.queued,
+            "active": self.active,
+            "completed": self.completed,
+        }
+
+    def shutdown(self) -> None:
+        # Requests awaiting a hash are done by now; don't block the event loop.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args: str) -> T:
+        with self._lock:
+            self.queued += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, args)
+
+    def _call(self, func: Callable[..., T], args: tuple[str, ...]) -> T:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class InvalidTokenError(Exception):
+    """The token is malformed, badly signed or expired."""
+
+
+class TokenService:
+    """Issue and verify HMAC-signed JWT access tokens.
+
+    Verified tokens are kept in a bounded LRU keyed by the token's digest until
+    their ``exp``, so a client repeating the same bearer token skips signature
+    verification and claim validation. ``cache_size=0`` disables the cache.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        *,
+        expires_in: timedelta = timedelta(minutes=30),
+        cache_size: int = 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.expires_in = expires_in
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._cache: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TokenService:
+        return cls(
+            settings.secret_key,
+            settings.algorithm,
+            expires_in=timedelta(minutes=settings.access_token_expire_minutes),
+            cache_size=settings.token_cache_size,
+        )
+
+    def issue(self, subject: str, **claims: Any) -> str:
+        now = datetime.fromtimestamp(self._clock(), UTC)
+        payload = {**claims, "sub": subject, "iat": now, "exp": now + self.expires_in}
+        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+
+    def verify(self, token: str) -> dict[str, Any]:
+        key = hashlib.blake2b(token.encode(), digest_size=32).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            claims, expires_at = cached
+            if self._clock() < expires_at:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return dict(claims)
+            del self._cache[key]
+        self.misses += 1
+        try:
+            claims = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+                options={"require": ["exp", "sub"]},
+            )
+        except jwt.PyJWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+        if self.cache_size:
+            self._cache[key] = (claims, float(claims["exp"]))
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return dict(claims)
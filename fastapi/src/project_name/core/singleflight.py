@@ -0,0 +1,116 @@
+"""Single-flight coalescing of concurrent identical reads."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+from project_name.core.replicas import primary_pinned
+
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable, Iterator
+
+
+T = TypeVar("T")
+MethodT = TypeVar("MethodT", bound="Callable[..., Awaitable[Any]]")
+
+_coalescing: ContextVar[bool] = ContextVar("coalescing", default=True)
+
+
+@contextlib.contextmanager
+def no_coalescing() -> Iterator[None]:
+    """Make every ``coalesce``-decorated call in this context run on its own."""
+    token = _coalescing.set(False)
+    try:
+        yield
+    finally:
+        _coalescing.reset(token)
+
+
+class SingleFlight:
+    """Share one in-flight call, and its result, among concurrent identical calls.
+
+    Only callers that arrive while the call is running share it; nothing is
+    kept once it finishes, so results are never older than a fresh call would
+    be. ``forget`` detaches a namespace's running calls after a write, so
+    later callers start a new one instead of joining a read that may predate
+    the write.
+    """
+
+    def __init__(self) -> None:
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: dict[tuple[Hashable, ...], asyncio.Task[Any]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self, key: tuple[Hashable, ...], func: Callable[[], Awaitable[T]]
+    ) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            self.executed += 1
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(functools.partial(self._finished, key))
+        else:
+            self.coalesced += 1
+        # Shielded so one caller giving up doesn't cancel the others' result.
+        result: T = await asyncio.shield(task)
+        return result
+
+    def forget(self, namespace: str) -> None:
+        for key in [key for key in self._calls if key[0] == namespace]:
+            del self._calls[key]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": self.in_flight,
+        }
+
+    def _finished(self, key: tuple[Hashable, ...], task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller was cancelled.
+            task.exception()
+
+
+def coalesce(
+    namespace: str, key: Callable[..., Hashable] | None = None
+) -> Callable[[MethodT], MethodT]:
+    """Coalesce concurrent calls of a service method through ``self.flights``.
+
+    Calls share a flight when ``key(*args, **kwargs)`` matches (by default the
+    arguments themselves) and they read from the same database, primary or
+    replica. Without ``self.flights`` or inside ``no_coalescing`` every call
+    runs on its own.
+    """
+
+    def decorator(method: MethodT) -> MethodT:
+        @functools.wraps(method)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            flights: SingleFlight | None = self.flights
+            if flights is None or not _coalescing.get():
+                return await method(self, *args, **kwargs)
+            call_key = (
+                key(*args, **kwargs)
+                if key is not None
+                else (args, tuple(sorted(kwargs.items())))
+            )
+            return await flights.do(
+                (namespace, method.__name__, primary_pinned(), call_key),
+                functools.partial(method, self, *args, **kwargs),
+            )
+
+        return cast("MethodT", wrapper)
+
+    return decorator
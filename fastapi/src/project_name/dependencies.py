@@ -4,34 +4,93 @@ from __future__ import annotations
 
 from typing import Annotated, Any
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, Request, status
 
+from project_name.core.changefeed import ChangeHub
 from project_name.core.config import Settings, get_settings
+from project_name.core.pagination import (
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    decode_cursor,
+)
+from project_name.core.security import InvalidTokenError, TokenService
 
 
-SettingsDep = Annotated[Settings, Depends(get_settings)]
+def get_app_settings(request: Request) -> Settings:
+    # The settings create_app() was built with, which tests and CLIs may pass in.
+    settings: Settings | None = getattr(request.app.state, "settings", None)
+    return settings or get_settings()
+
+
+SettingsDep = Annotated[Settings, Depends(get_app_settings)]
 
 
 class PaginationParams:
-    def __init__(self, skip: int = 0, limit: int = 100) -> None:
+    """``?after=<cursor>&limit=`` keyset pagination; ``skip`` is kept for old clients."""
+
+    def __init__(
+        self,
+        after: str | None = None,
+        skip: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[int, Query(ge=0)] = 100,
+    ) -> None:
+        try:
+            self.after = decode_cursor(after) if after else None
+        except InvalidCursorError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor",
+            ) from exc
         self.skip = skip
-        self.limit = min(limit, 1000)
+        self.limit = min(limit, MAX_PAGE_SIZE)
 
 
 PaginationDep = Annotated[PaginationParams, Depends()]
 
 
-def get_current_user(
+def get_token_service(request: Request) -> TokenService:
+    tokens: TokenService = request.app.state.tokens
+    return tokens
+
+
+TokenServiceDep = Annotated[TokenService, Depends(get_token_service)]
+
+
+def get_change_hub(request: Request) -> ChangeHub:
+    hub: ChangeHub = request.app.state.container.changes
+    return hub
+
+
+ChangeHubDep = Annotated[ChangeHub, Depends(get_change_hub)]
+
+
+def unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user(
+    tokens: TokenServiceDep,
     authorization: Annotated[str | None, Header()] = None,
-    settings: SettingsDep | None = None,
 ) -> dict[str, Any]:
+    # async so FastAPI doesn't hop to the threadpool; a cache hit is a dict lookup.
     if not authorization:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Authorization header required",
-        )
-    _ = settings
-    return {"user_id": 1, "email": "user@example.com"}
+        raise unauthorized("Authorization header required")
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise unauthorized("Bearer token required")
+    try:
+        claims = tokens.verify(token)
+    except InvalidTokenError as exc:
+        raise unauthorized("Invalid or expired token") from exc
+    try:
+        user_id = int(claims["sub"])
+    except ValueError as exc:
+        raise unauthorized("Invalid or expired token") from exc
+    return {"user_id": user_id, "email": claims.get("email")}
 
 
 CurrentUserDep = Annotated[dict[str, Any], Depends(get_current_user)]
@@ -1,18 +1,230 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
+from project_name.container import ServiceContainer
+from project_name.core.admission import (
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+    TokenBucketLimiter,
+)
+from project_name.core.compression import CompressionMiddleware
 from project_name.core.config import get_settings
-from project_name.routers import health, items, users
+from project_name.core.metrics import MetricsMiddleware, MetricsRegistry
+from project_name.core.replicas import ReadYourWritesMiddleware
+from project_name.core.responses import FastJSONResponse
+from project_name.core.security import TokenService
+from project_name.routers import auth, health, items, users
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from project_name.core.config import Settings
+
+
+ROUTE_GROUPS = {
+    "auth": "/api/v1/auth",
+    "users": "/api/v1/users",
+    "items": "/api/v1/items",
+}
+
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container = ServiceContainer.from_settings(app.state.settings)
+    app.state.container = container
+    app.state.response_cache = container.response_cache
+    if app.state.metrics is not None:
+        register_pool_gauges(app.state.metrics, container)
+    await container.startup()
+    try:
+        yield
+    finally:
+        await container.shutdown()
 
-def create_app() -> FastAPI:
-    settings = get_settings()
-    app = FastAPI(title=settings.app_name, version=settings.app_version)
+
+def register_pool_gauges(metrics: MetricsRegistry, container: ServiceContainer) -> None:
+    passwords = container.passwords
+    metrics.register_gauge(
+        "password_hash_queued",
+        "Password hashes waiting for a worker.",
+        lambda: passwords.queued,
+    )
+    metrics.register_gauge(
+        "password_hash_active",
+        "Password hashes being computed.",
+        lambda: passwords.active,
+    )
+    metrics.register_gauge(
+        "password_hash_workers",
+        "Size of the password hashing pool.",
+        lambda: passwords.max_workers,
+    )
+    replicas = container.database.replicas
+    if replicas is not None:
+        metrics.register_gauge(
+            "database_replicas_healthy",
+            "Read replicas currently passing health probes.",
+            lambda: replicas.healthy_count,
+        )
+    jobs = container.jobs
+    metrics.register_gauge(
+        "job_queue_depth", "Background jobs waiting for a worker.", lambda: jobs.depth
+    )
+    metrics.register_gauge(
+        "job_queue_lag_seconds",
+        "Seconds the oldest queued background job has waited.",
+        lambda: jobs.lag,
+    )
+    metrics.register_gauge(
+        "job_queue_active", "Background jobs being run.", lambda: jobs.active
+    )
+    metrics.register_counter(
+        "jobs_processed_total", "Background jobs completed.", lambda: jobs.processed
+    )
+    metrics.register_counter(
+        "jobs_retried_total", "Background job attempts retried.", lambda: jobs.retried
+    )
+    metrics.register_counter(
+        "jobs_failed_total",
+        "Background jobs that failed every attempt.",
+        lambda: jobs.failed,
+    )
+    metrics.register_counter(
+        "jobs_dropped_total",
+        "Background jobs refused by a full or draining queue.",
+        lambda: jobs.dropped,
+    )
+    changes = container.changes
+    metrics.register_gauge(
+        "change_feed_subscribers",
+        "Open user and item change-feed streams.",
+        lambda: changes.subscribers,
+    )
+    metrics.register_counter(
+        "change_feed_events_total",
+        "Change events published to the feeds.",
+        lambda: changes.published,
+    )
+    metrics.register_counter(
+        "change_feed_coalesced_total",
+        "Pending change events replaced by a newer one for the same record.",
+        lambda: changes.coalesced,
+    )
+    metrics.register_counter(
+        "change_feed_dropped_total",
+        "Change-feed subscribers disconnected for falling too far behind.",
+        lambda: changes.dropped,
+    )
+    cache = container.response_cache
+    if cache is not None:
+        stats = cache.stats
+        metrics.register_counter(
+            "response_cache_hits_total",
+            "Cacheable GET requests answered from the response cache.",
+            lambda: stats.hits,
+        )
+        metrics.register_counter(
+            "response_cache_misses_total",
+            "Cacheable GET requests that had to run the endpoint.",
+            lambda: stats.misses,
+        )
+        metrics.register_counter(
+            "response_cache_not_modified_total",
+            "Cache hits answered 304 Not Modified for a matching If-None-Match.",
+            lambda: stats.not_modified,
+        )
+    flights = container.flights
+    if flights is not None:
+        metrics.register_counter(
+            "single_flight_executed_total",
+            "Service reads that ran a query.",
+            lambda: flights.executed,
+        )
+        metrics.register_counter(
+            "single_flight_coalesced_total",
+            "Service reads that shared an identical in-flight query.",
+            lambda: flights.coalesced,
+        )
+
+
+def create_app(settings: Settings | None = None) -> FastAPI:
+    settings = settings or get_settings()
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        lifespan=lifespan,
+        default_response_class=(
+            FastJSONResponse if settings.fast_json_responses else JSONResponse
+        ),
+    )
+    app.state.settings = settings
+    app.state.fast_json_responses = settings.fast_json_responses
+    app.state.tokens = TokenService.from_settings(settings)
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            gzip_level=settings.compression_gzip_level,
+            brotli_quality=settings.compression_brotli_quality,
+            cache_paths=settings.compression_cache_paths,
+        )
+    # GETs may read from a replica; writes and reads right after them may not.
+    if settings.database_read_urls:
+        app.add_middleware(
+            ReadYourWritesMiddleware, window=settings.database_read_your_writes_window
+        )
+    # Admission control sits outside compression so shed requests cost nothing.
+    add_admission_control(app, settings)
+    # Added last so it is outermost and also counts shed requests.
+    app.state.metrics = MetricsRegistry() if settings.metrics_enabled else None
+    if app.state.metrics is not None:
+        app.add_middleware(MetricsMiddleware, registry=app.state.metrics)
     app.include_router(health.router, tags=["health"])
-    app.include_router(users.router, prefix="/api/v1/users", tags=["users"])
-    app.include_router(items.router, prefix="/api/v1/items", tags=["items"])
+    app.include_router(auth.router, prefix=ROUTE_GROUPS["auth"], tags=["auth"])
+    app.include_router(users.router, prefix=ROUTE_GROUPS["users"], tags=["users"])
+    app.include_router(items.router, prefix=ROUTE_GROUPS["items"], tags=["items"])
     return app
 
 
+def add_admission_control(app: FastAPI, settings: Settings) -> None:
+    unknown = settings.admission_group_concurrency.keys() - ROUTE_GROUPS.keys()
+    if unknown:
+        msg = f"Unknown admission route groups: {', '.join(sorted(unknown))}"
+        raise ValueError(msg)
+
+    def limiter(limit: int) -> ConcurrencyLimiter:
+        return ConcurrencyLimiter(
+            limit,
+            queue_size=settings.admission_queue_size,
+            queue_timeout=settings.admission_queue_timeout,
+        )
+
+    global_limit = settings.admission_max_concurrency
+    groups = {
+        ROUTE_GROUPS[name]: limiter(limit)
+        for name, limit in settings.admission_group_concurrency.items()
+    }
+    rate = settings.rate_limit_per_second
+    if global_limit is None and not groups and rate is None:
+        return
+    app.add_middleware(
+        AdmissionMiddleware,
+        limiter=limiter(global_limit) if global_limit is not None else None,
+        groups=groups,
+        rate_limiter=(
+            TokenBucketLimiter(rate, settings.rate_limit_burst)
+            if rate is not None
+            else None
+        ),
+        exempt_paths=settings.admission_exempt_paths,
+        retry_after=settings.admission_retry_after,
+    )
+
+
 app = create_app()
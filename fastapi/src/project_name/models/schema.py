@@ -0,0 +1,39 @@
+"""Table definitions.
+
+Created directly only for in-memory databases; anything persistent gets the
+same tables from the Alembic migrations in ``alembic/versions``, so a change
+here needs a matching migration.
+"""
+
+from __future__ import annotations
+
+
+ID_COLUMNS = {
+    "sqlite": "INTEGER PRIMARY KEY AUTOINCREMENT",
+    "postgresql": "BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY",
+}
+
+TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id {id_column},
+        email VARCHAR(320) NOT NULL UNIQUE,
+        name VARCHAR(100) NOT NULL,
+        is_active BOOLEAN NOT NULL DEFAULT TRUE,
+        hashed_password VARCHAR(255),
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS items (
+        id {id_column},
+        name VARCHAR(100) NOT NULL,
+        description TEXT
+    )
+    """,
+)
+
+
+def schema_statements(dialect: str) -> list[str]:
+    return [table.format(id_column=ID_COLUMNS[dialect]) for table in TABLES]
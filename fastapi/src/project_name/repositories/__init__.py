@@ -1 +1,7 @@
 """Repository layer."""
+
+from project_name.repositories.item_repository import ItemRepository
+from project_name.repositories.user_repository import UserRepository
+
+
+__all__ = ["ItemRepository", "UserRepository"]
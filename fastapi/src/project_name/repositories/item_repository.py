@@ -0,0 +1,95 @@
+"""Item repository."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+
+    from project_name.core.database import Database, Row
+
+
+COLUMNS = "id, name, description"
+UPDATABLE_COLUMNS = ("name", "description")
+
+
+class ItemRepository:
+    def __init__(self, database: Database) -> None:
+        self.database = database
+
+    async def list_page(
+        self, *, after: int | None = None, skip: int = 0, limit: int = 100
+    ) -> list[Row]:
+        # ``id > ?`` is a primary-key range scan, so deep pages cost the same as
+        # the first one; ``skip`` keeps the old offset behaviour working.
+        where, params = ("WHERE id > ? ", (after,)) if after is not None else ("", ())
+        async with self.database.read_connection() as connection:
+            return await connection.fetch_all(
+                f"SELECT {COLUMNS} FROM items {where}ORDER BY id LIMIT ? OFFSET ?",
+                (*params, limit, skip),
+            )
+
+    async def iter_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncGenerator[list[Row], None]:
+        """Yield every item in id order, ``batch_size`` rows at a time.
+
+        Each batch is its own keyset query, so no connection is held while the
+        consumer is busy with a batch (an in-memory database has only one).
+        """
+        after = None
+        while True:
+            batch = await self.list_page(after=after, limit=batch_size)
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after = batch[-1]["id"]
+
+    async def get(self, item_id: int) -> Row | None:
+        async with self.database.read_connection() as connection:
+            return await connection.fetch_one(
+                f"SELECT {COLUMNS} FROM items WHERE id = ?",
+                (item_id,),
+            )
+
+    async def create(self, *, name: str, description: str | None) -> Row:
+        async with self.database.connection() as connection:
+            row = await connection.fetch_one(
+                f"INSERT INTO items (name, description) VALUES (?, ?) RETURNING {COLUMNS}",
+                (name, description),
+            )
+        assert row is not None
+        return row
+
+    async def create_many(self, items: Sequence[tuple[str, str | None]]) -> list[Row]:
+        """Insert ``(name, description)`` rows in one statement and transaction."""
+        values = ", ".join(["(?, ?)"] * len(items))
+        async with self.database.transaction() as connection:
+            rows = await connection.fetch_all(
+                f"INSERT INTO items (name, description) VALUES {values} "
+                f"RETURNING {COLUMNS}",
+                [value for item in items for value in item],
+            )
+        # RETURNING order is unspecified; ids are assigned in VALUES order.
+        return sorted(rows, key=lambda row: row["id"])
+
+    async def update(self, item_id: int, values: dict[str, Any]) -> Row | None:
+        columns = [column for column in UPDATABLE_COLUMNS if column in values]
+        if not columns:
+            return await self.get(item_id)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        async with self.database.connection() as connection:
+            return await connection.fetch_one(
+                f"UPDATE items SET {assignments} WHERE id = ? RETURNING {COLUMNS}",
+                (*(values[column] for column in columns), item_id),
+            )
+
+    async def delete(self, item_id: int) -> bool:
+        async with self.database.connection() as connection:
+            return (
+                await connection.execute("DELETE FROM items WHERE id = ?", (item_id,))
+                > 0
+            )
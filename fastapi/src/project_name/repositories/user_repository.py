@@ -0,0 +1,115 @@
+"""User repository."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+
+    from project_name.core.database import Database, Row
+
+
+COLUMNS = "id, email, name, is_active, created_at, updated_at"
+UPDATABLE_COLUMNS = ("email", "name", "is_active", "hashed_password")
+
+
+class UserRepository:
+    def __init__(self, database: Database) -> None:
+        self.database = database
+
+    async def list_page(
+        self, *, after: int | None = None, skip: int = 0, limit: int = 100
+    ) -> list[Row]:
+        # ``id > ?`` is a primary-key range scan, so deep pages cost the same as
+        # the first one; ``skip`` keeps the old offset behaviour working.
+        where, params = ("WHERE id > ? ", (after,)) if after is not None else ("", ())
+        async with self.database.read_connection() as connection:
+            return await connection.fetch_all(
+                f"SELECT {COLUMNS} FROM users {where}ORDER BY id LIMIT ? OFFSET ?",
+                (*params, limit, skip),
+            )
+
+    async def iter_batches(
+        self, batch_size: int = 1000
+    ) -> AsyncGenerator[list[Row], None]:
+        """Yield every user in id order, ``batch_size`` rows at a time.
+
+        Each batch is its own keyset query, so no connection is held while the
+        consumer is busy with a batch (an in-memory database has only one).
+        """
+        after = None
+        while True:
+            batch = await self.list_page(after=after, limit=batch_size)
+            if batch:
+                yield batch
+            if len(batch) < batch_size:
+                return
+            after = batch[-1]["id"]
+
+    async def get(self, user_id: int) -> Row | None:
+        async with self.database.read_connection() as connection:
+            return await connection.fetch_one(
+                f"SELECT {COLUMNS} FROM users WHERE id = ?",
+                (user_id,),
+            )
+
+    async def get_credentials(self, email: str) -> Row | None:
+        async with self.database.connection() as connection:
+            return await connection.fetch_one(
+                "SELECT id, email, is_active, hashed_password FROM users WHERE email = ?",
+                (email,),
+            )
+
+    async def create(
+        self,
+        *,
+        email: str,
+        name: str,
+        is_active: bool,
+        hashed_password: str | None = None,
+    ) -> Row:
+        async with self.database.connection() as connection:
+            row = await connection.fetch_one(
+                "INSERT INTO users (email, name, is_active, hashed_password) "
+                f"VALUES (?, ?, ?, ?) RETURNING {COLUMNS}",
+                (email, name, is_active, hashed_password),
+            )
+        assert row is not None
+        return row
+
+    async def create_many(
+        self, users: Sequence[tuple[str, str, bool, str | None]]
+    ) -> list[Row]:
+        """Insert ``(email, name, is_active, hashed_password)`` rows at once.
+
+        All rows go in one statement and transaction. Rows whose email is already
+        taken are skipped and absent from the result.
+        """
+        values = ", ".join(["(?, ?, ?, ?)"] * len(users))
+        async with self.database.transaction() as connection:
+            return await connection.fetch_all(
+                f"INSERT INTO users (email, name, is_active, hashed_password) "
+                f"VALUES {values} ON CONFLICT (email) DO NOTHING RETURNING {COLUMNS}",
+                [value for user in users for value in user],
+            )
+
+    async def update(self, user_id: int, values: dict[str, Any]) -> Row | None:
+        columns = [column for column in UPDATABLE_COLUMNS if column in values]
+        if not columns:
+            return await self.get(user_id)
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        async with self.database.connection() as connection:
+            return await connection.fetch_one(
+                f"UPDATE users SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+                f"WHERE id = ? RETURNING {COLUMNS}",
+                (*(values[column] for column in columns), user_id),
+            )
+
+    async def delete(self, user_id: int) -> bool:
+        async with self.database.connection() as connection:
+            return (
+                await connection.execute("DELETE FROM users WHERE id = ?", (user_id,))
+                > 0
+            )
@@ -1,6 +1,6 @@
 """API routers."""
 
-from project_name.routers import health, items, users
+from project_name.routers import auth, health, items, users
 
 
-__all__ = ["health", "items", "users"]
+__all__ = ["auth", "health", "items", "users"]
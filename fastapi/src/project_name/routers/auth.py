@@ -0,0 +1,31 @@
+"""Authentication endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, HTTPException, status
+
+from project_name.dependencies import TokenServiceDep  # noqa: TC001 - resolved by FastAPI
+from project_name.routers.users import UserServiceDep  # noqa: TC001 - resolved by FastAPI
+from project_name.schemas.auth import TokenRequest, TokenResponse
+
+
+router = APIRouter()
+
+
+@router.post("/token", response_model=TokenResponse)
+async def issue_token(
+    credentials: TokenRequest,
+    users: UserServiceDep,
+    tokens: TokenServiceDep,
+) -> TokenResponse:
+    user = await users.authenticate(credentials.email, credentials.password)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return TokenResponse(
+        access_token=tokens.issue(str(user.id), email=user.email),
+        expires_in=int(tokens.expires_in.total_seconds()),
+    )
@@ -0,0 +1,70 @@
+"""Shared pieces of the bulk ingest endpoints."""
+
+from __future__ import annotations
+
+import tempfile
+from typing import IO, TYPE_CHECKING, Any
+
+from fastapi.responses import StreamingResponse
+
+from project_name.services.bulk import encode_results
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+    from project_name.schemas.bulk import BulkRowResult
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Results beyond this size are spooled to disk instead of held in memory.
+SPOOL_MAX_BYTES = 1024 * 1024
+READ_SIZE = 64 * 1024
+
+BULK_OPENAPI: dict[str, Any] = {
+    "requestBody": {
+        "required": True,
+        "description": (
+            "A JSON array or newline-delimited JSON objects. "
+            "Rows are validated and inserted in chunks."
+        ),
+        "content": {
+            "application/json": {"schema": {"type": "array", "items": {}}},
+            NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}},
+        },
+    },
+    "responses": {
+        "200": {
+            "description": (
+                "One result line per input row, then a summary line "
+                '(`{"summary": {"created": n, "failed": n}}`).'
+            ),
+            "content": {NDJSON_MEDIA_TYPE: {"schema": {"type": "string"}}},
+        }
+    },
+}
+
+
+def iter_spool(spool: IO[bytes]) -> Iterator[bytes]:
+    try:
+        while block := spool.read(READ_SIZE):
+            yield block
+    finally:
+        spool.close()
+
+
+async def bulk_response(results: AsyncIterator[BulkRowResult]) -> StreamingResponse:
+    """Run the whole ingest, then stream the spooled per-row results back.
+
+    The body is consumed before the response starts: reading it from inside a
+    streaming response would race Starlette's disconnect listener for messages.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)  # noqa: SIM115
+    try:
+        async for line in encode_results(results):
+            spool.write(line)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return StreamingResponse(iter_spool(spool), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,49 @@
+"""Shared pieces of the change-feed streaming endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException, status
+
+from project_name.core.changefeed import SSE_MEDIA_TYPE, HubFullError
+from project_name.core.responses import ClosingStreamingResponse
+
+
+if TYPE_CHECKING:
+    from project_name.core.changefeed import ChangeHub
+
+
+CHANGE_FEED_OPENAPI: dict[str, Any] = {
+    "responses": {
+        "200": {
+            "description": (
+                "Server-Sent Events, one per write: `event` is `created`, "
+                "`updated` or `deleted`, `data` the record as JSON (only its "
+                "`id` for deletes). Send `Last-Event-ID` when reconnecting to "
+                "receive the events missed meanwhile, or a `reset` event when "
+                "they are no longer kept: refetch, then apply what follows."
+            ),
+            "content": {SSE_MEDIA_TYPE: {"schema": {"type": "string"}}},
+        },
+        "503": {"description": "This worker already serves its maximum of feeds."},
+    },
+}
+
+
+def change_feed_response(
+    hub: ChangeHub, topic: str, last_event_id: int | None
+) -> ClosingStreamingResponse:
+    try:
+        subscription = hub.subscribe(topic, last_event_id)
+    except HubFullError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many change-feed subscribers",
+        ) from exc
+    return ClosingStreamingResponse(
+        hub.stream(subscription),
+        media_type=SSE_MEDIA_TYPE,
+        # Proxies such as nginx must pass events through as they are written.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,60 @@
+"""Shared pieces of the streaming export endpoints."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fastapi import HTTPException, status
+
+from project_name.core.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    ExportUnavailableError,
+    encode,
+)
+from project_name.core.responses import ClosingStreamingResponse
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Sequence
+
+    from pydantic import BaseModel
+
+
+EXPORT_OPENAPI: dict[str, Any] = {
+    "responses": {
+        "200": {
+            "description": (
+                "Every row, streamed in id order as CSV (with a header row), "
+                "newline-delimited JSON or Parquet (one row group per batch)."
+            ),
+            "content": {
+                media_type: {"schema": {"type": "string", "format": "binary"}}
+                for media_type in EXPORT_MEDIA_TYPES.values()
+            },
+        },
+        "501": {"description": "Parquet requested without pyarrow installed."},
+    },
+}
+
+
+def export_response(
+    name: str,
+    batches: AsyncGenerator[Sequence[BaseModel], None],
+    model: type[BaseModel],
+    export_format: ExportFormat,
+) -> ClosingStreamingResponse:
+    """Stream ``batches`` as they are fetched; nothing is buffered up front."""
+    try:
+        body = encode(batches, model, export_format)
+    except ExportUnavailableError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc)
+        ) from exc
+    return ClosingStreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"'
+        },
+    )
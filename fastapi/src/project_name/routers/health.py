@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 
 
 router = APIRouter()
 
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
 
 class HealthResponse(BaseModel):
     status: str
@@ -20,5 +23,23 @@ async def health_check() -> HealthResponse:
 
 
 @router.get("/ready")
-async def readiness_check() -> dict[str, str]:
+async def readiness_check(request: Request, response: Response) -> dict[str, str]:
+    container = getattr(request.app.state, "container", None)
+    if container is None or not container.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "starting"}
     return {"status": "ready"}
+
+
+@router.get("/health/cache")
+async def cache_stats(request: Request) -> dict[str, float]:
+    cache = request.app.state.response_cache
+    return cache.stats.as_dict() if cache is not None else {}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request) -> PlainTextResponse:
+    registry = getattr(request.app.state, "metrics", None)
+    if registry is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
@@ -4,27 +4,127 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
-from project_name.schemas.item import ItemCreate, ItemRead
+from project_name.core.cache import CachedRoute, cache_response
+from project_name.core.export import ExportFormat  # noqa: TC001 - resolved by FastAPI
+from project_name.core.ingest import iter_records
+from project_name.core.responses import page_response
+from project_name.dependencies import (  # noqa: TC001 - resolved by FastAPI
+    ChangeHubDep,
+    PaginationDep,
+    SettingsDep,
+)
+from project_name.routers.bulk import BULK_OPENAPI, bulk_response
+from project_name.routers.changefeed import CHANGE_FEED_OPENAPI, change_feed_response
+from project_name.routers.export import EXPORT_OPENAPI, export_response
+from project_name.schemas.item import ItemCreate, ItemRead, ItemUpdate
 from project_name.services.item_service import ItemService
 
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
-def get_item_service() -> ItemService:
-    return ItemService()
+def get_item_service(request: Request) -> ItemService:
+    service: ItemService = request.app.state.container.items
+    return service
 
 
 ItemServiceDep = Annotated[ItemService, Depends(get_item_service)]
 
 
 @router.get("/", response_model=list[ItemRead])
-async def list_items(service: ItemServiceDep) -> list[ItemRead]:
-    return await service.list_items()
+@cache_response("items", ttl=30)
+async def list_items(
+    request: Request,
+    response: Response,
+    service: ItemServiceDep,
+    pagination: PaginationDep,
+) -> list[ItemRead] | Response:
+    page = await service.list_items(
+        skip=pagination.skip, limit=pagination.limit, after=pagination.after
+    )
+    return page_response(request, response, page)
 
 
 @router.post("/", response_model=ItemRead, status_code=status.HTTP_201_CREATED)
 async def create_item(item_in: ItemCreate, service: ItemServiceDep) -> ItemRead:
     return await service.create_item(item_in)
+
+
+@router.post("/bulk", response_class=StreamingResponse, openapi_extra=BULK_OPENAPI)
+async def create_items(
+    request: Request,
+    service: ItemServiceDep,
+    settings: SettingsDep,
+) -> StreamingResponse:
+    records = iter_records(request.stream(), request.headers.get("content-type", ""))
+    results = service.create_items(records, chunk_size=settings.bulk_chunk_size)
+    return await bulk_response(results)
+
+
+@router.get("/export", response_class=StreamingResponse, openapi_extra=EXPORT_OPENAPI)
+async def export_items(
+    service: ItemServiceDep,
+    settings: SettingsDep,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "csv",
+) -> StreamingResponse:
+    batches = service.export_items(batch_size=settings.export_batch_size)
+    return export_response("items", batches, ItemRead, export_format)
+
+
+@router.get(
+    "/stream", response_class=StreamingResponse, openapi_extra=CHANGE_FEED_OPENAPI
+)
+async def stream_items(
+    hub: ChangeHubDep,
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> StreamingResponse:
+    return change_feed_response(hub, "items", last_event_id)
+
+
+@router.get("/{item_id}", response_model=ItemRead)
+@cache_response("items", ttl=60)
+async def get_item(item_id: int, service: ItemServiceDep) -> ItemRead:
+    item = await service.get_item(item_id)
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found",
+        )
+    return item
+
+
+@router.patch("/{item_id}", response_model=ItemRead)
+async def update_item(
+    item_id: int,
+    item_in: ItemUpdate,
+    service: ItemServiceDep,
+) -> ItemRead:
+    item = await service.update_item(item_id, item_in)
+    if not item:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found",
+        )
+    return item
+
+
+@router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_item(item_id: int, service: ItemServiceDep) -> None:
+    deleted = await service.delete_item(item_id)
+    if not deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Item not found",
+        )
@@ -4,29 +4,65 @@ from __future__ import annotations
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from project_name.core.cache import CachedRoute, cache_response
+from project_name.core.export import ExportFormat  # noqa: TC001 - resolved by FastAPI
+from project_name.core.ingest import iter_records
+from project_name.core.responses import page_response
+from project_name.dependencies import (  # noqa: TC001 - resolved by FastAPI
+    ChangeHubDep,
+    CurrentUserDep,
+    PaginationDep,
+    SettingsDep,
+)
+from project_name.routers.bulk import BULK_OPENAPI, bulk_response
+from project_name.routers.changefeed import CHANGE_FEED_OPENAPI, change_feed_response
+from project_name.routers.export import EXPORT_OPENAPI, export_response
 from project_name.schemas.user import UserCreate, UserRead, UserUpdate
-from project_name.services.user_service import UserService
+from project_name.services.user_service import EmailAlreadyRegisteredError, UserService
+
 
+router = APIRouter(route_class=CachedRoute)
 
-router = APIRouter()
 
+def get_user_service(request: Request) -> UserService:
+    service: UserService = request.app.state.container.users
+    return service
 
-def get_user_service() -> UserService:
-    return UserService()
+
+def email_conflict() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="Email already registered",
+    )
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 
 
 @router.get("/", response_model=list[UserRead])
+@cache_response("users", ttl=30)
 async def list_users(
+    request: Request,
+    response: Response,
     service: UserServiceDep,
-    skip: int = 0,
-    limit: int = 100,
-) -> list[UserRead]:
-    return await service.get_users(skip=skip, limit=limit)
+    pagination: PaginationDep,
+) -> list[UserRead] | Response:
+    page = await service.get_users(
+        skip=pagination.skip, limit=pagination.limit, after=pagination.after
+    )
+    return page_response(request, response, page)
 
 
 @router.post("/", response_model=UserRead, status_code=status.HTTP_201_CREATED)
@@ -34,10 +70,59 @@ async def create_user(
     user_in: UserCreate,
     service: UserServiceDep,
 ) -> UserRead:
-    return await service.create_user(user_in)
+    try:
+        return await service.create_user(user_in)
+    except EmailAlreadyRegisteredError as exc:
+        raise email_conflict() from exc
+
+
+@router.post("/bulk", response_class=StreamingResponse, openapi_extra=BULK_OPENAPI)
+async def create_users(
+    request: Request,
+    service: UserServiceDep,
+    settings: SettingsDep,
+) -> StreamingResponse:
+    records = iter_records(request.stream(), request.headers.get("content-type", ""))
+    results = service.create_users(records, chunk_size=settings.bulk_chunk_size)
+    return await bulk_response(results)
+
+
+@router.get("/export", response_class=StreamingResponse, openapi_extra=EXPORT_OPENAPI)
+async def export_users(
+    service: UserServiceDep,
+    settings: SettingsDep,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "csv",
+) -> StreamingResponse:
+    batches = service.export_users(batch_size=settings.export_batch_size)
+    return export_response("users", batches, UserRead, export_format)
+
+
+@router.get(
+    "/stream", response_class=StreamingResponse, openapi_extra=CHANGE_FEED_OPENAPI
+)
+async def stream_users(
+    hub: ChangeHubDep,
+    last_event_id: Annotated[int | None, Header()] = None,
+) -> StreamingResponse:
+    return change_feed_response(hub, "users", last_event_id)
+
+
+@router.get("/me", response_model=UserRead)
+async def read_current_user(
+    current_user: CurrentUserDep,
+    service: UserServiceDep,
+) -> UserRead:
+    user = await service.get_user(current_user["user_id"])
+    if not user or not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found",
+        )
+    return user
 
 
 @router.get("/{user_id}", response_model=UserRead)
+@cache_response("users", ttl=60)
 async def get_user(
     user_id: int,
     service: UserServiceDep,
@@ -57,7 +142,10 @@ async def update_user(
     user_in: UserUpdate,
     service: UserServiceDep,
 ) -> UserRead:
-    user = await service.update_user(user_id, user_in)
+    try:
+        user = await service.update_user(user_id, user_in)
+    except EmailAlreadyRegisteredError as exc:
+        raise email_conflict() from exc
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,12 +1,19 @@
 """Pydantic schemas."""
 
-from project_name.schemas.item import ItemCreate, ItemRead
+from project_name.schemas.auth import TokenRequest, TokenResponse
+from project_name.schemas.bulk import BulkRowResult, BulkSummary
+from project_name.schemas.item import ItemCreate, ItemRead, ItemUpdate
 from project_name.schemas.user import UserCreate, UserRead, UserUpdate
 
 
 __all__ = [
+    "BulkRowResult",
+    "BulkSummary",
     "ItemCreate",
     "ItemRead",
+    "ItemUpdate",
+    "TokenRequest",
+    "TokenResponse",
     "UserCreate",
     "UserRead",
     "UserUpdate",
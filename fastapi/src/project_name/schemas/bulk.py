@@ -0,0 +1,20 @@
+"""Bulk ingest schemas."""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class BulkRowResult(BaseModel):
+    index: int
+    status: Literal["created", "error"]
+    id: int | None = None
+    errors: list[str] | None = None
+
+
+class BulkSummary(BaseModel):
+    created: int
+    failed: int
+    error: str | None = None
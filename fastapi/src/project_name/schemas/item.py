@@ -10,5 +10,10 @@ class ItemCreate(BaseModel):
     description: str | None = None
 
 
+class ItemUpdate(BaseModel):
+    name: str | None = Field(default=None, min_length=1, max_length=100)
+    description: str | None = None
+
+
 class ItemRead(ItemCreate):
     id: int
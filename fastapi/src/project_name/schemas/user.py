@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from datetime import datetime  # noqa: TC003
+from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, WithJsonSchema
+
+
+# Emails read back from the database were validated on write. Re-checking them
+# with ``EmailStr`` costs ~150us per row, more than the rest of a list request.
+StoredEmail = Annotated[str, WithJsonSchema({"type": "string", "format": "email"})]
 
 
 class UserBase(BaseModel):
@@ -19,14 +25,15 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     email: EmailStr | None = None
-    name: str | None = Field(None, min_length=1, max_length=100)
+    name: str | None = Field(default=None, min_length=1, max_length=100)
     is_active: bool | None = None
-    password: str | None = None
+    password: str | None = Field(default=None, min_length=8, max_length=100)
 
 
 class UserRead(UserBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
+    email: StoredEmail
     created_at: datetime
     updated_at: datetime
@@ -0,0 +1,14 @@
+"""Audit trail of user writes, recorded off the request path."""
+
+from __future__ import annotations
+
+import logging
+
+
+logger = logging.getLogger("project_name.audit")
+
+
+async def record_user_event(action: str, *user_ids: int) -> None:
+    """Run on the job queue after a user is created, updated or deleted."""
+    for user_id in user_ids:
+        logger.info("user.%s", action, extra={"action": action, "user_id": user_id})
@@ -0,0 +1,92 @@
+"""Chunked bulk creation shared by the user and item services."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from project_name.core.database import DatabaseError
+from project_name.core.ingest import InvalidPayloadError, InvalidRecord, chunked
+from project_name.schemas.bulk import BulkRowResult, BulkSummary
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+
+    from project_name.core.database import Row
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def validation_errors(exc: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc']) or 'body'}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+async def bulk_create(
+    records: AsyncIterable[Any],
+    schema: type[ModelT],
+    insert_chunk: Callable[[list[ModelT]], Awaitable[list[Row | str]]],
+    chunk_size: int,
+) -> AsyncIterator[BulkRowResult]:
+    """Validate ``records`` with ``schema`` and insert them ``chunk_size`` at a time.
+
+    ``insert_chunk`` returns, for each model, the created row or an error message.
+    """
+    offset = 0
+    async for chunk in chunked(records, chunk_size):
+        results: list[BulkRowResult | None] = [None] * len(chunk)
+        valid: list[tuple[int, ModelT]] = []
+        for position, record in enumerate(chunk):
+            index = offset + position
+            if isinstance(record, InvalidRecord):
+                results[position] = BulkRowResult(
+                    index=index, status="error", errors=[record.message]
+                )
+                continue
+            try:
+                valid.append((position, schema.model_validate(record)))
+            except ValidationError as exc:
+                results[position] = BulkRowResult(
+                    index=index, status="error", errors=validation_errors(exc)
+                )
+        if valid:
+            try:
+                outcomes = await insert_chunk([model for _, model in valid])
+            except DatabaseError as exc:
+                outcomes = [f"Chunk rolled back: {exc}"] * len(valid)
+            for (position, _), outcome in zip(valid, outcomes, strict=True):
+                results[position] = (
+                    BulkRowResult(
+                        index=offset + position, status="error", errors=[outcome]
+                    )
+                    if isinstance(outcome, str)
+                    else BulkRowResult(
+                        index=offset + position, status="created", id=outcome["id"]
+                    )
+                )
+        for result in results:
+            if result is not None:
+                yield result
+        offset += len(chunk)
+
+
+async def encode_results(results: AsyncIterator[BulkRowResult]) -> AsyncIterator[bytes]:
+    """Render results as NDJSON lines followed by a ``{"summary": ...}`` line."""
+    created = failed = 0
+    error = None
+    try:
+        async for result in results:
+            if result.status == "created":
+                created += 1
+            else:
+                failed += 1
+            yield result.model_dump_json(exclude_none=True).encode() + b"\n"
+    except InvalidPayloadError as exc:
+        error = str(exc)
+    summary = BulkSummary(created=created, failed=failed, error=error)
+    yield b'{"summary":' + summary.model_dump_json(exclude_none=True).encode() + b"}\n"
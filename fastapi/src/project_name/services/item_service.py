@@ -2,12 +2,112 @@
 
 from __future__ import annotations
 
-from project_name.schemas.item import ItemCreate, ItemRead
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+
+from project_name.core.pagination import Page, build_page, page_key
+from project_name.core.singleflight import coalesce
+from project_name.schemas.item import ItemCreate, ItemRead, ItemUpdate
+from project_name.services.bulk import bulk_create
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+    from typing import Any
+
+    from project_name.core.cache import ResponseCache
+    from project_name.core.changefeed import ChangeAction, ChangeHub
+    from project_name.core.database import Row
+    from project_name.core.singleflight import SingleFlight
+    from project_name.repositories.item_repository import ItemRepository
+    from project_name.schemas.bulk import BulkRowResult
 
 
 class ItemService:
-    async def list_items(self) -> list[ItemRead]:
-        return [ItemRead(id=1, name="Sample", description=None)]
+    def __init__(
+        self,
+        repository: ItemRepository,
+        cache: ResponseCache | None = None,
+        flights: SingleFlight | None = None,
+        *,
+        changes: ChangeHub | None = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.flights = flights
+        self.changes = changes
+
+    async def _invalidate(self) -> None:
+        if self.flights is not None:
+            self.flights.forget("items")
+        if self.cache is not None:
+            await self.cache.invalidate("items")
+
+    def _publish(
+        self, action: ChangeAction, item_id: int, item: ItemRead | None = None
+    ) -> None:
+        if self.changes is not None:
+            data = item.model_dump_json() if item is not None else f'{{"id":{item_id}}}'
+            self.changes.publish("items", action, item_id, data.encode())
+
+    @coalesce("items", key=page_key)
+    async def list_items(
+        self, skip: int = 0, limit: int = 100, after: int | None = None
+    ) -> Page[ItemRead]:
+        rows = await self.repository.list_page(after=after, skip=skip, limit=limit + 1)
+        return build_page(rows, limit, ItemRead.model_validate)
 
     async def create_item(self, item_in: ItemCreate) -> ItemRead:
-        return ItemRead(id=1, name=item_in.name, description=item_in.description)
+        row = await self.repository.create(
+            name=item_in.name, description=item_in.description
+        )
+        await self._invalidate()
+        item = ItemRead.model_validate(row)
+        self._publish("created", item.id, item)
+        return item
+
+    def create_items(
+        self, records: AsyncIterable[Any], chunk_size: int = 500
+    ) -> AsyncIterator[BulkRowResult]:
+        return bulk_create(records, ItemCreate, self._insert_items, chunk_size)
+
+    async def _insert_items(self, items: list[ItemCreate]) -> list[Row | str]:
+        rows = await self.repository.create_many(
+            [(item.name, item.description) for item in items]
+        )
+        await self._invalidate()
+        if self.changes is not None:
+            for row in rows:
+                self._publish("created", row["id"], ItemRead.model_validate(row))
+        return list(rows)
+
+    async def export_items(
+        self, batch_size: int = 1000
+    ) -> AsyncGenerator[list[ItemRead], None]:
+        async with aclosing(self.repository.iter_batches(batch_size)) as batches:
+            async for rows in batches:
+                yield [ItemRead.model_validate(row) for row in rows]
+
+    @coalesce("items")
+    async def get_item(self, item_id: int) -> ItemRead | None:
+        row = await self.repository.get(item_id)
+        return ItemRead.model_validate(row) if row is not None else None
+
+    async def update_item(self, item_id: int, item_in: ItemUpdate) -> ItemRead | None:
+        values = item_in.model_dump(exclude_unset=True)
+        if values.get("name") is None:
+            values.pop("name", None)
+        row = await self.repository.update(item_id, values)
+        if row is None:
+            return None
+        await self._invalidate()
+        item = ItemRead.model_validate(row)
+        self._publish("updated", item_id, item)
+        return item
+
+    async def delete_item(self, item_id: int) -> bool:
+        deleted = await self.repository.delete(item_id)
+        if deleted:
+            await self._invalidate()
+            self._publish("deleted", item_id)
+        return deleted
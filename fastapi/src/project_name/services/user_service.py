@@ -2,62 +2,166 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
+from project_name.core.database import IntegrityError
+from project_name.core.pagination import Page, build_page, page_key
+from project_name.core.security import PasswordHasher, PasswordHashingPool
+from project_name.core.singleflight import coalesce
 from project_name.schemas.user import UserCreate, UserRead, UserUpdate
+from project_name.services.audit import record_user_event
+from project_name.services.bulk import bulk_create
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+    from typing import Any
+
+    from project_name.core.cache import ResponseCache
+    from project_name.core.changefeed import ChangeAction, ChangeHub
+    from project_name.core.database import Row
+    from project_name.core.jobs import JobQueue
+    from project_name.core.singleflight import SingleFlight
+    from project_name.repositories.user_repository import UserRepository
+    from project_name.schemas.bulk import BulkRowResult
+
+
+class EmailAlreadyRegisteredError(Exception):
+    pass
 
 
 class UserService:
-    async def get_users(self, skip: int = 0, limit: int = 100) -> list[UserRead]:
-        _ = (skip, limit)
-        now = datetime.utcnow()
-        return [
-            UserRead(
-                id=1,
-                email="user@example.com",
-                name="Example",
-                is_active=True,
-                created_at=now,
-                updated_at=now,
-            )
-        ]
+    def __init__(
+        self,
+        repository: UserRepository,
+        cache: ResponseCache | None = None,
+        passwords: PasswordHashingPool | None = None,
+        flights: SingleFlight | None = None,
+        jobs: JobQueue | None = None,
+        *,
+        changes: ChangeHub | None = None,
+    ) -> None:
+        self.repository = repository
+        self.cache = cache
+        self.passwords = passwords or PasswordHashingPool(PasswordHasher())
+        self.flights = flights
+        self.jobs = jobs
+        self.changes = changes
+
+    async def _invalidate(self) -> None:
+        if self.flights is not None:
+            self.flights.forget("users")
+        if self.cache is not None:
+            await self.cache.invalidate("users")
+
+    def _after_write(self, action: str, *user_ids: int) -> None:
+        # Side effects run on the job queue; the write doesn't wait for them.
+        if self.jobs is not None and user_ids:
+            self.jobs.enqueue(record_user_event, action, *user_ids)
+
+    def _publish(
+        self, action: ChangeAction, user_id: int, user: UserRead | None = None
+    ) -> None:
+        if self.changes is not None:
+            data = user.model_dump_json() if user is not None else f'{{"id":{user_id}}}'
+            self.changes.publish("users", action, user_id, data.encode())
+
+    @coalesce("users", key=page_key)
+    async def get_users(
+        self, skip: int = 0, limit: int = 100, after: int | None = None
+    ) -> Page[UserRead]:
+        rows = await self.repository.list_page(after=after, skip=skip, limit=limit + 1)
+        return build_page(rows, limit, UserRead.model_validate)
 
     async def create_user(self, user_in: UserCreate) -> UserRead:
-        now = datetime.utcnow()
-        return UserRead(
-            id=1,
-            email=user_in.email,
-            name=user_in.name,
-            is_active=user_in.is_active,
-            created_at=now,
-            updated_at=now,
+        try:
+            row = await self.repository.create(
+                email=user_in.email,
+                name=user_in.name,
+                is_active=user_in.is_active,
+                hashed_password=await self.passwords.hash(user_in.password),
+            )
+        except IntegrityError as exc:
+            raise EmailAlreadyRegisteredError(user_in.email) from exc
+        await self._invalidate()
+        self._after_write("created", row["id"])
+        user = UserRead.model_validate(row)
+        self._publish("created", user.id, user)
+        return user
+
+    def create_users(
+        self, records: AsyncIterable[Any], chunk_size: int = 500
+    ) -> AsyncIterator[BulkRowResult]:
+        return bulk_create(records, UserCreate, self._insert_users, chunk_size)
+
+    async def _insert_users(self, users: list[UserCreate]) -> list[Row | str]:
+        # Hash the whole chunk concurrently; the pool bounds the parallelism.
+        hashes = await asyncio.gather(
+            *(self.passwords.hash(user.password) for user in users)
+        )
+        rows = await self.repository.create_many(
+            [
+                (user.email, user.name, user.is_active, hashed)
+                for user, hashed in zip(users, hashes, strict=True)
+            ]
         )
+        if rows:
+            await self._invalidate()
+            self._after_write("created", *(row["id"] for row in rows))
+            if self.changes is not None:
+                for row in rows:
+                    self._publish("created", row["id"], UserRead.model_validate(row))
+        # Conflicting emails, including repeats within the chunk, are skipped by
+        # the insert; only the first occurrence of each email gets its row.
+        created = {row["email"]: row for row in rows}
+        return [created.pop(user.email, "Email already registered") for user in users]
 
+    async def export_users(
+        self, batch_size: int = 1000
+    ) -> AsyncGenerator[list[UserRead], None]:
+        async with aclosing(self.repository.iter_batches(batch_size)) as batches:
+            async for rows in batches:
+                yield [UserRead.model_validate(row) for row in rows]
+
+    @coalesce("users")
     async def get_user(self, user_id: int) -> UserRead | None:
-        if user_id != 1:
-            return None
-        now = datetime.utcnow()
-        return UserRead(
-            id=1,
-            email="user@example.com",
-            name="Example",
-            is_active=True,
-            created_at=now,
-            updated_at=now,
-        )
+        row = await self.repository.get(user_id)
+        return UserRead.model_validate(row) if row is not None else None
 
     async def update_user(self, user_id: int, user_in: UserUpdate) -> UserRead | None:
-        if user_id != 1:
+        values = user_in.model_dump(exclude_none=True, exclude={"password"})
+        if user_in.password is not None:
+            values["hashed_password"] = await self.passwords.hash(user_in.password)
+        try:
+            row = await self.repository.update(user_id, values)
+        except IntegrityError as exc:
+            raise EmailAlreadyRegisteredError(str(values.get("email"))) from exc
+        if row is None:
             return None
-        now = datetime.utcnow()
-        return UserRead(
-            id=1,
-            email=user_in.email or "user@example.com",
-            name=user_in.name or "Example",
-            is_active=user_in.is_active if user_in.is_active is not None else True,
-            created_at=now,
-            updated_at=now,
-        )
+        await self._invalidate()
+        self._after_write("updated", user_id)
+        user = UserRead.model_validate(row)
+        self._publish("updated", user_id, user)
+        return user
+
+    async def authenticate(self, email: str, password: str) -> UserRead | None:
+        """Return the active user owning ``email`` and ``password``, else ``None``."""
+        row = await self.repository.get_credentials(email)
+        if row is None or row["hashed_password"] is None:
+            # Spend the same time as a real check so unknown emails don't stand out.
+            await self.passwords.hash(password)
+            return None
+        verified = await self.passwords.verify(password, row["hashed_password"])
+        if not verified or not row["is_active"]:
+            return None
+        return await self.get_user(row["id"])
 
     async def delete_user(self, user_id: int) -> bool:
-        return user_id == 1
+        deleted = await self.repository.delete(user_id)
+        if deleted:
+            await self._invalidate()
+            self._after_write("deleted", user_id)
+            self._publish("deleted", user_id)
+        return deleted
@@ -7,21 +7,65 @@ from typing import TYPE_CHECKING
 import pytest
 from fastapi.testclient import TestClient
 
+from project_name.core.cache import SharedCacheBackend
+from project_name.core.config import Settings
+from project_name.core.database import Database, create_pool
 from project_name.main import create_app
 
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import AsyncGenerator, Generator
 
     from fastapi import FastAPI
 
 
+class FakeCacheClient:
+    """In-memory stand-in for the Redis client used by ``SharedCacheBackend``."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, bytes] = {}
+        self.expiry: dict[str, int | None] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        return self.values.get(name)
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self.values[name] = value
+        self.expiry[name] = ex
+        return True
+
+    async def incr(self, name: str) -> int:
+        value = int(self.values.get(name, b"0")) + 1
+        self.values[name] = str(value).encode()
+        return value
+
+
+@pytest.fixture
+def cache_client() -> FakeCacheClient:
+    return FakeCacheClient()
+
+
+@pytest.fixture
+def shared_cache_backend(cache_client: FakeCacheClient) -> SharedCacheBackend:
+    return SharedCacheBackend(cache_client)
+
+
 @pytest.fixture
 def app() -> FastAPI:
-    return create_app()
+    # Cheap password hashing keeps user-creating tests fast.
+    return create_app(Settings(password_hash_iterations=1_000))
 
 
 @pytest.fixture
 def client(app: FastAPI) -> Generator[TestClient, None, None]:
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+async def database() -> AsyncGenerator[Database, None]:
+    database = Database(create_pool("sqlite:///:memory:"))
+    await database.connect()
+    await database.create_schema()
+    yield database
+    await database.disconnect()
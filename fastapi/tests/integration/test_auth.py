@@ -0,0 +1,60 @@
+"""Authentication endpoint tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+def login(client: TestClient, password: str = "password123") -> dict[str, object]:
+    response = client.post(
+        "/api/v1/auth/token", json={"email": "me@example.com", "password": password}
+    )
+    body: dict[str, object] = response.json()
+    return {"status_code": response.status_code, **body}
+
+
+def test_issue_token_and_read_current_user(client: TestClient) -> None:
+    payload = {"email": "me@example.com", "name": "Me", "password": "password123"}
+    created = client.post("/api/v1/users/", json=payload).json()
+
+    token = login(client)
+    assert token["status_code"] == 200
+    assert token["token_type"] == "bearer"
+    assert token["expires_in"] == 30 * 60
+
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    response = client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json() == created
+
+
+def test_issue_token_rejects_bad_credentials(client: TestClient) -> None:
+    payload = {"email": "me@example.com", "name": "Me", "password": "password123"}
+    client.post("/api/v1/users/", json=payload)
+
+    assert login(client, "wrong-password")["status_code"] == 401
+
+
+def test_current_user_requires_valid_token(client: TestClient) -> None:
+    assert client.get("/api/v1/users/me").status_code == 401
+    response = client.get(
+        "/api/v1/users/me", headers={"Authorization": "Bearer not-a-token"}
+    )
+    assert response.status_code == 401
+    assert response.headers["WWW-Authenticate"] == "Bearer"
+
+
+def test_current_user_deleted_after_login(client: TestClient) -> None:
+    payload = {"email": "me@example.com", "name": "Me", "password": "password123"}
+    user_id = client.post("/api/v1/users/", json=payload).json()["id"]
+    token = login(client)["access_token"]
+    client.delete(f"/api/v1/users/{user_id}")
+
+    response = client.get(
+        "/api/v1/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,80 @@
+"""Change-feed streaming endpoint tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+from project_name.schemas.item import ItemCreate
+
+
+if TYPE_CHECKING:
+    from starlette.types import Message
+
+
+def stream_scope(app: object, path: str) -> dict[str, object]:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept", b"text/event-stream")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+        "app": app,
+    }
+
+
+@pytest.mark.asyncio
+async def test_item_stream_pushes_writes_until_the_client_leaves() -> None:
+    app = create_app(Settings())
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        messages: list[Message] = []
+        received = asyncio.Event()
+
+        async def receive() -> Message:
+            await received.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+            body = message.get("body", b"")
+            if body.startswith(b"retry:"):
+                # Subscribed: the write must now reach this stream.
+                await container.items.create_item(ItemCreate(name="Widget"))
+            elif b"event: created" in body:
+                received.set()
+
+        await app(stream_scope(app, "/api/v1/items/stream"), receive, send)
+
+        start = messages[0]
+        headers = dict(start["headers"])
+        assert start["status"] == 200
+        assert headers[b"content-type"].startswith(b"text/event-stream")
+        assert headers[b"cache-control"] == b"no-cache"
+        assert b'"name":"Widget"' in messages[2]["body"]
+        assert container.changes.subscribers == 0
+
+
+def test_stream_refused_when_the_worker_is_full() -> None:
+    app = create_app(Settings(change_feed_max_subscribers=1))
+    with TestClient(app) as client:
+        app.state.container.changes.subscribe("items")
+        response = client.get("/api/v1/users/stream")
+    assert response.status_code == 503
+
+
+def test_stream_rejects_invalid_last_event_id(client: TestClient) -> None:
+    response = client.get("/api/v1/items/stream", headers={"Last-Event-ID": "x"})
+    assert response.status_code == 422
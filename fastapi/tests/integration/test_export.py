@@ -0,0 +1,171 @@
+"""Streaming export endpoint tests."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from project_name.core import export
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from starlette.types import Message
+
+
+@pytest.fixture
+def small_batches() -> Generator[TestClient, None, None]:
+    app = create_app(Settings(password_hash_iterations=1_000, export_batch_size=2))
+    with TestClient(app) as client:
+        yield client
+
+
+def create_items(client: TestClient, count: int) -> None:
+    lines = "\n".join(json.dumps({"name": f"Item {i}"}) for i in range(count))
+    response = client.post(
+        "/api/v1/items/bulk",
+        content=lines,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+
+
+def test_export_users_csv(small_batches: TestClient) -> None:
+    for index in range(3):
+        small_batches.post(
+            "/api/v1/users/",
+            json={
+                "email": f"user{index}@example.com",
+                "name": f"User {index}",
+                "password": "password123",
+            },
+        )
+
+    response = small_batches.get("/api/v1/users/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert 'filename="users.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["email"] for row in rows] == [
+        f"user{index}@example.com" for index in range(3)
+    ]
+    assert set(rows[0]) == {
+        "email",
+        "name",
+        "is_active",
+        "id",
+        "created_at",
+        "updated_at",
+    }
+
+
+def test_export_items_ndjson(small_batches: TestClient) -> None:
+    create_items(small_batches, 5)
+
+    response = small_batches.get("/api/v1/items/export", params={"format": "ndjson"})
+
+    assert response.headers["content-type"] == "application/x-ndjson"
+    items = [json.loads(line) for line in response.text.splitlines()]
+    assert [item["name"] for item in items] == [f"Item {i}" for i in range(5)]
+    assert items[0] == {"name": "Item 0", "description": None, "id": 1}
+
+
+def test_export_items_parquet(small_batches: TestClient) -> None:
+    parquet = pytest.importorskip("pyarrow.parquet")
+    create_items(small_batches, 5)
+
+    response = small_batches.get("/api/v1/items/export", params={"format": "parquet"})
+
+    assert response.status_code == 200
+    table = parquet.ParquetFile(io.BytesIO(response.content))
+    assert table.metadata.num_row_groups == 3
+    assert table.read().column("name").to_pylist() == [f"Item {i}" for i in range(5)]
+
+
+def test_export_parquet_without_pyarrow(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(export, "load_pyarrow", lambda: None)
+
+    response = client.get("/api/v1/items/export", params={"format": "parquet"})
+
+    assert response.status_code == 501
+
+
+def test_export_rejects_unknown_format(client: TestClient) -> None:
+    response = client.get("/api/v1/items/export", params={"format": "xml"})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_stops_when_client_disconnects() -> None:
+    app = create_app(Settings(export_batch_size=10))
+    async with app.router.lifespan_context(app):
+        items = app.state.container.items
+        await items.repository.create_many([(f"Item {i}", None) for i in range(100)])
+        first_chunk = asyncio.Event()
+        bodies: list[bytes] = []
+
+        async def receive() -> Message:
+            await first_chunk.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                bodies.append(message["body"])
+                first_chunk.set()
+                # Give the disconnect listener a chance to cancel the stream.
+                await asyncio.sleep(0.01)
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/items/export",
+            "raw_path": b"/api/v1/items/export",
+            "root_path": "",
+            "query_string": b"format=ndjson",
+            "headers": [(b"host", b"test")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("test", 80),
+            "app": app,
+        }
+        await app(scope, receive, send)
+
+        assert 0 < len(bodies) < 10
+        assert app.state.container.database.pool.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_requests_are_served_while_an_export_waits_on_its_client() -> None:
+    # The in-memory database has a single connection shared by all requests.
+    app = create_app(Settings(database_pool_acquire_timeout=0.5))
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://test") as client,
+    ):
+        items = app.state.container.items
+        await items.repository.create_many([(f"Item {i}", None) for i in range(5)])
+
+        async with aclosing(items.export_items(batch_size=2)) as export:
+            first = await anext(export)
+            response = await client.get("/api/v1/items/5")
+            rest = [item async for batch in export for item in batch]
+
+        assert response.status_code == 200
+        assert [item.name for item in first + rest] == [f"Item {i}" for i in range(5)]
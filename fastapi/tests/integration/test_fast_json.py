@@ -0,0 +1,61 @@
+"""Fast JSON response path tests."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from project_name.core.config import Settings
+from project_name.core.responses import FastJSONResponse
+from project_name.main import create_app
+from project_name.schemas.item import ItemRead
+
+
+def make_client(*, fast: bool) -> TestClient:
+    settings = Settings(fast_json_responses=fast, response_cache_enabled=False)
+    return TestClient(create_app(settings))
+
+
+def test_fast_list_responses_match_default() -> None:
+    bodies = []
+    for fast in (False, True):
+        with make_client(fast=fast) as client:
+            for index in range(3):
+                client.post(
+                    "/api/v1/users/",
+                    json={
+                        "email": f"u{index}@example.com",
+                        "name": f"U{index}",
+                        "password": "password123",
+                    },
+                )
+                client.post("/api/v1/items/", json={"name": f"Item {index}"})
+            users = client.get("/api/v1/users/", params={"limit": 2})
+            items = client.get("/api/v1/items/")
+            assert "X-Next-Cursor" in users.headers
+            bodies.append(
+                (
+                    # Timestamps differ between runs; compare their format only.
+                    [
+                        {
+                            **user,
+                            "created_at": len(user["created_at"]),
+                            "updated_at": None,
+                        }
+                        for user in users.json()
+                    ],
+                    items.json(),
+                )
+            )
+    assert bodies[0] == bodies[1]
+
+
+def test_fast_json_keeps_openapi_schema() -> None:
+    assert (
+        create_app(Settings(fast_json_responses=True)).openapi()
+        == create_app(Settings(fast_json_responses=False)).openapi()
+    )
+
+
+def test_fast_json_response_renders_models() -> None:
+    response = FastJSONResponse([ItemRead(id=1, name="A", description=None)])
+    assert response.body == b'[{"name":"A","description":null,"id":1}]'
@@ -4,11 +4,25 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from fastapi.testclient import TestClient
+
 
 if TYPE_CHECKING:
-    from fastapi.testclient import TestClient
+    from fastapi import FastAPI
 
 
 def test_health_check(client: TestClient) -> None:
     response = client.get("/health")
     assert response.status_code == 200
+
+
+def test_readiness_check(client: TestClient) -> None:
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+
+def test_readiness_check_before_startup(app: FastAPI) -> None:
+    # Without the context manager the lifespan (and so the container) never runs.
+    response = TestClient(app).get("/ready")
+    assert response.status_code == 503
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 
@@ -19,3 +20,74 @@ def test_create_item(client: TestClient) -> None:
     response = client.post("/api/v1/items/", json=payload)
     assert response.status_code == 201
     assert response.json()["name"] == "Item"
+
+
+def test_item_lifecycle(client: TestClient) -> None:
+    item = client.post("/api/v1/items/", json={"name": "Item"}).json()
+    url = f"/api/v1/items/{item['id']}"
+
+    assert client.get("/api/v1/items/").json() == [item]
+    assert (
+        client.patch(url, json={"description": "Desc"}).json()["description"] == "Desc"
+    )
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+
+
+def test_list_items_cursor_pagination(client: TestClient) -> None:
+    ids = [
+        client.post("/api/v1/items/", json={"name": f"Item {index}"}).json()["id"]
+        for index in range(3)
+    ]
+
+    first = client.get("/api/v1/items/", params={"limit": 2})
+    assert [item["id"] for item in first.json()] == ids[:2]
+    cursor = first.headers["X-Next-Cursor"]
+
+    second = client.get("/api/v1/items/", params={"after": cursor, "limit": 2})
+    assert [item["id"] for item in second.json()] == ids[2:]
+    assert "X-Next-Cursor" not in second.headers
+
+    legacy = client.get("/api/v1/items/", params={"skip": 1, "limit": 1})
+    assert [item["id"] for item in legacy.json()] == ids[1:2]
+
+
+def test_list_items_rejects_invalid_cursor(client: TestClient) -> None:
+    response = client.get("/api/v1/items/", params={"after": "garbage"})
+    assert response.status_code == 400
+
+
+def test_bulk_create_items_ndjson(client: TestClient) -> None:
+    body = b'{"name": "A"}\n{"name": ""}\nnot json\n{"name": "B", "description": "d"}\n'
+
+    response = client.post(
+        "/api/v1/items/bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert [result["status"] for result in results] == [
+        "created",
+        "error",
+        "error",
+        "created",
+    ]
+    assert summary == {"summary": {"created": 2, "failed": 2}}
+    names = [item["name"] for item in client.get("/api/v1/items/").json()]
+    assert names == ["A", "B"]
+
+
+def test_bulk_create_items_reports_malformed_array(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/items/bulk",
+        content=b'[{"name": "A"}, oops',
+        headers={"Content-Type": "application/json"},
+    )
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+    assert results == [{"index": 0, "status": "created", "id": 1}]
+    assert summary["summary"]["created"] == 1
+    assert "error" in summary["summary"]
+    names = [item["name"] for item in client.get("/api/v1/items/").json()]
+    assert names == ["A"]
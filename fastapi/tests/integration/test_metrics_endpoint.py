@@ -0,0 +1,61 @@
+"""Metrics endpoint tests."""
+
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+def test_metrics_use_route_templates(client: TestClient) -> None:
+    payload = {"email": "m@example.com", "name": "M", "password": "password123"}
+    user_id = client.post("/api/v1/users/", json=payload).json()["id"]
+    client.get(f"/api/v1/users/{user_id}")
+    client.get("/api/v1/users/999999")
+    client.get("/does-not-exist")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    labels = 'method="GET",route="/api/v1/users/{user_id}"'
+    assert f'http_requests_total{{{labels},status="2xx"}} 1' in text
+    assert f'http_requests_total{{{labels},status="4xx"}} 1' in text
+    assert 'route="<unmatched>",status="4xx"} 1' in text
+    assert f'/api/v1/users/{user_id}"' not in text
+    # The scrape itself is in flight while the body is rendered.
+    assert "http_requests_in_flight 1" in text
+    assert "password_hash_workers 2" in text
+    assert "password_hash_queued 0" in text
+
+
+def test_metrics_group_unknown_methods(client: TestClient) -> None:
+    client.request("BREW", "/api/v1/items/")
+    client.request("X-PURGE-1234", "/api/v1/items/")
+
+    text = client.get("/metrics").text
+
+    labels = 'method="other",route="/api/v1/items/",status="4xx"'
+    assert f"http_requests_total{{{labels}}} 2" in text
+    assert "BREW" not in text
+    assert "PURGE" not in text
+
+
+def test_metrics_export_response_cache_counters(client: TestClient) -> None:
+    etag = client.get("/api/v1/items/").headers["etag"]
+    client.get("/api/v1/items/")
+    client.get("/api/v1/items/", headers={"If-None-Match": etag})
+
+    text = client.get("/metrics").text
+
+    assert "response_cache_misses_total 1" in text
+    assert "response_cache_hits_total 2" in text
+    assert "response_cache_not_modified_total 1" in text
+
+
+def test_metrics_disabled() -> None:
+    with TestClient(create_app(Settings(metrics_enabled=False))) as client:
+        client.get("/health")
+        assert client.get("/metrics").status_code == 404
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 
@@ -9,13 +10,112 @@ if TYPE_CHECKING:
     from fastapi.testclient import TestClient
 
 
+def create_user(
+    client: TestClient, email: str = "test@example.com"
+) -> dict[str, object]:
+    payload = {"email": email, "name": "Test", "password": "password123"}
+    response = client.post("/api/v1/users/", json=payload)
+    assert response.status_code == 201
+    body: dict[str, object] = response.json()
+    return body
+
+
 def test_list_users(client: TestClient) -> None:
     response = client.get("/api/v1/users/")
     assert response.status_code == 200
 
 
+def test_list_users_cursor_pagination(client: TestClient) -> None:
+    first_user = create_user(client, "a@example.com")
+    second_user = create_user(client, "b@example.com")
+
+    first = client.get("/api/v1/users/", params={"limit": 1})
+    assert [user["id"] for user in first.json()] == [first_user["id"]]
+
+    after = first.headers["X-Next-Cursor"]
+    second = client.get("/api/v1/users/", params={"after": after, "limit": 1})
+    assert [user["id"] for user in second.json()] == [second_user["id"]]
+
+
 def test_create_user(client: TestClient) -> None:
-    payload = {"email": "test@example.com", "name": "Test", "password": "password123"}
+    user = create_user(client)
+    assert user["email"] == "test@example.com"
+
+
+def test_create_user_duplicate_email(client: TestClient) -> None:
+    create_user(client)
+    payload = {"email": "test@example.com", "name": "Other", "password": "password123"}
     response = client.post("/api/v1/users/", json=payload)
-    assert response.status_code == 201
-    assert response.json()["email"] == "test@example.com"
+    assert response.status_code == 409
+
+
+def test_user_lifecycle(client: TestClient) -> None:
+    user = create_user(client)
+    url = f"/api/v1/users/{user['id']}"
+
+    assert client.get(url).json()["name"] == "Test"
+    assert client.patch(url, json={"name": "Renamed"}).json()["name"] == "Renamed"
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+    assert client.patch(url, json={"name": "Gone"}).status_code == 404
+    assert client.delete(url).status_code == 404
+
+
+def test_get_user_conditional_request(client: TestClient) -> None:
+    user = create_user(client)
+    url = f"/api/v1/users/{user['id']}"
+
+    first = client.get(url)
+    etag = first.headers["ETag"]
+    cached = client.get(url)
+    assert cached.json() == first.json()
+    assert cached.headers["ETag"] == etag
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.patch(url, json={"name": "Renamed"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["name"] == "Renamed"
+    assert changed.headers["ETag"] != etag
+
+    stats = client.get("/health/cache").json()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["not_modified"] == 1
+
+
+def test_list_users_cache_invalidated_on_create(client: TestClient) -> None:
+    assert client.get("/api/v1/users/").json() == []
+    user = create_user(client)
+    assert client.get("/api/v1/users/").json() == [user]
+
+
+def test_bulk_create_users(client: TestClient) -> None:
+    create_user(client, "taken@example.com")
+    rows = [
+        {"email": "a@example.com", "name": "A", "password": "password123"},
+        {"email": "taken@example.com", "name": "B", "password": "password123"},
+        {"email": "not-an-email", "name": "C", "password": "password123"},
+        {"email": "a@example.com", "name": "D", "password": "password123"},
+        {"email": "e@example.com", "name": "E", "password": "password123"},
+    ]
+
+    response = client.post("/api/v1/users/bulk", json=rows)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    *results, summary = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [result["status"] for result in results] == [
+        "created",
+        "error",
+        "error",
+        "error",
+        "created",
+    ]
+    assert results[1]["errors"] == ["Email already registered"]
+    assert results[2]["errors"][0].startswith("email:")
+    assert summary == {"summary": {"created": 2, "failed": 3}}
+    assert len(client.get("/api/v1/users/").json()) == 3
@@ -0,0 +1,142 @@
+"""Admission control tests."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from project_name.core.admission import (
+    AdmissionMiddleware,
+    ConcurrencyLimiter,
+    OverloadedError,
+    TokenBucketLimiter,
+)
+from project_name.core.config import Settings
+from project_name.main import create_app
+
+
+async def test_limiter_queues_then_sheds() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=1, queue_timeout=1.0)
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    assert (limiter.in_flight, limiter.waiting) == (1, 1)
+
+    with pytest.raises(OverloadedError, match="queue is full"):
+        async with limiter.slot():
+            pass
+
+    release.set()
+    await asyncio.gather(holder, queued)
+    assert (limiter.in_flight, limiter.waiting) == (0, 0)
+
+
+async def test_limiter_queue_timeout() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=5, queue_timeout=0.01)
+    async with limiter.slot():
+        with pytest.raises(OverloadedError, match="Timed out"):
+            async with limiter.slot():
+                pass
+    assert limiter.waiting == 0
+
+
+def test_token_bucket_refills() -> None:
+    now = 0.0
+    limiter = TokenBucketLimiter(2.0, 2, clock=lambda: now)
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == 0
+    assert limiter.acquire("a") == pytest.approx(0.5)
+    assert limiter.acquire("b") == 0
+    now = 0.5
+    assert limiter.acquire("a") == 0
+
+
+def test_token_bucket_forgets_least_recent_clients() -> None:
+    limiter = TokenBucketLimiter(1.0, 1, max_clients=1, clock=lambda: 0.0)
+    limiter.acquire("a")
+    limiter.acquire("b")
+    # "a" was evicted, so it starts again with a full bucket.
+    assert limiter.acquire("a") == 0
+
+
+def build_app(
+    *,
+    groups: dict[str, ConcurrencyLimiter] | None = None,
+    rate_limiter: TokenBucketLimiter | None = None,
+    retry_after: int = 1,
+) -> tuple[FastAPI, asyncio.Event]:
+    app = FastAPI()
+    release = asyncio.Event()
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "healthy"}
+
+    @app.get("/api/v1/users/")
+    async def slow() -> dict[str, str]:
+        await release.wait()
+        return {"status": "done"}
+
+    app.add_middleware(
+        AdmissionMiddleware,
+        groups=groups,
+        rate_limiter=rate_limiter,
+        exempt_paths=["/health"],
+        retry_after=retry_after,
+    )
+    return app, release
+
+
+async def test_middleware_sheds_with_retry_after() -> None:
+    limiter = ConcurrencyLimiter(1, queue_size=0, queue_timeout=1.0)
+    app, release = build_app(groups={"/api/v1/users": limiter}, retry_after=3)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.get("/api/v1/users/"))
+        while not limiter.in_flight:
+            await asyncio.sleep(0)
+
+        shed = await client.get("/api/v1/users/")
+        assert shed.status_code == 503
+        assert shed.headers["Retry-After"] == "3"
+        assert (await client.get("/health")).status_code == 200
+
+        release.set()
+        assert (await first).status_code == 200
+
+
+async def test_middleware_rate_limits_per_client() -> None:
+    app, release = build_app(rate_limiter=TokenBucketLimiter(0.5, 1, clock=lambda: 0.0))
+    release.set()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        assert (await client.get("/api/v1/users/")).status_code == 200
+        limited = await client.get("/api/v1/users/")
+        assert limited.status_code == 429
+        assert limited.headers["Retry-After"] == "2"
+        assert (await client.get("/health")).status_code == 200
+
+
+def middleware_classes(app: FastAPI) -> list[object]:
+    return [middleware.cls for middleware in app.user_middleware]
+
+
+def test_create_app_rejects_unknown_groups() -> None:
+    with pytest.raises(ValueError, match="orders"):
+        create_app(Settings(admission_group_concurrency={"orders": 1}))
+
+
+def test_create_app_installs_admission_control() -> None:
+    settings = Settings(admission_max_concurrency=10, rate_limit_per_second=5)
+    assert AdmissionMiddleware in middleware_classes(create_app(settings))
+    assert AdmissionMiddleware not in middleware_classes(create_app())
@@ -0,0 +1,86 @@
+"""Response cache tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from project_name.core.cache import (
+    CachedResponse,
+    LRUCacheBackend,
+    ResponseCache,
+    etag_matches,
+    make_etag,
+)
+
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeCacheClient
+
+    from project_name.core.cache import SharedCacheBackend
+
+
+@pytest.mark.asyncio
+async def test_lru_backend_evicts_least_recently_used() -> None:
+    backend = LRUCacheBackend(max_entries=2)
+    await backend.set("a", b"1", ttl=60)
+    await backend.set("b", b"2", ttl=60)
+    assert await backend.get("a") == b"1"
+
+    await backend.set("c", b"3", ttl=60)
+
+    assert len(backend) == 2
+    assert await backend.get("b") is None
+    assert await backend.get("a") == b"1"
+
+
+@pytest.mark.asyncio
+async def test_lru_backend_expires_entries() -> None:
+    backend = LRUCacheBackend()
+    await backend.set("a", b"1", ttl=0)
+    assert await backend.get("a") is None
+    assert len(backend) == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_backend_prefixes_keys_and_rounds_ttl(
+    shared_cache_backend: SharedCacheBackend, cache_client: FakeCacheClient
+) -> None:
+    await shared_cache_backend.set("users:v0:/", b"body", ttl=0.5)
+    assert await shared_cache_backend.get("users:v0:/") == b"body"
+    assert cache_client.expiry["project_name:users:v0:/"] == 1
+
+    assert await shared_cache_backend.counter("users:version") == 0
+    assert await shared_cache_backend.incr("users:version") == 1
+    assert await shared_cache_backend.counter("users:version") == 1
+
+
+@pytest.mark.asyncio
+async def test_response_cache_counts_hits_and_misses(
+    shared_cache_backend: SharedCacheBackend,
+) -> None:
+    cache = ResponseCache(shared_cache_backend)
+    entry = CachedResponse(
+        b"[]", make_etag(b"[]"), {"content-type": "application/json"}
+    )
+
+    assert await cache.get("key") is None
+    await cache.set("key", entry, ttl=60)
+    assert await cache.get("key") == entry
+
+    assert cache.stats.as_dict() == {
+        "hits": 1,
+        "misses": 1,
+        "not_modified": 0,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_etag_matches() -> None:
+    etag = make_etag(b"body")
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
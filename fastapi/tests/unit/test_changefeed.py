@@ -0,0 +1,222 @@
+"""Change-feed hub tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from contextlib import aclosing
+from typing import TYPE_CHECKING
+
+import pytest
+
+from project_name.core.changefeed import (
+    HEARTBEAT_FRAME,
+    RETRY_FRAME,
+    ChangeHub,
+    HubFullError,
+)
+from project_name.repositories.item_repository import ItemRepository
+from project_name.schemas.item import ItemCreate, ItemUpdate
+from project_name.services.item_service import ItemService
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from project_name.core.changefeed import Subscription
+    from project_name.core.database import Database
+
+
+def parse(frame: bytes) -> dict[str, str]:
+    fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+    return fields
+
+
+async def take(stream: AsyncGenerator[bytes, None], count: int) -> list[bytes]:
+    return [await anext(stream) for _ in range(count)]
+
+
+def pending_ids(subscription: Subscription) -> list[int]:
+    return [event.id for event in subscription.pending.values()]
+
+
+@pytest.mark.asyncio
+async def test_publish_reaches_only_the_topic_subscribers() -> None:
+    hub = ChangeHub()
+    items = hub.subscribe("items")
+    users = hub.subscribe("users")
+
+    hub.publish("items", "created", 7, b'{"id":7}')
+
+    async with aclosing(hub.stream(items)) as stream:
+        retry, frame = await take(stream, 2)
+    assert retry == RETRY_FRAME
+    assert parse(frame) == {"id": "1", "event": "created", "data": '{"id":7}'}
+    assert not users.pending
+    assert hub.stats() == {
+        "subscribers": 1,
+        "published": 1,
+        "delivered": 1,
+        "coalesced": 0,
+        "dropped": 0,
+        "replayed": 0,
+        "resets": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_gets_the_newest_event_per_record() -> None:
+    hub = ChangeHub(buffer_size=2)
+    subscription = hub.subscribe("items")
+
+    hub.publish("items", "updated", 1, b"{}")
+    hub.publish("items", "created", 2, b"{}")
+    hub.publish("items", "updated", 1, b"{}")
+    hub.publish("items", "deleted", 1, b"{}")
+
+    assert pending_ids(subscription) == [2, 4]
+    assert hub.coalesced == 2
+    assert not subscription.closed
+
+
+def test_coalescing_keeps_created_and_collapses_create_delete() -> None:
+    hub = ChangeHub(buffer_size=4)
+    subscription = hub.subscribe("items")
+    hub.subscribe("users")
+
+    hub.publish("items", "created", 1, b'{"v":0}')
+    hub.publish("items", "updated", 1, b'{"v":1}')
+    hub.publish("items", "updated", 1, b'{"v":2}')
+    hub.publish("items", "created", 2, b"{}")
+    hub.publish("items", "deleted", 2, b"{}")
+    hub.publish("items", "updated", 3, b"{}")
+    hub.publish("items", "deleted", 3, b"{}")
+
+    frames = [parse(event.frame) for event in subscription.pending.values()]
+    assert frames == [
+        {"id": "3", "event": "created", "data": '{"v":2}'},
+        {"id": "7", "event": "deleted", "data": "{}"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_over_its_buffer_is_disconnected() -> None:
+    hub = ChangeHub(buffer_size=2, overflow="drop")
+    slow = hub.subscribe("items")
+    fast = hub.subscribe("items")
+
+    async with aclosing(hub.stream(fast)) as stream:
+        await take(stream, 1)
+        for _ in range(3):
+            hub.publish("items", "updated", 1, b"{}")
+            await take(stream, 1)
+        assert hub.subscribers == 1
+
+    assert slow.closed
+    assert hub.dropped == 1
+    assert hub.subscribers == 0
+    async with aclosing(hub.stream(slow)) as stream:
+        assert [frame async for frame in stream] == [RETRY_FRAME]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_missed_events() -> None:
+    hub = ChangeHub()
+    for key in range(1, 4):
+        hub.publish("items", "created", key, b"{}")
+    hub.publish("users", "created", 1, b"{}")
+
+    subscription = hub.subscribe("items", last_event_id=1)
+
+    assert [parse(frame)["id"] for frame in subscription.backlog] == ["2", "3"]
+
+
+@pytest.mark.asyncio
+async def test_replay_is_not_limited_by_the_buffer() -> None:
+    hub = ChangeHub(buffer_size=4)
+    for key in range(1, 11):
+        hub.publish("items", "created", key, b"{}")
+
+    subscription = hub.subscribe("items", last_event_id=0)
+    hub.publish("items", "created", 11, b"{}")
+
+    async with aclosing(hub.stream(subscription)) as stream:
+        frames = await take(stream, 12)
+    assert [parse(frame)["id"] for frame in frames[1:]] == [
+        str(event_id) for event_id in range(1, 12)
+    ]
+    assert hub.replayed == 10
+    assert hub.dropped == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("last_event_id", [1, 99])
+async def test_reconnect_past_the_history_resets(last_event_id: int) -> None:
+    hub = ChangeHub(history_size=2)
+    for key in range(1, 5):
+        hub.publish("items", "created", key, b"{}")
+
+    subscription = hub.subscribe("items", last_event_id=last_event_id)
+
+    (frame,) = subscription.backlog
+    assert parse(frame) == {"id": "4", "event": "reset", "data": "{}"}
+    assert hub.resets == 1
+    # Replay from the oldest event still kept needs no reset.
+    replay = hub.subscribe("items", last_event_id=2).backlog
+    assert [parse(frame)["id"] for frame in replay] == ["3", "4"]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_limit() -> None:
+    hub = ChangeHub(max_subscribers=1)
+    subscription = hub.subscribe("items")
+
+    with pytest.raises(HubFullError):
+        hub.subscribe("users")
+
+    hub.unsubscribe(subscription)
+    hub.subscribe("users")
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_sends_heartbeats() -> None:
+    hub = ChangeHub(heartbeat=0.01)
+    async with aclosing(hub.stream(hub.subscribe("items"))) as stream:
+        assert await take(stream, 3) == [RETRY_FRAME, HEARTBEAT_FRAME, HEARTBEAT_FRAME]
+
+
+@pytest.mark.asyncio
+async def test_streams_unsubscribe_when_closed() -> None:
+    hub = ChangeHub()
+    stream = hub.stream(hub.subscribe("items"))
+    await take(stream, 1)
+    await stream.aclose()
+    assert hub.subscribers == 0
+
+    waiting = hub.stream(hub.subscribe("items"))
+    await take(waiting, 1)
+    reader = asyncio.ensure_future(anext(waiting, None))
+    await asyncio.sleep(0)
+    hub.close()
+    assert await reader is None
+    assert hub.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_item_service_publishes_writes(database: Database) -> None:
+    hub = ChangeHub()
+    service = ItemService(ItemRepository(database), changes=hub)
+    subscription = hub.subscribe("items")
+
+    item = await service.create_item(ItemCreate(name="Widget"))
+    await service.update_item(item.id, ItemUpdate(name="Gadget"))
+
+    # The lagging subscriber still learns of a new item, with its latest data.
+    (event,) = subscription.pending.values()
+    frame = parse(event.frame)
+    assert frame["event"] == "created"
+    assert json.loads(frame["data"])["name"] == "Gadget"
+
+    await service.delete_item(item.id)
+    assert not subscription.pending
+    assert hub.published == 3
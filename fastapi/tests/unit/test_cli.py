@@ -0,0 +1,165 @@
+"""CLI tests."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+import uvicorn
+
+from project_name import cli
+from project_name.core.config import Settings
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        ({"cpu.max": "max 100000\n"}, None),
+        ({"cpu.max": "250000 100000\n"}, 3),
+        ({"cpu.max": "50000 100000\n"}, 1),
+        ({"cpu/cpu.cfs_quota_us": "200000", "cpu/cpu.cfs_period_us": "100000"}, 2),
+        ({"cpu/cpu.cfs_quota_us": "-1", "cpu/cpu.cfs_period_us": "100000"}, None),
+        ({}, None),
+    ],
+)
+def test_cgroup_cpu_limit(
+    tmp_path: Path, files: dict[str, str], expected: int | None
+) -> None:
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content)
+    assert cli.cgroup_cpu_limit(tmp_path) == expected
+
+
+def test_available_cpus_respects_cgroup_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(os, "sched_getaffinity", lambda _: {0, 1, 2, 3})
+    monkeypatch.setattr(cli, "cgroup_cpu_limit", lambda: 2)
+    assert cli.available_cpus() == 2
+    monkeypatch.setattr(cli, "cgroup_cpu_limit", lambda: None)
+    assert cli.available_cpus() == 4
+
+
+DATABASE_URL = "postgresql+asyncpg://user:password@db/app"
+CACHE_URL = "redis://cache:6379/0"
+
+
+def test_server_options_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 3)
+    monkeypatch.setattr(cli, "has_module", lambda _: True)
+
+    options = cli.server_options(
+        Settings(database_url=DATABASE_URL, response_cache_url=CACHE_URL),
+        cli.parse_serve_args([]),
+    )
+
+    assert options["workers"] == 3
+    assert options["loop"] == "uvloop"
+    assert options["http"] == "httptools"
+    assert options["backlog"] == 2048
+    assert options["limit_max_requests"] is None
+    assert options["limit_max_requests_jitter"] == 0
+    assert options["access_log"] is True
+
+
+def test_server_options_flags_override_settings(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cli, "has_module", lambda _: False)
+    settings = Settings(
+        server_workers=8,
+        server_keep_alive=10,
+        database_url=DATABASE_URL,
+        response_cache_url=CACHE_URL,
+    )
+    args = cli.parse_serve_args(
+        ["--workers", "2", "--max-requests", "5000", "--limit-concurrency", "100"]
+    )
+
+    options = cli.server_options(settings, args)
+
+    assert options["workers"] == 2
+    assert options["loop"] == "asyncio"
+    assert options["http"] == "h11"
+    assert options["timeout_keep_alive"] == 10
+    assert options["limit_max_requests"] == 5000
+    assert options["limit_max_requests_jitter"] == 500
+    assert options["limit_concurrency"] == 100
+
+
+def test_server_options_access_log_and_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 2)
+    settings = Settings(
+        database_url=DATABASE_URL,
+        response_cache_url=CACHE_URL,
+        server_max_requests=1000,
+        server_max_requests_jitter=0,
+        server_access_log=False,
+    )
+
+    options = cli.server_options(settings, cli.parse_serve_args([]))
+    assert options["limit_max_requests_jitter"] == 0
+    assert options["access_log"] is False
+
+    args = cli.parse_serve_args(["--max-requests-jitter", "50", "--access-log"])
+    options = cli.server_options(settings, args)
+    assert options["limit_max_requests_jitter"] == 50
+    assert options["access_log"] is True
+
+
+@pytest.mark.parametrize(
+    ("settings", "argv"),
+    [
+        (Settings(server_max_requests=1000), []),
+        (
+            Settings(database_url=DATABASE_URL, response_cache_url=CACHE_URL),
+            ["--workers", "1", "--max-requests", "1000"],
+        ),
+    ],
+)
+def test_max_requests_refused_with_one_worker(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings, argv: list[str]
+) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 3)
+    with pytest.raises(SystemExit, match="--max-requests needs at least 2 workers"):
+        cli.server_options(settings, cli.parse_serve_args(argv))
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        Settings(),
+        Settings(database_url=DATABASE_URL),
+        Settings(response_cache_url=CACHE_URL),
+    ],
+)
+def test_one_worker_while_state_is_per_process(
+    monkeypatch: pytest.MonkeyPatch, settings: Settings
+) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 3)
+
+    assert cli.server_options(settings, cli.parse_serve_args([]))["workers"] == 1
+    with pytest.raises(SystemExit, match="refusing to start 2 workers"):
+        cli.server_options(settings, cli.parse_serve_args(["--workers", "2"]))
+
+
+def test_many_workers_without_a_response_cache(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 3)
+    settings = Settings(database_url=DATABASE_URL, response_cache_enabled=False)
+    assert cli.server_options(settings, cli.parse_serve_args([]))["workers"] == 3
+
+
+def test_serve_runs_uvicorn(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    monkeypatch.setattr(
+        uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs))
+    )
+    cli.serve(["--workers", "1", "--port", "9000"])
+    assert calls[0][0] == "project_name.main:app"
+    assert calls[0][1]["port"] == 9000
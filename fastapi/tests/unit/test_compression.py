@@ -0,0 +1,136 @@
+"""Compression middleware tests."""
+
+from __future__ import annotations
+
+import gzip
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+
+from project_name.core.compression import (
+    CompressionMiddleware,
+    compressible,
+    load_brotli,
+    negotiate,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+BODY = "x" * 2048
+requires_brotli = pytest.mark.skipif(
+    load_brotli() is None, reason="brotli (compression extra) is not installed"
+)
+
+
+@pytest.mark.parametrize(
+    ("accept", "expected"),
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("identity", None),
+        ("gzip;q=bogus", None),
+    ],
+)
+def test_negotiate(accept: str, expected: str | None) -> None:
+    assert negotiate(accept, brotli=True) == expected
+
+
+def test_negotiate_without_brotli() -> None:
+    assert negotiate("br, gzip;q=0.5", brotli=False) == "gzip"
+    assert negotiate("br", brotli=False) is None
+
+
+@pytest.mark.parametrize(
+    ("media_type", "expected"),
+    [
+        ("application/json", True),
+        ("text/plain; charset=utf-8", True),
+        ("image/svg+xml", True),
+        ("image/png", False),
+        ("application/zip", False),
+    ],
+)
+def test_compressible(media_type: str, expected: bool) -> None:
+    assert compressible(media_type) is expected
+
+
+def build_app() -> CompressionMiddleware:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large() -> PlainTextResponse:
+        return PlainTextResponse(BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/small")
+    async def small() -> PlainTextResponse:
+        return PlainTextResponse("tiny")
+
+    @app.get("/encoded")
+    async def encoded() -> PlainTextResponse:
+        return PlainTextResponse(BODY, headers={"Content-Encoding": "identity"})
+
+    @app.get("/stream")
+    async def stream() -> StreamingResponse:
+        async def chunks() -> AsyncIterator[str]:
+            yield BODY
+            yield BODY
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    @app.get("/json")
+    async def json() -> JSONResponse:
+        return JSONResponse({"data": BODY})
+
+    return CompressionMiddleware(app, minimum_size=1024, cache_paths={"/json"})
+
+
+async def fetch(app: CompressionMiddleware, path: str, accept: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept})
+
+
+async def test_compresses_with_negotiated_encoding() -> None:
+    app = build_app()
+    response = await fetch(app, "/large", "gzip")
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert response.text == BODY
+
+
+@requires_brotli
+async def test_prefers_brotli() -> None:
+    response = await fetch(build_app(), "/large", "br, gzip")
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.text == BODY
+
+
+@pytest.mark.parametrize("path", ["/small", "/encoded", "/stream"])
+async def test_skips_small_encoded_and_streaming_responses(path: str) -> None:
+    app = build_app()
+    response = await fetch(app, path, "gzip")
+    assert response.headers.get("Content-Encoding") in (None, "identity")
+
+
+async def test_stable_payloads_are_compressed_once() -> None:
+    app = build_app()
+    compressed = app.compress_cached(b"y" * 4096, "gzip")
+    assert gzip.decompress(compressed) == b"y" * 4096
+    assert app.compress_cached(b"y" * 4096, "gzip") is compressed
+
+    await fetch(app, "/json", "gzip")
+    response = await fetch(app, "/json", "gzip")
+    assert response.json() == {"data": BODY}
+    # The entry from above plus a single one for /json.
+    assert len(app._cache) == 2
+    assert gzip.decompress(next(reversed(app._cache.values())))
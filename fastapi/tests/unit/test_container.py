@@ -0,0 +1,60 @@
+"""Service container tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from project_name.container import ServiceContainer
+from project_name.core.config import Settings
+from project_name.core.database import Database, create_pool
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.asyncio
+async def test_container_lifecycle() -> None:
+    container = ServiceContainer(Database(create_pool("sqlite:///:memory:")))
+
+    await container.startup()
+    assert container.ready
+    assert container.database.pool.size == 1
+    assert (await container.users.get_users()).items == []
+
+    await container.shutdown()
+    assert container.database.pool.size == 0
+    assert not container.ready
+
+
+@pytest.mark.asyncio
+async def test_startup_leaves_persistent_schemas_to_migrations(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    migrated = Database(create_pool(f"sqlite:///{tmp_path}/app.db"))
+    await migrated.connect()
+    await migrated.create_schema()
+    await migrated.disconnect()
+    created: list[Database] = []
+    create_schema = Database.create_schema
+
+    async def spy(database: Database) -> None:
+        created.append(database)
+        await create_schema(database)
+
+    monkeypatch.setattr(Database, "create_schema", spy)
+    for url in (f"sqlite:///{tmp_path}/app.db", "sqlite:///:memory:"):
+        container = ServiceContainer(Database(create_pool(url)))
+        await container.startup()
+        await container.shutdown()
+
+    assert created == [container.database]
+
+
+def test_container_from_settings_honours_cache_toggle() -> None:
+    assert ServiceContainer.from_settings(Settings()).response_cache is not None
+    container = ServiceContainer.from_settings(Settings(response_cache_enabled=False))
+    assert container.response_cache is None
+    assert container.users.cache is None
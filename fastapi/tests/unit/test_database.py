@@ -0,0 +1,117 @@
+"""Database pool tests."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from alembic import command
+from alembic.config import Config
+
+from project_name.core.config import get_settings
+from project_name.core.database import (
+    PoolTimeoutError,
+    SQLitePool,
+    create_pool,
+    to_numbered_placeholders,
+)
+from project_name.models.schema import schema_statements
+
+
+if TYPE_CHECKING:
+    from project_name.core.database import Database
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def table_layout(connection: sqlite3.Connection) -> dict[str, list[tuple[object, ...]]]:
+    return {
+        table: connection.execute(f"PRAGMA table_info({table})").fetchall()
+        for table in ("users", "items")
+    }
+
+
+@pytest.mark.asyncio
+async def test_pool_reuses_connections(tmp_path: Path) -> None:
+    pool = SQLitePool(str(tmp_path / "app.db"), min_size=1, max_size=2)
+    await pool.open()
+    try:
+        async with pool.acquire():
+            assert pool.in_use == 1
+        async with pool.acquire():
+            pass
+        assert pool.size == 1
+        assert pool.in_use == 0
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_acquire_timeout(tmp_path: Path) -> None:
+    pool = SQLitePool(str(tmp_path / "app.db"), max_size=1, acquire_timeout=0.01)
+    await pool.open()
+    try:
+        async with pool.acquire():
+            with pytest.raises(PoolTimeoutError):
+                async with pool.acquire():
+                    pass
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_transaction_rolls_back(database: Database) -> None:
+    with pytest.raises(RuntimeError):
+        async with database.transaction() as connection:
+            await connection.execute("INSERT INTO items (name) VALUES (?)", ("Item",))
+            raise RuntimeError
+
+    async with database.connection() as connection:
+        assert await connection.fetch_all("SELECT id FROM items") == []
+
+
+def test_create_pool_rejects_unknown_scheme() -> None:
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_pool("mysql://localhost/db")
+
+
+def test_to_numbered_placeholders() -> None:
+    sql = "UPDATE users SET name = ? WHERE id = ?"
+    assert to_numbered_placeholders(sql) == "UPDATE users SET name = $1 WHERE id = $2"
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_fixed_size_batches(database: Database) -> None:
+    async with database.connection() as connection:
+        await connection.execute_many(
+            "INSERT INTO items (name) VALUES (?)", [(f"Item {i}",) for i in range(5)]
+        )
+        batches = [
+            [row["id"] for row in batch]
+            async for batch in connection.stream(
+                "SELECT id FROM items ORDER BY id", batch_size=2
+            )
+        ]
+    assert batches == [[1, 2], [3, 4], [5]]
+
+
+def test_migrations_create_the_in_memory_schema(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'migrated.db'}")
+    config = Config(str(PROJECT_ROOT / "alembic.ini"))
+    config.set_main_option("script_location", str(PROJECT_ROOT / "alembic"))
+    get_settings.cache_clear()
+    try:
+        command.upgrade(config, "head")
+    finally:
+        get_settings.cache_clear()
+
+    direct = sqlite3.connect(":memory:")
+    for statement in schema_statements("sqlite"):
+        direct.execute(statement)
+    migrated = sqlite3.connect(tmp_path / "migrated.db")
+    assert table_layout(migrated) == table_layout(direct)
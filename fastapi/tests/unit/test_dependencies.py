@@ -5,14 +5,57 @@ from __future__ import annotations
 import pytest
 from fastapi import HTTPException
 
-from project_name.dependencies import get_current_user
+from project_name.core.pagination import encode_cursor
+from project_name.core.security import TokenService
+from project_name.dependencies import PaginationParams, get_current_user
 
 
-def test_get_current_user_requires_header() -> None:
-    with pytest.raises(HTTPException):
-        get_current_user(authorization=None)
+SECRET = "test-secret-test-secret-test-secret"
 
 
-def test_get_current_user_returns_user() -> None:
-    result = get_current_user(authorization="Bearer token")
-    assert result["user_id"] == 1
+async def test_get_current_user_requires_header() -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(TokenService(SECRET), authorization=None)
+    assert exc_info.value.status_code == 401
+
+
+async def test_get_current_user_returns_user() -> None:
+    tokens = TokenService(SECRET)
+    token = tokens.issue("7", email="user@example.com")
+    result = await get_current_user(tokens, authorization=f"Bearer {token}")
+    assert result == {"user_id": 7, "email": "user@example.com"}
+
+
+@pytest.mark.parametrize(
+    "authorization",
+    [
+        "Basic dXNlcjpwYXNz",
+        "Bearer",
+        "Bearer not-a-jwt",
+        f"Bearer {TokenService('another-secret-another-secret-12').issue('7')}",
+        f"Bearer {TokenService(SECRET).issue('not-a-number')}",
+    ],
+)
+async def test_get_current_user_rejects_invalid_tokens(authorization: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(TokenService(SECRET), authorization=authorization)
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}
+
+
+def test_pagination_params_caps_limit() -> None:
+    params = PaginationParams(skip=5, limit=5000)
+    assert params.skip == 5
+    assert params.limit == 1000
+    assert params.after is None
+
+
+def test_pagination_params_decodes_cursor() -> None:
+    assert PaginationParams(after=encode_cursor(42)).after == 42
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", encode_cursor(1)[:-2] + "!!"])
+def test_pagination_params_rejects_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        PaginationParams(after=cursor)
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,78 @@
+"""Bulk body parsing tests."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from project_name.core.ingest import (
+    InvalidPayloadError,
+    InvalidRecord,
+    JSONArrayScanner,
+    chunked,
+    iter_records,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+async def stream(data: bytes, size: int = 3) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def collect(content_type: str, data: bytes, size: int = 3) -> list[Any]:
+    return [record async for record in iter_records(stream(data, size), content_type)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 2, 7, 1024])
+async def test_json_array_split_at_any_boundary(size: int) -> None:
+    records = [{"name": "ä", "tags": [1, 2]}, 123, "x,]", None, True, 4.5]
+    data = json.dumps(records).encode()
+    assert await collect("application/json", data, size) == records
+
+
+@pytest.mark.asyncio
+async def test_empty_json_array() -> None:
+    assert await collect("application/json", b" [ ] ") == []
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b'{"name": "a"}', b'[{"name": "a"}', b'[{"name": "a"} {"name": "b"}]', b"[1] 2"],
+)
+def test_json_array_rejects_malformed_body(data: bytes) -> None:
+    scanner = JSONArrayScanner()
+    with pytest.raises(InvalidPayloadError):
+        scanner.feed(data)
+        scanner.feed(b"", final=True)
+
+
+@pytest.mark.asyncio
+async def test_ndjson_reports_bad_lines_and_continues() -> None:
+    data = b'{"name": "a"}\n\nnot json\r\n{"name": "b"}'
+    records = await collect("application/x-ndjson; charset=utf-8", data)
+    assert records[0] == {"name": "a"}
+    assert isinstance(records[1], InvalidRecord)
+    assert records[2] == {"name": "b"}
+
+
+@pytest.mark.asyncio
+async def test_chunked() -> None:
+    chunks = [chunk async for chunk in chunked(stream(b"abcde", 1), 2)]
+    assert chunks == [[b"a", b"b"], [b"c", b"d"], [b"e"]]
+
+
+@pytest.mark.asyncio
+async def test_chunked_flushes_records_read_before_a_truncated_array() -> None:
+    records = iter_records(stream(b'[{"name": "a"}, {"name": "b"}, {"na', 4), "")
+    chunks = chunked(records, 10)
+
+    assert await anext(chunks) == [{"name": "a"}, {"name": "b"}]
+    with pytest.raises(InvalidPayloadError):
+        await anext(chunks)
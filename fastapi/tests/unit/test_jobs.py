@@ -0,0 +1,145 @@
+"""Background job queue tests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from project_name.core.jobs import JobQueue
+from project_name.core.security import PasswordHasher, PasswordHashingPool
+from project_name.repositories.user_repository import UserRepository
+from project_name.schemas.user import UserCreate
+from project_name.services.user_service import UserService
+
+
+if TYPE_CHECKING:
+    from project_name.core.database import Database
+
+
+class Flaky:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls: list[str] = []
+
+    async def __call__(self, value: str) -> None:
+        self.calls.append(value)
+        if len(self.calls) <= self.failures:
+            raise RuntimeError(value)
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_in_the_background() -> None:
+    queue = JobQueue(workers=2)
+    queue.start()
+    done: list[int] = []
+    release = asyncio.Event()
+
+    async def job(value: int) -> None:
+        await release.wait()
+        done.append(value)
+
+    assert all(queue.enqueue(job, value) for value in range(3))
+    await asyncio.sleep(0)
+    assert queue.active == 2
+    assert queue.depth == 1
+    release.set()
+    await queue.drain()
+    assert sorted(done) == [0, 1, 2]
+    assert queue.stats()["processed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_jobs_retry_with_backoff() -> None:
+    queue = JobQueue(max_attempts=3, backoff=0.01)
+    queue.start()
+    job = Flaky(failures=2)
+
+    queue.enqueue(job, "x")
+    for _ in range(50):
+        if queue.processed:
+            break
+        await asyncio.sleep(0.01)
+    await queue.drain()
+
+    assert job.calls == ["x", "x", "x"]
+    assert (queue.processed, queue.retried, queue.failed) == (1, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_job_gives_up_after_max_attempts(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    queue = JobQueue(max_attempts=2, backoff=60)
+    queue.start()
+    job = Flaky(failures=5)
+
+    queue.enqueue(job, "x")
+    await asyncio.sleep(0)
+    # The retry is waiting out a minute of backoff; draining runs it now.
+    with caplog.at_level(logging.ERROR, logger="project_name.core.jobs"):
+        await queue.drain()
+
+    assert job.calls == ["x", "x"]
+    assert (queue.retried, queue.failed) == (1, 1)
+    assert "failed after 2 attempt(s)" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_queue_is_bounded_and_reports_lag() -> None:
+    now = [100.0]
+    queue = JobQueue(max_size=2, clock=lambda: now[0])
+    job = Flaky(failures=0)
+
+    assert queue.enqueue(job, "a")
+    now[0] += 3
+    assert queue.enqueue(job, "b")
+    assert not queue.enqueue(job, "c")
+    assert (queue.depth, queue.dropped) == (2, 1)
+    now[0] += 1
+    assert queue.lag == 4
+
+    queue.start()
+    await queue.drain()
+    assert queue.lag == 0
+    assert job.calls == ["a", "b"]
+    assert not queue.enqueue(job, "late")
+
+
+@pytest.mark.asyncio
+async def test_drain_timeout_abandons_stuck_jobs() -> None:
+    queue = JobQueue(workers=1, drain_timeout=0.01)
+    queue.start()
+    queue.enqueue(asyncio.sleep, 60)
+    queue.enqueue(asyncio.sleep, 60)
+    await asyncio.sleep(0)
+
+    await queue.drain()
+
+    assert queue.processed == 0
+    assert queue.depth == 1
+
+
+@pytest.mark.asyncio
+async def test_user_writes_enqueue_audit_records(
+    database: Database, caplog: pytest.LogCaptureFixture
+) -> None:
+    queue = JobQueue()
+    queue.start()
+    passwords = PasswordHashingPool(PasswordHasher(iterations=1_000))
+    service = UserService(UserRepository(database), passwords=passwords, jobs=queue)
+
+    with caplog.at_level(logging.INFO, logger="project_name.audit"):
+        user = await service.create_user(
+            UserCreate(email="a@example.com", name="A", password="password123")
+        )
+        await service.delete_user(user.id)
+        await queue.drain()
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "user.created",
+        "user.deleted",
+    ]
+    assert caplog.records[0].user_id == user.id  # type: ignore[attr-defined]
@@ -0,0 +1,51 @@
+"""Metrics registry tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from project_name.core.metrics import Histogram, MetricsRegistry
+
+
+def test_histogram_quantiles_interpolate_within_buckets() -> None:
+    histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+
+    assert list(histogram.cumulative()) == [
+        (0.1, 1),
+        (0.2, 3),
+        (0.4, 4),
+        (float("inf"), 4),
+    ]
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(1.0) == pytest.approx(0.4)
+    assert histogram.total == pytest.approx(0.65)
+
+
+def test_histogram_quantile_beyond_last_bucket_is_capped() -> None:
+    histogram = Histogram(buckets=(0.1,))
+    histogram.observe(5.0)
+    assert histogram.quantile(0.99) == 0.1
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_registry_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    registry.observe("GET", "/api/v1/users/{user_id}", 200, 0.002)
+    registry.observe("GET", "/api/v1/users/{user_id}", 404, 0.001)
+
+    text = registry.render()
+    labels = 'method="GET",route="/api/v1/users/{user_id}"'
+    assert "http_requests_in_flight 0" in text
+    assert f'http_requests_total{{{labels},status="2xx"}} 1' in text
+    assert f'http_requests_total{{{labels},status="4xx"}} 1' in text
+    assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in text
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in text
+    assert f'http_request_duration_quantile_seconds{{{labels},quantile="0.99"}}' in text
+
+
+def test_registry_escapes_label_values() -> None:
+    registry = MetricsRegistry()
+    registry.observe("GET", '/a"b\\', 200, 0.0)
+    assert 'route="/a\\"b\\\\"' in registry.render()
@@ -0,0 +1,244 @@
+"""Read replica routing tests, with SQLite files standing in for replicas."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from project_name.core.config import Settings
+from project_name.core.database import Database, SQLitePool, create_pool
+from project_name.core.replicas import (
+    PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+    ReplicaSet,
+    primary_pinned,
+    use_primary,
+    use_replica,
+)
+from project_name.main import create_app
+from project_name.repositories.item_repository import ItemRepository
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+    from pathlib import Path
+
+    from starlette.types import Receive, Scope, Send
+
+
+async def seeded_file(path: Path, name: str) -> None:
+    database = Database(create_pool(f"sqlite:///{path}"))
+    await database.connect()
+    await database.create_schema()
+    async with database.connection() as connection:
+        await connection.execute("INSERT INTO items (name) VALUES (?)", (name,))
+    await database.disconnect()
+
+
+@pytest.fixture
+async def routed(tmp_path: Path) -> AsyncGenerator[Database, None]:
+    await seeded_file(tmp_path / "primary.db", "from primary")
+    await seeded_file(tmp_path / "replica.db", "from replica")
+    database = Database(
+        SQLitePool(str(tmp_path / "primary.db")),
+        ReplicaSet([SQLitePool(str(tmp_path / "replica.db"))]),
+    )
+    await database.connect()
+    yield database
+    await database.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_reads_use_replica_and_writes_use_primary(routed: Database) -> None:
+    repository = ItemRepository(routed)
+
+    assert (await repository.get(1) or {})["name"] == "from replica"
+    created = await repository.create(name="new", description=None)
+    assert created["id"] == 2
+    assert await repository.get(2) is None
+
+    with use_primary():
+        assert primary_pinned()
+        assert (await repository.get(1) or {})["name"] == "from primary"
+        assert (await repository.get(2) or {})["name"] == "new"
+    assert not primary_pinned()
+
+
+@pytest.mark.asyncio
+async def test_choose_prefers_least_busy_then_rotates(tmp_path: Path) -> None:
+    first = SQLitePool(str(tmp_path / "a.db"))
+    second = SQLitePool(str(tmp_path / "b.db"))
+    replicas = ReplicaSet([first, second])
+    await replicas.open()
+    try:
+        assert [replicas.choose() for _ in range(4)] == [first, second] * 2
+        async with first.acquire():
+            assert [replicas.choose() for _ in range(2)] == [second, second]
+    finally:
+        await replicas.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_replica_is_ejected_and_readmitted(
+    routed: Database, tmp_path: Path
+) -> None:
+    missing = tmp_path / "down"
+    replica = SQLitePool(str(missing / "replica.db"))
+    replicas = ReplicaSet([replica], failure_threshold=2)
+    database = Database(routed.pool, replicas)
+
+    # Unreachable at startup: ejected straight away, reads fall back.
+    await replicas.open()
+    try:
+        assert replicas.healthy == [False]
+        assert replicas.choose() is None
+        assert (await ItemRepository(database).get(1) or {})["name"] == "from primary"
+
+        missing.mkdir()
+        await replicas.probe()
+        assert replicas.healthy == [True]
+
+        # Gone again: ejected after ``failure_threshold`` failed probes.
+        await replica.close()
+        shutil.rmtree(missing)
+        await replicas.probe()
+        assert replicas.healthy == [True]
+        assert replicas.failures == [1]
+        await replicas.probe()
+        assert replicas.healthy == [False]
+    finally:
+        await replicas.close()
+
+
+def test_from_settings_builds_replicas(tmp_path: Path) -> None:
+    database = Database.from_settings(
+        Settings(
+            database_read_urls=[
+                f"sqlite:///{tmp_path / 'a.db'}",
+                f"sqlite:///{tmp_path / 'b.db'}",
+            ],
+            database_replica_failure_threshold=3,
+        )
+    )
+    assert database.replicas is not None
+    assert len(database.replicas.pools) == 2
+    assert database.replicas.failure_threshold == 3
+    assert Database.from_settings(Settings()).replicas is None
+
+
+async def pinned_app(scope: Scope, receive: Receive, send: Send) -> None:
+    body = b"primary" if primary_pinned() else b"replica"
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": body})
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_cookie_pins_following_reads() -> None:
+    app = ReadYourWritesMiddleware(pinned_app, window=5.0)
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        assert (await client.get("/")).text == "replica"
+
+        response = await client.post("/")
+        assert response.text == "primary"
+        assert PRIMARY_COOKIE in response.cookies
+
+        assert (await client.get("/")).text == "primary"
+
+        client.cookies.set(PRIMARY_COOKIE, "0")
+        assert (await client.get("/")).text == "replica"
+
+
+@pytest.mark.asyncio
+async def test_cached_replica_reads_are_not_served_to_pinned_clients(
+    tmp_path: Path,
+) -> None:
+    await seeded_file(tmp_path / "primary.db", "seeded")
+    # The replica never sees later writes: as lagging as one can be.
+    await seeded_file(tmp_path / "replica.db", "seeded")
+    app = create_app(
+        Settings(
+            database_url=f"sqlite:///{tmp_path / 'primary.db'}",
+            database_read_urls=[f"sqlite:///{tmp_path / 'replica.db'}"],
+        )
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://test") as writer,
+        httpx.AsyncClient(transport=transport, base_url="http://test") as reader,
+    ):
+        response = await writer.post("/api/v1/items/", json={"name": "new"})
+        assert PRIMARY_COOKIE in response.cookies
+
+        unpinned = await reader.get("/api/v1/items/")
+        assert [item["name"] for item in unpinned.json()] == ["seeded"]
+
+        pinned = await writer.get("/api/v1/items/")
+        assert [item["name"] for item in pinned.json()] == ["seeded", "new"]
+
+
+@pytest.mark.asyncio
+async def test_replica_reads_are_cached_no_longer_than_the_window(
+    tmp_path: Path,
+) -> None:
+    await seeded_file(tmp_path / "primary.db", "seeded")
+    await seeded_file(tmp_path / "replica.db", "seeded")
+    app = create_app(
+        Settings(
+            database_url=f"sqlite:///{tmp_path / 'primary.db'}",
+            database_read_urls=[f"sqlite:///{tmp_path / 'replica.db'}"],
+            database_read_your_writes_window=0.2,
+        )
+    )
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://test") as writer,
+        httpx.AsyncClient(transport=transport, base_url="http://test") as reader,
+    ):
+        await writer.post("/api/v1/items/", json={"name": "new"})
+        # Read while the replica lags: cached under the post-write version.
+        stale = await reader.get("/api/v1/items/")
+        assert [item["name"] for item in stale.json()] == ["seeded"]
+
+        replica = app.state.container.database.replicas.pools[0]
+        async with replica.acquire() as connection:
+            await connection.execute("INSERT INTO items (name) VALUES ('new')")
+        await asyncio.sleep(0.3)
+
+        fresh = await reader.get("/api/v1/items/")
+        assert [item["name"] for item in fresh.json()] == ["seeded", "new"]
+
+
+@pytest.mark.asyncio
+async def test_startup_survives_a_replica_without_schema(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    await seeded_file(tmp_path / "primary.db", "seeded")
+    await seeded_file(tmp_path / "replica.db", "from replica")
+    empty = tmp_path / "empty.db"
+    app = create_app(
+        Settings(
+            database_url=f"sqlite:///{tmp_path / 'primary.db'}",
+            database_read_urls=[
+                f"sqlite:///{empty}",
+                f"sqlite:///{tmp_path / 'replica.db'}",
+            ],
+        )
+    )
+    async with app.router.lifespan_context(app):
+        container = app.state.container
+        assert container.ready
+        assert "Warm-up failed on read replica 0" in caplog.text
+        assert "read replica 1" not in caplog.text
+
+        _, replica_pool = container.database.replicas.pools
+        with use_replica(replica_pool):
+            page = await container.items.list_items()
+        assert [item.name for item in page.items] == ["from replica"]
@@ -0,0 +1,100 @@
+"""Password hashing and token tests."""
+
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from project_name.core.security import (
+    InvalidTokenError,
+    PasswordHasher,
+    PasswordHashingPool,
+    TokenService,
+)
+
+
+SECRET = "test-secret-test-secret-test-secret"
+
+
+def test_password_hasher_round_trip() -> None:
+    hasher = PasswordHasher(iterations=1_000)
+    hashed = hasher.hash("password123")
+
+    assert hashed.startswith("pbkdf2_sha256$1000$")
+    assert hashed != hasher.hash("password123")
+    assert hasher.verify("password123", hashed)
+    assert not hasher.verify("password124", hashed)
+    # Hashes keep their own iteration count.
+    assert PasswordHasher(iterations=2_000).verify("password123", hashed)
+
+
+@pytest.mark.parametrize("hashed", ["", "md5$1$a$b", "pbkdf2_sha256$x$a$b"])
+def test_password_hasher_rejects_malformed_hashes(hashed: str) -> None:
+    assert not PasswordHasher(iterations=1_000).verify("password123", hashed)
+
+
+def test_token_service_caches_verified_tokens() -> None:
+    tokens = TokenService(SECRET)
+    token = tokens.issue("1", email="a@example.com")
+
+    first = tokens.verify(token)
+    second = tokens.verify(token)
+
+    assert first == second
+    assert first["sub"] == "1"
+    assert first["email"] == "a@example.com"
+    assert (tokens.hits, tokens.misses) == (1, 1)
+    # Callers get their own copy of the cached claims.
+    second["sub"] = "2"
+    assert tokens.verify(token)["sub"] == "1"
+
+
+def test_token_service_cache_expires_with_token() -> None:
+    now = [time.time()]
+    tokens = TokenService(
+        SECRET, expires_in=timedelta(seconds=60), clock=lambda: now[0]
+    )
+    token = tokens.issue("1")
+    tokens.verify(token)
+    tokens.verify(token)
+    assert (tokens.hits, tokens.misses) == (1, 1)
+
+    # Past ``exp`` the cached entry is dropped and the token verified again.
+    now[0] += 61
+    tokens.verify(token)
+    assert (tokens.hits, tokens.misses) == (1, 2)
+
+
+def test_token_service_cache_is_bounded() -> None:
+    tokens = TokenService(SECRET, cache_size=1)
+    first, second = tokens.issue("1"), tokens.issue("2")
+    tokens.verify(first)
+    tokens.verify(second)
+    tokens.verify(first)
+    assert (tokens.hits, tokens.misses) == (0, 3)
+
+
+def test_token_service_without_cache() -> None:
+    tokens = TokenService(SECRET, cache_size=0)
+    token = tokens.issue("1")
+    tokens.verify(token)
+    tokens.verify(token)
+    assert (tokens.hits, tokens.misses) == (0, 2)
+
+
+@pytest.mark.parametrize("token", ["", "a.b.c"])
+def test_token_service_rejects_malformed_tokens(token: str) -> None:
+    with pytest.raises(InvalidTokenError):
+        TokenService(SECRET).verify(token)
+
+
+async def test_password_hashing_pool() -> None:
+    pool = PasswordHashingPool(PasswordHasher(iterations=1_000), max_workers=1)
+    hashed = await pool.hash("password123")
+
+    assert await pool.verify("password123", hashed)
+    assert not await pool.verify("password124", hashed)
+    assert pool.stats() == {"workers": 1, "queued": 0, "active": 0, "completed": 3}
+    pool.shutdown()
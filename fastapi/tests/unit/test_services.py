@@ -2,43 +2,167 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import TYPE_CHECKING
+
 import pytest
 
-from project_name.schemas.item import ItemCreate
+from project_name.core.pagination import decode_cursor
+from project_name.core.security import PasswordHasher, PasswordHashingPool
+from project_name.repositories.item_repository import ItemRepository
+from project_name.repositories.user_repository import UserRepository
+from project_name.schemas.item import ItemCreate, ItemUpdate
 from project_name.schemas.user import UserCreate, UserUpdate
 from project_name.services.item_service import ItemService
-from project_name.services.user_service import UserService
+from project_name.services.user_service import EmailAlreadyRegisteredError, UserService
 
 
-@pytest.mark.asyncio
-async def test_user_service_crud() -> None:
-    service = UserService()
+if TYPE_CHECKING:
+    from project_name.core.database import Database
+
 
-    users = await service.get_users()
-    assert users
+def fast_passwords() -> PasswordHashingPool:
+    return PasswordHashingPool(PasswordHasher(iterations=1_000))
+
+
+@pytest.mark.asyncio
+async def test_user_service_crud(database: Database) -> None:
+    service = UserService(UserRepository(database), passwords=fast_passwords())
 
     created = await service.create_user(
         UserCreate(email="a@example.com", name="A", password="password123")
     )
     assert created.email == "a@example.com"
 
-    existing = await service.get_user(1)
+    page = await service.get_users()
+    assert [user.id for user in page.items] == [created.id]
+    assert page.next_cursor is None
+
+    existing = await service.get_user(created.id)
     assert existing is not None
 
-    updated = await service.update_user(1, UserUpdate(name="B"))
+    updated = await service.update_user(created.id, UserUpdate(name="B"))
     assert updated is not None
     assert updated.name == "B"
+    assert updated.email == "a@example.com"
 
-    deleted = await service.delete_user(1)
+    deleted = await service.delete_user(created.id)
     assert deleted is True
+    assert await service.get_user(created.id) is None
+    assert await service.update_user(created.id, UserUpdate(name="C")) is None
+
+
+@pytest.mark.asyncio
+async def test_user_service_rejects_duplicate_email(database: Database) -> None:
+    service = UserService(UserRepository(database), passwords=fast_passwords())
+    user_in = UserCreate(email="a@example.com", name="A", password="password123")
+    await service.create_user(user_in)
+
+    with pytest.raises(EmailAlreadyRegisteredError):
+        await service.create_user(user_in)
+
+
+@pytest.mark.asyncio
+async def test_user_service_authenticate(database: Database) -> None:
+    service = UserService(UserRepository(database), passwords=fast_passwords())
+    user_in = UserCreate(email="a@example.com", name="A", password="password123")
+    created = await service.create_user(user_in)
+
+    assert await service.authenticate("a@example.com", "password123") == created
+    assert await service.authenticate("a@example.com", "wrong-password") is None
+    assert await service.authenticate("nobody@example.com", "password123") is None
+
+    await service.update_user(created.id, UserUpdate(password="new-password"))
+    assert await service.authenticate("a@example.com", "password123") is None
+    assert await service.authenticate("a@example.com", "new-password") is not None
+
+    await service.update_user(created.id, UserUpdate(is_active=False))
+    assert await service.authenticate("a@example.com", "new-password") is None
 
 
 @pytest.mark.asyncio
-async def test_item_service_crud() -> None:
-    service = ItemService()
+async def test_signup_burst_keeps_event_loop_responsive(database: Database) -> None:
+    # ~0.1s per hash: inline, each signup would stall the loop for that long.
+    passwords = PasswordHashingPool(PasswordHasher(iterations=200_000), max_workers=2)
+    service = UserService(UserRepository(database), passwords=passwords)
+    loop = asyncio.get_running_loop()
+    lags: list[float] = []
+    queued: list[int] = []
+    done = asyncio.Event()
 
-    items = await service.list_items()
-    assert items
+    async def ticker() -> None:
+        while not done.is_set():
+            start = loop.time()
+            await asyncio.sleep(0.005)
+            lags.append(loop.time() - start - 0.005)
+            queued.append(passwords.queued)
+
+    async def signup_burst() -> None:
+        await asyncio.gather(
+            *(
+                service.create_user(
+                    UserCreate(
+                        email=f"u{index}@example.com",
+                        name="U",
+                        password="password123",
+                    )
+                )
+                for index in range(6)
+            )
+        )
+        done.set()
+
+    await asyncio.gather(ticker(), signup_burst())
+    passwords.shutdown()
+
+    assert max(queued) > 0
+    assert passwords.stats() == {
+        "workers": 2,
+        "queued": 0,
+        "active": 0,
+        "completed": 6,
+    }
+    assert max(lags) < 0.05
+
+
+@pytest.mark.asyncio
+async def test_item_service_crud(database: Database) -> None:
+    service = ItemService(ItemRepository(database))
 
     created = await service.create_item(ItemCreate(name="Item", description=None))
     assert created.name == "Item"
+
+    page = await service.list_items()
+    assert page.items == [created]
+
+    updated = await service.update_item(created.id, ItemUpdate(description="Desc"))
+    assert updated is not None
+    assert updated.description == "Desc"
+    assert updated.name == "Item"
+
+    assert await service.delete_item(created.id) is True
+    assert await service.get_item(created.id) is None
+
+
+@pytest.mark.asyncio
+async def test_item_service_keyset_pagination(database: Database) -> None:
+    service = ItemService(ItemRepository(database))
+    created = [
+        await service.create_item(ItemCreate(name=f"Item {index}"))
+        for index in range(5)
+    ]
+
+    first = await service.list_items(limit=2)
+    assert first.items == created[:2]
+    assert first.next_cursor is not None
+    assert decode_cursor(first.next_cursor) == created[1].id
+
+    second = await service.list_items(limit=2, after=created[1].id)
+    assert second.items == created[2:4]
+
+    last = await service.list_items(limit=2, after=created[3].id)
+    assert last.items == created[4:]
+    assert last.next_cursor is None
+
+    legacy = await service.list_items(skip=3, limit=10)
+    assert legacy.items == created[3:]
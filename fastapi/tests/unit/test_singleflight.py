@@ -0,0 +1,122 @@
+"""Single-flight coalescing tests."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from project_name.core.singleflight import SingleFlight, coalesce, no_coalescing
+from project_name.repositories.item_repository import ItemRepository
+from project_name.schemas.item import ItemCreate
+from project_name.services.item_service import ItemService
+
+
+if TYPE_CHECKING:
+    from project_name.core.database import Database
+
+
+class SlowReader:
+    def __init__(self, flights: SingleFlight | None) -> None:
+        self.flights = flights
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    @coalesce("records")
+    async def get(self, record_id: int) -> dict[str, int]:
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        return {"id": record_id, "call": call}
+
+    @coalesce("records", key=lambda record_id, **_: record_id)
+    async def get_by_id(self, record_id: int, *, trace: str = "") -> int:
+        self.calls += 1
+        await self.release.wait()
+        return record_id
+
+
+async def settle() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_flight() -> None:
+    flights = SingleFlight()
+    reader = SlowReader(flights)
+    calls = [asyncio.ensure_future(reader.get(1)) for _ in range(5)]
+    other = asyncio.ensure_future(reader.get(2))
+    await settle()
+    assert flights.in_flight == 2
+    reader.release.set()
+
+    results = await asyncio.gather(*calls)
+    assert results == [{"id": 1, "call": 1}] * 5
+    assert (await other)["id"] == 2
+    assert flights.stats() == {"executed": 2, "coalesced": 4, "in_flight": 0}
+
+    # Nothing is kept afterwards: the next call queries again.
+    assert (await reader.get(1))["call"] == 3
+
+
+@pytest.mark.asyncio
+async def test_key_function_and_opt_out() -> None:
+    flights = SingleFlight()
+    reader = SlowReader(flights)
+    shared = [asyncio.ensure_future(reader.get_by_id(1, trace=trace)) for trace in "ab"]
+    with no_coalescing():
+        alone = asyncio.ensure_future(reader.get_by_id(1))
+    await settle()
+    reader.release.set()
+    assert await asyncio.gather(*shared, alone) == [1, 1, 1]
+    assert reader.calls == 2
+    assert flights.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller_and_cancel_is_isolated() -> None:
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing() -> None:
+        await release.wait()
+        raise LookupError
+
+    first = asyncio.ensure_future(flights.do(("x",), failing))
+    second = asyncio.ensure_future(flights.do(("x",), failing))
+    await settle()
+    first.cancel()
+    release.set()
+    with pytest.raises(LookupError):
+        await second
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_forget_detaches_running_calls() -> None:
+    flights = SingleFlight()
+    reader = SlowReader(flights)
+    before = asyncio.ensure_future(reader.get(1))
+    await settle()
+    flights.forget("records")
+    after = asyncio.ensure_future(reader.get(1))
+    await settle()
+    reader.release.set()
+    assert [r["call"] for r in await asyncio.gather(before, after)] == [1, 2]
+    assert flights.executed == 2
+
+
+@pytest.mark.asyncio
+async def test_service_reads_are_coalesced(database: Database) -> None:
+    flights = SingleFlight()
+    service = ItemService(ItemRepository(database), flights=flights)
+    created = await service.create_item(ItemCreate(name="Hot"))
+
+    items = await asyncio.gather(*(service.get_item(created.id) for _ in range(10)))
+    assert {item.name for item in items if item is not None} == {"Hot"}
+    pages = await asyncio.gather(service.list_items(limit=5), service.list_items(0, 5))
+    assert pages[0] == pages[1]
+    assert flights.executed == 2
+    assert flights.coalesced == 10